@@ -203,14 +203,10 @@ class OrderAdmin(admin.ModelAdmin):
 
     def _invoice(self, o):
         output = []
-        # MAL: PDF generation is slower, so default to HTML
-        if 1 or dsettings.DEBUG:
-            vname = 'assopy-invoice-html'
-        else:
-            vname = 'assopy-invoice-pdf'
+        # the PDFs are rendered in background when the invoices are created
         for i in o.invoices.all():
             url = reverse(
-                vname, kwargs={
+                'assopy-invoice-pdf', kwargs={
                     'order_code': quote(o.code),
                     'code': quote(i.code),
                 }
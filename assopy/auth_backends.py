@@ -4,6 +4,7 @@ from django.contrib.auth.models import User
 
 from assopy.models import AssopyUser, user_created
 from assopy import settings
+from assopy.utils import normalize_email
 
 import logging
 
@@ -65,8 +66,10 @@ class EmailBackend(AssopyBackend):
     def authenticate(self, request, email=None, password=None, username=None):
         try:
             email = email or username
+            if not email:
+                return None
             user = User.objects.select_related('assopy_user').get(
-                email__iexact=email,
+                normalized_email__email=normalize_email(email),
                 is_active=True
             )
             if user.check_password(password):
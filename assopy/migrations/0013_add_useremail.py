@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_user_emails(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    UserEmail = apps.get_model('assopy', 'UserEmail')
+    UserEmail.objects.bulk_create(
+        (
+            UserEmail(user_id=uid, email=(email or '').strip().lower())
+            for uid, email in User.objects.values_list('id', 'email').iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('assopy', '0012_add_type_to_order'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserEmail',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='normalized_email', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('email', models.CharField(db_index=True, max_length=254)),
+            ],
+        ),
+        migrations.RunPython(populate_user_emails, migrations.RunPython.noop),
+    ]
@@ -16,14 +16,15 @@ from django.contrib.admin.utils import quote
 from django.core.exceptions import ValidationError
 from django.core.urlresolvers import reverse
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_save
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 from model_utils import Choices
 
 from assopy import settings
-from assopy.utils import send_email
+from assopy.utils import normalize_email, send_email
 from conference.currencies import normalize_price
 from conference.gravatar import gravatar
 from conference.models import Ticket, Fare
@@ -345,6 +346,36 @@ class UserIdentity(models.Model):
     objects = UserIdentityManager()
 
 
+class UserEmail(models.Model):
+    """
+    The email of a user, normalized (see assopy.utils.normalize_email) and
+    indexed: email__iexact cannot use an index. Kept in sync when the user is
+    saved.
+    """
+    user = models.OneToOneField(
+        get_user_model(),
+        primary_key=True,
+        related_name='normalized_email',
+        on_delete=models.CASCADE)
+    email = models.CharField(max_length=254, db_index=True)
+
+    def __str__(self):
+        return self.email
+
+
+def on_user_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and 'email' not in update_fields:
+        # e.g. the last_login updated at every login
+        return
+    UserEmail.objects.update_or_create(
+        user=instance,
+        defaults={'email': normalize_email(instance.email or '')})
+
+post_save.connect(on_user_saved, sender=get_user_model())
+
+
 class Coupon(models.Model):
     conference = models.ForeignKey('conference.Conference', on_delete=models.CASCADE)
     code = models.CharField(max_length=10)
@@ -488,6 +519,9 @@ class OrderQuerySet(models.QuerySet):
         return t if t is not None else 0
 
     # TODO: deprecate this .create in favor of conference/orders:create_order
+    # The order code is reserved in the transaction that saves the order,
+    # see conference.sequences.
+    @transaction.atomic
     def create(self, user, payment, items, billing_notes='', coupons=None, country=None, address=None, vat_number='', cf_code=''):
 
         # FIXME/TODO(artcz)(2018-08-20)
@@ -0,0 +1,54 @@
+from pytest import mark, raises
+
+from django.contrib.auth.models import User
+
+from assopy import utils
+from assopy.models import UserEmail
+from assopy.stripe.tests.factories import UserFactory
+
+
+@mark.django_db
+def test_normalized_email_follows_the_user():
+    user = UserFactory(email='Joe.Doe@Example.com')
+    assert UserEmail.objects.get(user=user).email == 'joe.doe@example.com'
+
+    user.email = ' Joe@Example.ORG'
+    user.save()
+    assert UserEmail.objects.get(user=user).email == 'joe@example.org'
+
+
+@mark.django_db
+def test_normalized_email_is_left_alone_by_the_logins(django_assert_num_queries):
+    user = UserFactory(email='joe@example.com')
+    with django_assert_num_queries(1):
+        user.save(update_fields=['last_login'])
+
+    user.email = 'joe@example.org'
+    user.save(update_fields=['email'])
+    assert UserEmail.objects.get(user=user).email == 'joe@example.org'
+
+
+@mark.django_db
+def test_get_user_account_from_email_ignores_the_case():
+    user = UserFactory(email='Joe.Doe@Example.com')
+
+    assert utils.get_user_account_from_email('JOE.DOE@example.COM ') == user
+    assert utils.get_user_account_from_email('jane@example.com', default=None) is None
+    with raises(User.DoesNotExist):
+        utils.get_user_account_from_email('jane@example.com')
+
+
+@mark.django_db
+def test_get_user_ids_from_emails(django_assert_num_queries):
+    joe = UserFactory(email='joe@example.com')
+    UserFactory(email='twin@example.com')
+    UserFactory(email='TWIN@example.com')
+    UserFactory(email='inactive@example.com', is_active=False)
+
+    emails = ['Joe@Example.com', 'joe@example.com', 'twin@example.com',
+              'inactive@example.com', 'missing@example.com', '']
+    with django_assert_num_queries(1):
+        uids = utils.get_user_ids_from_emails(emails)
+
+    assert uids == {'Joe@Example.com': joe.id, 'joe@example.com': joe.id}
+    assert utils.get_user_ids_from_emails([]) == {}
@@ -5,6 +5,12 @@ from django.contrib import auth
 
 from assopy import settings
 
+def normalize_email(email):
+    """ Returns the email address in the form stored in UserEmail; two
+        addresses differing only in case are the same address.
+    """
+    return email.strip().lower()
+
 def get_user_account_from_email(email, default='raise', active_only=True):
 
     """ Return the user record for the user with the given email
@@ -26,8 +32,9 @@ def get_user_account_from_email(email, default='raise', active_only=True):
     """
     email = email.strip()
     try:
-        return auth.models.User.objects.get(email__iexact=email,
-                                            is_active=active_only)
+        return auth.models.User.objects.get(
+            normalized_email__email=normalize_email(email),
+            is_active=active_only)
     except auth.models.User.DoesNotExist:
         # User does not exist
         if default == 'raise':
@@ -40,6 +47,40 @@ def get_user_account_from_email(email, default='raise', active_only=True):
         raise auth.models.User.MultipleObjectsReturned(
             'Found multiple records for user with email %r' % email)
 
+def get_user_ids_from_emails(emails, active_only=True):
+
+    """ Batch version of get_user_account_from_email, with a query
+        every 500 addresses: returns a dict {email: user id} for the
+        given email addresses.
+
+        The addresses without a user record, or with more than one, are
+        missing from the result.
+
+    """
+    lookup = {}
+    for email in emails:
+        if email:
+            lookup.setdefault(normalize_email(email), []).append(email)
+    if not lookup:
+        return {}
+
+    found = {}
+    normalized = list(lookup.keys())
+    # sqlite limits the number of parameters of a query
+    for ix in range(0, len(normalized), 500):
+        for uid, email in auth.models.User.objects\
+                .filter(normalized_email__email__in=normalized[ix:ix + 500],
+                        is_active=active_only)\
+                .values_list('id', 'normalized_email__email'):
+            found.setdefault(email, []).append(uid)
+
+    output = {}
+    for email, uids in found.items():
+        if len(uids) == 1:
+            for original in lookup[email]:
+                output[original] = uids[0]
+    return output
+
 def send_email(force=False, *args, **kwargs):
     if force is False and not settings.SEND_EMAIL_TO:
         return
@@ -18,7 +18,7 @@ from assopy import forms as aforms
 from assopy import models, settings
 from common.decorators import render_to_json, render_to_template
 from common.http import PdfResponse
-from conference.invoicing import VAT_NOT_AVAILABLE_PLACEHOLDER
+from conference.invoicing import VAT_NOT_AVAILABLE_PLACEHOLDER, render_invoice_pdf
 
 
 log = logging.getLogger('assopy.views')
@@ -215,8 +215,17 @@ def invoice(request, order_code, code, mode='html'):
     if mode == 'html':
         return http.HttpResponse(invoice.html)
 
-    return PdfResponse(filename=invoice.get_invoice_filename(),
-                       content=invoice.html)
+    # usually already rendered in background when the invoice was created
+    try:
+        path = render_invoice_pdf(invoice.html)
+    except OSError:
+        log.exception('Cannot store the PDF of invoice %s', invoice.code)
+        return PdfResponse(filename=invoice.get_invoice_filename(),
+                           content=invoice.html)
+
+    response = http.FileResponse(open(path, 'rb'), content_type='application/pdf')
+    response['Content-Disposition'] = 'filename="%s"' % invoice.get_invoice_filename()
+    return response
 
 
 @login_required
@@ -16,4 +16,8 @@ class PdfResponse(HttpResponse):
         # return response
 
     def convert_to_pdf(self, content):
-        return HTML(string=content).write_pdf()
+        return html_to_pdf(content)
+
+
+def html_to_pdf(content):
+    return HTML(string=content).write_pdf()
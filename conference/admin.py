@@ -18,7 +18,9 @@ from django.template.response import TemplateResponse
 import common.decorators
 from common.jsonify import json_dumps
 from conference import dataaccess
+from conference import mailing
 from conference import models
+from conference import ranking
 from conference import settings
 from conference import utils
 
@@ -34,7 +36,7 @@ log = logging.getLogger('conference')
 
 
 class ConferenceAdmin(admin.ModelAdmin):
-    list_display = ('code', 'name', '_schedule_view', '_attendee_stats')
+    list_display = ('code', 'name', '_schedule_view', '_attendee_stats', '_talks_ranking')
 
     def _schedule_view(self, o):
         u = urlresolvers.reverse('admin:conference-conference-schedule', args=(o.code,))
@@ -46,6 +48,11 @@ class ConferenceAdmin(admin.ModelAdmin):
         return '<a href="%s">Attendee Stats</a>' % u
     _attendee_stats.allow_tags = True
 
+    def _talks_ranking(self, o):
+        u = urlresolvers.reverse('admin:conference-conference-ranking', args=(o.code,))
+        return '<a href="%s">Talk Ranking</a>' % u
+    _talks_ranking.allow_tags = True
+
     def get_urls(self):
         admin_view = self.admin_site.admin_view
         urls = [
@@ -65,6 +72,13 @@ class ConferenceAdmin(admin.ModelAdmin):
             url(r'^(?P<cid>[\w-]+)/stats/details.csv$',
                 admin_view(self.stats_details_csv),
                 name='conference-ticket-stats-details-csv'),
+            url(r'^(?P<cid>[\w-]+)/stats/mailings/(?P<jid>\d+)/$',
+                admin_view(self.mail_job),
+                name='conference-ticket-stats-mail-job'),
+
+            url(r'^(?P<cid>[\w-]+)/ranking/$',
+                admin_view(self.talks_ranking),
+                name='conference-conference-ranking'),
         ]
         return urls + super(ConferenceAdmin, self).get_urls()
 
@@ -167,6 +181,23 @@ class ConferenceAdmin(admin.ModelAdmin):
             },
         )
 
+    def talks_ranking(self, request, cid):
+        conf = get_object_or_404(models.Conference, code=cid)
+        if request.method == 'POST':
+            # votes changed outside the voting pages are not tracked
+            ranking.build_preferences(conf.code)
+            return http.HttpResponseRedirect(request.path)
+
+        return TemplateResponse(
+            request,
+            'admin/conference/conference/talks_ranking.html',
+            {
+                'conference': conf,
+                'talks': ranking.live_ranking(conf.code),
+                'votes': models.VotoTalk.objects.filter(talk__conference=conf.code).count(),
+            },
+        )
+
     def stats_details(self, request, cid):
         sid, rowid = request.GET['code'].split('.')
         stat = self.single_stat(cid, sid, rowid)
@@ -188,10 +219,13 @@ class ConferenceAdmin(admin.ModelAdmin):
                 else:
                     if form.cleaned_data['send_email']:
                         from django.contrib import messages
-                        c = form.send_emails(uids, request.user.email)
-                        messages.add_message(request, messages.INFO, '{0} emails sent'.format(c))
-                        form.save_email()
-                        form = AdminSendMailForm()
+                        job = form.send_emails(
+                            uids, request.user.email, created_by=request.user, conference=cid)
+                        messages.add_message(
+                            request, messages.INFO,
+                            '{0} emails queued'.format(job.recipients.count()))
+                        return http.HttpResponseRedirect(urlresolvers.reverse(
+                            'admin:conference-ticket-stats-mail-job', args=(cid, job.id)))
         else:
             form = AdminSendMailForm()
         return TemplateResponse(
@@ -203,7 +237,33 @@ class ConferenceAdmin(admin.ModelAdmin):
                 'stat_code': '%s.%s' % (sid, rowid),
                 'form': form,
                 'preview': preview,
-                'email_log': settings.ADMIN_TICKETS_STATS_EMAIL_LOG,
+                'mail_jobs': models.MailJob.objects.filter(conference=cid)[:20],
+            },
+        )
+
+    def mail_job(self, request, cid, jid):
+        job = get_object_or_404(models.MailJob, conference=cid, id=jid)
+        if request.method == 'POST':
+            # gives another chance to the failed messages
+            job.recipients\
+                .filter(status=models.MailJobRecipient.STATUS.FAILED)\
+                .update(status=models.MailJobRecipient.STATUS.PENDING, attempts=0)
+            models.MailJob.objects\
+                .filter(id=job.id, status=models.MailJob.STATUS.DONE)\
+                .update(status=models.MailJob.STATUS.PENDING)
+            mailing.run_job_in_background(job.id)
+            return http.HttpResponseRedirect(request.path)
+
+        return TemplateResponse(
+            request,
+            'admin/conference/conference/mail_job.html',
+            {
+                'conference': cid,
+                'job': job,
+                'progress': job.progress(),
+                'failures': job.recipients\
+                    .filter(status=models.MailJobRecipient.STATUS.FAILED)\
+                    .select_related('user'),
             },
         )
 
@@ -829,7 +889,12 @@ class ScheduleAdmin(admin.ModelAdmin):
 
     def expected_attendance(self, request):
         allevents = defaultdict(dict)
-        for e, info in models.Schedule.objects.expected_attendance(settings.CONFERENCE).items():
+        data = models.Schedule.objects.expected_attendance(settings.CONFERENCE)
+        events = models.Event.objects\
+            .select_related('schedule', 'talk')\
+            .in_bulk(list(data))
+        for eid, info in data.items():
+            e = events[eid]
             allevents[e.schedule][e] = info
         data = {}
         for s, events in allevents.items():
@@ -0,0 +1,142 @@
+"""
+Presence scores of the events, used to forecast their attendance.
+
+Every user interested in an event (interest > 0) or with a booking for it
+adds to its score; since nobody can attend two events at the same time, a
+user interested in several overlapping events adds to each of them only
+`1 / number of the events of the user overlapping it`.
+
+The share of every user is stored in EventAttendanceShare and their sum in
+EventAttendance. When an interest or a booking changes only the shares of
+its user in that day are recomputed, and only the ones of the events
+overlapping the changed one end up being written.
+"""
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+
+from conference import signals
+from conference.models import (
+    Event,
+    EventAttendance,
+    EventAttendanceShare,
+    EventBooking,
+    EventInterest,
+)
+
+
+def attended_events(schedules, user=None):
+    """
+    Returns, for each user, the set of ids of the events of `schedules` they
+    are going to attend.
+    """
+    interests = EventInterest.objects\
+        .filter(event__schedule__in=schedules, interest__gt=0)
+    bookings = EventBooking.objects\
+        .filter(event__schedule__in=schedules)
+    if user is not None:
+        interests = interests.filter(user=user)
+        bookings = bookings.filter(user=user)
+
+    output = defaultdict(set)
+    for qs in (interests, bookings):
+        for uid, eid in qs.values_list('user', 'event'):
+            output[uid].add(eid)
+    return output
+
+
+def shares(group_of, events, attended):
+    """
+    Returns the shares ({event id: share}) of a user attending the `attended`
+    events; `group_of` is an Event.objects.events_grouper.
+    """
+    output = {}
+    for e in events:
+        if e.id in attended:
+            overlapping = sum(
+                1 for other in group_of(e)
+                if other.id != e.id and other.id in attended)
+            output[e.id] = 1.0 / (1 + overlapping)
+    return output
+
+
+def _day(schedule):
+    events = list(Event.objects\
+        .filter(schedule=schedule)\
+        .select_related('schedule', 'talk'))
+    return events, Event.objects.events_grouper(events)
+
+
+@transaction.atomic
+def update_user_attendance(user, schedule):
+    """
+    Recomputes the shares of the user in the events of the schedule (a
+    single day), updating the scores of the events whose share changed.
+    """
+    # the scores are changed by the difference between the new shares and
+    # the stored ones: two updates of the same user must not read the same
+    # shares, so they are serialized locking the row of the user (the
+    # shares could still be missing).
+    list(get_user_model().objects\
+        .select_for_update()\
+        .filter(pk=user)\
+        .values_list('pk', flat=True))
+
+    events, group_of = _day(schedule)
+    attended = attended_events([schedule], user=user).get(user, set())
+    new = shares(group_of, events, attended)
+    old = dict(EventAttendanceShare.objects\
+        .filter(user=user, event__schedule=schedule)\
+        .values_list('event', 'score'))
+
+    changed = False
+    for eid in set(old) | set(new):
+        delta = new.get(eid, 0) - old.get(eid, 0)
+        if not delta:
+            continue
+        if eid in new:
+            EventAttendanceShare.objects.update_or_create(
+                event_id=eid, user_id=user, defaults={'score': new[eid]})
+        else:
+            EventAttendanceShare.objects.filter(event=eid, user=user).delete()
+        updated = EventAttendance.objects\
+            .filter(event=eid)\
+            .update(score=F('score') + delta)
+        if not updated:
+            EventAttendance.objects.create(event_id=eid, score=delta)
+        changed = True
+
+    if changed:
+        signals.attendance_changed.send(sender=Event, schedule_id=schedule)
+
+
+@transaction.atomic
+def rebuild_attendance(schedules):
+    """
+    Recomputes from scratch the scores of the events of `schedules`; needed
+    when the events themselves change.
+    """
+    schedules = list(schedules)
+    EventAttendanceShare.objects.filter(event__schedule__in=schedules).delete()
+    EventAttendance.objects.filter(event__schedule__in=schedules).delete()
+
+    attended = attended_events(schedules)
+    rows = []
+    scores = defaultdict(lambda: 0.0)
+    for schedule in schedules:
+        events, group_of = _day(schedule)
+        by_id = {e.id: e for e in events}
+        for uid, user_events in attended.items():
+            mine = [by_id[eid] for eid in user_events if eid in by_id]
+            for eid, share in shares(group_of, mine, user_events).items():
+                rows.append(EventAttendanceShare(event_id=eid, user_id=uid, score=share))
+                scores[eid] += share
+
+    EventAttendanceShare.objects.bulk_create(rows)
+    EventAttendance.objects.bulk_create(
+        EventAttendance(event_id=eid, score=score) for eid, score in scores.items())
+
+    for schedule in schedules:
+        signals.attendance_changed.send(sender=Event, schedule_id=schedule)
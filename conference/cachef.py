@@ -1,9 +1,14 @@
 
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
 from django.db.models.signals import pre_delete, post_save
 from django.dispatch import Signal
+from collections import Counter, OrderedDict
 import functools
 import hashlib
+import pickle
+import threading
+import time
 
 try:
     from inspect import getcallargs
@@ -105,10 +110,69 @@ WEEK = 7 * 24 * 60 * 60
 
 cache_invalidated = Signal(providing_args=['keys'])
 
+
+def local_tier_enabled():
+    """
+    The in-process tier is disabled whenever the shared cache is, so that
+    settings that turn off caching (dev, tests) turn it off completely.
+    """
+    return not isinstance(caches['default'], DummyCache)
+
+
+class LocalCache(object):
+    """
+    Bounded, per-process LRU cache with a per-entry TTL.
+
+    Values are stored pickled, exactly like the django locmem backend does, so
+    that callers mutating the returned data cannot corrupt the cached copy.
+
+    This tier is kept coherent only with the invalidations happening in the
+    current process; other processes rely on `timeout` being short.
+    """
+    def __init__(self, size, timeout):
+        self.size = size
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expire, value = self._data[key]
+            except KeyError:
+                return default
+            if expire < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return pickle.loads(value)
+
+    def set(self, key, value):
+        value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for k in keys:
+                self._data.pop(k, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 class CacheFunction(object):
     CACHE_MISS = object()
 
-    def __init__(self, prefix='', timeout=WEEK, fhash=None, fkey=None):
+    def __init__(self, prefix='', timeout=WEEK, fhash=None, fkey=None,
+                 local_size=0, local_timeout=60, lock_timeout=30, lock_wait=5):
         self.prefix = prefix
         self.timeout = timeout
         if fhash is None:
@@ -117,6 +181,14 @@ class CacheFunction(object):
         if fkey is None:
             fkey = self.generate_key
         self.fkey = fkey
+        # size (number of entries) and timeout (seconds) of the in-process
+        # tier; a size of 0 disables it.
+        self.local_size = local_size
+        self.local_timeout = local_timeout
+        # single flight: lifetime (seconds) of the lock taken to recompute a
+        # missing value, and how long the other readers wait for it.
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
 
     def __call__(self, *args, **kwargs):
         if args:
@@ -126,21 +198,134 @@ class CacheFunction(object):
         else:
             return functools.partial(self._decorator, **kwargs)
 
-    def _decorator(self, func, invalidate=None, key=None, signals=(), models=(), timeout=None):
+    def _decorator(self, func, invalidate=None, key=None, signals=(), models=(), timeout=None,
+                   local_size=None, local_timeout=None, namespace=None,
+                   single_flight=False, serve_stale=False):
         if key is None:
             key = func.__name__
             if invalidate is None:
                 invalidate = (func.__name__,)
         if timeout is None:
             timeout = self.timeout
+        if local_size is None:
+            local_size = self.local_size
+        if local_timeout is None:
+            local_timeout = self.local_timeout
+
+        # serving the previous value only makes sense when someone else is
+        # recomputing the fresh one
+        single_flight = single_flight or serve_stale
+
+        local = LocalCache(local_size, local_timeout) if local_size else None
+        # which tier served each read: 'local_hits', 'shared_hits', 'misses'
+        # and, with serve_stale, 'stale_hits'
+        stats = Counter()
+        # When a namespace is given the invalidator returns namespaces instead
+        # of keys; every key is versioned with the generation of its
+        # namespace, so invalidating means bumping that generation. The local
+        # tier follows an in-process copy of the generations.
+        #
+        # `namespace` can also be a tuple of templates, usually a family and
+        # a part of it (e.g. 'tickets' and 'tickets:%(uid)s'): a key is then
+        # versioned with all their generations and is invalidated by any of
+        # them.
+        if isinstance(namespace, str):
+            namespace = (namespace,)
+        local_generations = Counter()
+
+        def keys_for(args, kwargs):
+            rk = self.fkey(key, func, args, kwargs)
+            if namespace is None:
+                return rk, rk, None
+            ns = tuple(self.fkey(x, func, args, kwargs) for x in namespace)
+            lg = '.'.join(str(local_generations[x]) for x in ns)
+            return rk, '%s@%s' % (rk, lg), ns
+
+        def shared_key(rk, generations):
+            if generations is None:
+                return self.fhash(rk)
+            return self.fhash('%s@%s' % (rk, '.'.join(map(str, generations))))
+
+        def current_generations(namespaces):
+            found = self.generations(set(x for ns in namespaces for x in ns))
+            return dict((ns, [ found[x] for x in ns ]) for ns in namespaces)
+
+        def fill(k, rk, args, kwargs):
+            """
+            Computes and stores a missing value; returns the value and
+            whether it is fresh.
+
+            With single_flight only the process holding the lock computes it,
+            the others wait for the result (for at most lock_wait seconds) or,
+            with serve_stale, get the previous value straight away.
+            """
+            if not single_flight:
+                stats['misses'] += 1
+                data = func(*args, **kwargs)
+                cache.set(k, data, timeout)
+                return data, True
+
+            lock = k + ':lock'
+            # the previous value is stored outside of any generation, so it
+            # survives the invalidation.
+            stale = self.fhash(rk) + ':stale'
+            if cache.add(lock, 1, self.lock_timeout):
+                # the value could have been stored between our read and the
+                # lock acquisition
+                data = cache.get(k, self.CACHE_MISS)
+                if data is not self.CACHE_MISS:
+                    cache.delete(lock)
+                    stats['shared_hits'] += 1
+                    return data, True
+            else:
+                if serve_stale:
+                    data = cache.get(stale, self.CACHE_MISS)
+                    if data is not self.CACHE_MISS:
+                        stats['stale_hits'] += 1
+                        return data, False
+                deadline = time.monotonic() + self.lock_wait
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    data = cache.get(k, self.CACHE_MISS)
+                    if data is not self.CACHE_MISS:
+                        stats['shared_hits'] += 1
+                        return data, True
+                # the lock holder is too slow (or dead), stop waiting
+                lock = None
+
+            stats['misses'] += 1
+            try:
+                data = func(*args, **kwargs)
+                if serve_stale:
+                    cache.set_many({k: data, stale: data}, timeout)
+                else:
+                    cache.set(k, data, timeout)
+            finally:
+                if lock is not None:
+                    cache.delete(lock)
+            return data, True
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            k = self.fhash(self.fkey(key, func, args, kwargs))
+            rk, lk, ns = keys_for(args, kwargs)
+            use_local = local is not None and local_tier_enabled()
+            if use_local:
+                data = local.get(lk, self.CACHE_MISS)
+                if data is not self.CACHE_MISS:
+                    stats['local_hits'] += 1
+                    return data
+            if ns is None:
+                k = shared_key(rk, None)
+            else:
+                k = shared_key(rk, current_generations([ns])[ns])
             data = cache.get(k, self.CACHE_MISS)
+            fresh = True
             if data is self.CACHE_MISS:
-                data = func(*args, **kwargs)
-                cache.set(k, data, timeout)
+                data, fresh = fill(k, rk, args, kwargs)
+            else:
+                stats['shared_hits'] += 1
+            if use_local and fresh:
+                local.set(lk, data)
             return data
 
         if invalidate:
@@ -156,7 +341,14 @@ class CacheFunction(object):
                     if isinstance(keys, str):
                         keys = (keys,)
                     prefixed = [ self.prefix + k for k in keys ]
-                    cache.delete_many(list(map(self.fhash, prefixed)))
+                    if namespace is None:
+                        if local is not None:
+                            local.delete_many(prefixed)
+                        cache.delete_many(list(map(self.fhash, prefixed)))
+                    else:
+                        for ns in prefixed:
+                            local_generations[ns] += 1
+                            self.bump_generation(ns)
                     wrapper.invalidated.send(wrapper, cache_keys=keys)
 
             for s in signals:
@@ -166,8 +358,15 @@ class CacheFunction(object):
                 post_save.connect(iwrapper, sender=m, weak=False)
                 pre_delete.connect(iwrapper, sender=m, weak=False)
 
-        def get_from_cache(fargs):
-            cache_keys = {}
+        def lookup(fargs):
+            """
+            Reads many values with (at most) one get_many; returns the list of
+            values, CACHE_MISS where missing, and the keys of the misses as a
+            dict {shared key: (key, local key, [indexes])}.
+            """
+            use_local = local is not None and local_tier_enabled()
+            output = [ self.CACHE_MISS ] * len(fargs)
+            pending = []
             for ix, farg in enumerate(fargs):
                 if isinstance(farg, (list, tuple))\
                     and len(farg) == 2\
@@ -180,22 +379,128 @@ class CacheFunction(object):
                 else:
                     args = farg
                     kwargs = {}
-                k = self.fhash(self.fkey(key, func, args, kwargs))
-                cache_keys[k] = (ix, farg)
+                rk, lk, ns = keys_for(args, kwargs)
+                if use_local:
+                    data = local.get(lk, self.CACHE_MISS)
+                    if data is not self.CACHE_MISS:
+                        stats['local_hits'] += 1
+                        output[ix] = data
+                        continue
+                pending.append((ix, rk, lk, ns))
 
-            results = cache.get_many(list(cache_keys.keys()))
-            output = [ self.CACHE_MISS ] * len(fargs)
+            if namespace is not None:
+                generations = current_generations(set(x[3] for x in pending))
+            cache_keys = {}
+            for ix, rk, lk, ns in pending:
+                if ns is None:
+                    k = shared_key(rk, None)
+                else:
+                    k = shared_key(rk, generations[ns])
+                cache_keys.setdefault(k, (rk, lk, []))[2].append(ix)
+
+            if cache_keys:
+                results = cache.get_many(list(cache_keys.keys()))
+            else:
+                results = {}
+            misses = {}
             for k, v in cache_keys.items():
-                ix = v[0]
+                rk, lk, ixs = v
                 try:
-                    output[ix] = results[k]
+                    data = results[k]
                 except KeyError:
-                    pass
-            return output
+                    misses[k] = v
+                    continue
+                stats['shared_hits'] += 1
+                for ix in ixs:
+                    output[ix] = data
+                if use_local:
+                    local.set(lk, data)
+            return output, misses
+
+        def get_from_cache(fargs):
+            # misses are not counted here, the caller is expected to fill
+            # them through the decorated function.
+            return lookup(fargs)[0]
+
+        def many(loader):
+            """
+            Returns the bulk version of the decorated function, which must
+            accept a `preload` keyword argument.
+
+            The bulk function takes a list of (single) arguments and returns
+            the list of values; all the cached values are read with one
+            get_many, then `loader` is called once with the list of the
+            missing arguments and must return a dict {argument: preload}.
+            The missing values are computed passing their preload and stored
+            with one set_many.
+            """
+            def bulk(fargs):
+                fargs = list(fargs)
+                output, misses = lookup([ (x,) for x in fargs ])
+                if not misses:
+                    return output
+
+                missing = [ fargs[ixs[0]] for _, _, ixs in misses.values() ]
+                preload = loader(missing)
+
+                use_local = local is not None and local_tier_enabled()
+                computed = {}
+                for k, v in misses.items():
+                    rk, lk, ixs = v
+                    farg = fargs[ixs[0]]
+                    stats['misses'] += 1
+                    data = func(farg, preload=preload.get(farg))
+                    computed[k] = data
+                    if serve_stale:
+                        computed[self.fhash(rk) + ':stale'] = data
+                    for ix in ixs:
+                        output[ix] = data
+                    if use_local:
+                        local.set(lk, data)
+                cache.set_many(computed, timeout)
+                return output
+            return bulk
+
         wrapper.get_from_cache = get_from_cache
+        wrapper.many = many
         wrapper.invalidated = Signal(providing_args=['cache_keys'])
+        wrapper.local_cache = local
+        wrapper.stats = stats
         return wrapper
 
+    def generation_key(self, namespace):
+        return self.fhash(namespace + ':generation')
+
+    def generations(self, namespaces):
+        """
+        Returns the current generation of every (prefixed) namespace, creating
+        the missing counters.
+        """
+        gkeys = dict((self.generation_key(ns), ns) for ns in namespaces)
+        if not gkeys:
+            return {}
+        found = cache.get_many(list(gkeys.keys()))
+        output = {}
+        for gk, ns in gkeys.items():
+            try:
+                output[ns] = found[gk]
+            except KeyError:
+                # counters start from the current time, so that a counter
+                # evicted from the cache never restarts from a generation
+                # already used.
+                generation = int(time.time() * 1000)
+                if not cache.add(gk, generation, None):
+                    generation = cache.get(gk, generation)
+                output[ns] = generation
+        return output
+
+    def bump_generation(self, namespace):
+        try:
+            cache.incr(self.generation_key(namespace))
+        except ValueError:
+            # no counter means nothing cached under this namespace
+            pass
+
     def hash_key(self, key):
         if not isinstance(key, bytes):
             key = key.encode('utf-8')
@@ -12,10 +12,15 @@ import django_comments as comments
 
 from conference import cachef
 from conference import models
+from conference import signals
 
 
 cache_me = cachef.CacheFunction(prefix='conf:')
 
+# number of entries kept in the in-process cache tier of the functions hit
+# many times while rendering a single schedule page.
+LOCAL_CACHE_SIZE = 2000
+
 def _dump_fields(o):
     from django.db.models.fields.files import FieldFile
     output = {}
@@ -35,10 +40,7 @@ def _dump_fields(o):
 
 
 def _i_deadlines(sender, **kw):
-    years = set(x.year for x in models.Deadline.objects.all().values_list('date', flat=True))
-    years.add(None)
-    languages = set([ l[0] for l in settings.LANGUAGES ])
-    return [ 'deadlines:%s:%s' % (l, y) for l in languages for y in years ]
+    return 'deadlines'
 
 def deadlines(lang, year=None):
     qs = models.Deadline.objects\
@@ -67,6 +69,7 @@ def deadlines(lang, year=None):
 deadlines = cache_me(
     models=(models.Deadline, models.DeadlineContent),
     key='deadlines:%(lang)s:%(year)s',
+    namespace='deadlines',
     timeout=5*60)(deadlines, _i_deadlines)
 
 def sponsor(conf):
@@ -135,15 +138,13 @@ def _i_schedule_data(sender, **kw):
 
 schedule_data = cache_me(
     models=(models.Schedule, models.Track),
-    key='schedule:%(sid)s')(schedule_data, _i_schedule_data)
-
-def schedules_data(sids):
-    cached = list(zip(sids, schedule_data.get_from_cache([ (x,) for x in sids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
+    key='schedule:%(sid)s',
+    local_size=LOCAL_CACHE_SIZE)(schedule_data, _i_schedule_data)
 
+def _preload_schedules(sids):
     preload = {}
     schedules = models.Schedule.objects\
-        .filter(id__in=missing)
+        .filter(id__in=sids)
     tracks = models.Track.objects\
         .filter(schedule__in=schedules)\
         .order_by('order')
@@ -155,15 +156,9 @@ def schedules_data(sids):
         }
     for t in tracks:
         preload[t.schedule_id]['tracks'].append(t)
+    return preload
 
-    output = []
-    for ix, e in enumerate(cached):
-        sid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = schedule_data(sid, preload=preload[sid])
-        output.append(val)
-
-    return output
+schedules_data = schedule_data.many(_preload_schedules)
 
 def talk_data(tid, preload=None):
     if preload is None:
@@ -240,15 +235,13 @@ def _i_talk_data(sender, **kw):
 
 talk_data = cache_me(
     models=(models.Talk, models.Speaker, models.TalkSpeaker, comments.get_model()),
-    key='talk_data:%(tid)s')(talk_data, _i_talk_data)
-
-def talks_data(tids):
-    cached = list(zip(tids, talk_data.get_from_cache([ (x,) for x in tids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
+    key='talk_data:%(tid)s',
+    local_size=LOCAL_CACHE_SIZE)(talk_data, _i_talk_data)
 
+def _preload_talks(tids):
     preload = {}
     talks = models.Talk.objects\
-        .filter(id__in=missing)
+        .filter(id__in=tids)
     speakers_data = models.TalkSpeaker.objects\
         .filter(talk__in=talks.values('id'))\
         .values('talk', 'speaker', 'helper',)
@@ -267,7 +260,7 @@ def talks_data(tids):
         .filter(content_type__app_label='conference', content_type__model='talk')\
         .filter(object_pk__in=talks.values('id'), is_public=True)
     events = models.Event.objects\
-        .filter(talk__in=missing)\
+        .filter(talk__in=tids)\
         .values('talk', 'id')
 
     for t in talks:
@@ -302,15 +295,9 @@ def talks_data(tids):
     # talk_data uses profile_data, we try to fetch all the data of the speaker
     # because we need to optimize the number of needed queries.
     profiles_data(pids)
+    return preload
 
-    output = []
-    for ix, e in enumerate(cached):
-        tid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = talk_data(tid, preload=preload[tid])
-        output.append(val)
-
-    return output
+talks_data = talk_data.many(_preload_talks)
 
 def speaker_data(sid, preload=None):
     if preload is None:
@@ -362,13 +349,10 @@ speaker_data = cache_me(
     models=(models.Speaker, models.Talk, models.TalkSpeaker, models.AttendeeProfile, User),
     key='speaker_data:%(sid)s')(speaker_data, _i_speaker_data)
 
-def speakers_data(sids):
-    cached = list(zip(sids, speaker_data.get_from_cache([ (x,) for x in sids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
-
+def _preload_speakers(sids):
     preload = {}
     speakers = models.Speaker.objects\
-        .filter(user__in=missing)
+        .filter(user__in=sids)
     talks = models.TalkSpeaker.objects\
         .filter(speaker__in=speakers.values('user'))\
         .values('speaker', 'talk__id', 'talk__title', 'talk__slug', 'talk__conference', 'talk__type')
@@ -386,15 +370,9 @@ def speakers_data(sids):
             'talk__conference': t['talk__conference'],
             'talk__type': t['talk__type'],
         })
+    return preload
 
-    output = []
-    for ix, e in enumerate(cached):
-        sid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = speaker_data(sid, preload=preload[sid])
-        output.append(val)
-
-    return output
+speakers_data = speaker_data.many(_preload_speakers)
 
 def event_data(eid, preload=None):
     if preload is None:
@@ -454,7 +432,9 @@ def _i_event_data(sender, **kw):
 
 event_data = cache_me(
     models=(models.Event, models.Talk, models.Schedule, models.Track),
-    key='event:%(eid)s')(event_data, _i_event_data)
+    key='event:%(eid)s',
+    local_size=LOCAL_CACHE_SIZE,
+    serve_stale=True)(event_data, _i_event_data)
 
 def tags():
     """
@@ -501,30 +481,17 @@ def tags_for_talks(conference=None, status=None):
     return list(qs)
 
 def _i_tags_for_talks(sender, **kw):
-    statuses = [ x[0] for x in models.TALK_STATUS ]
-    if sender is models.Talk:
-        conf = [ kw['instance'].conference ]
-    else:
-        conf = models.Conference.objects.all().values_list('code', flat=True)
-    return [ 'talks_data:%s:%s' % (c, s) for s in statuses for c in conf ]
+    return 'talks_data'
 
 tags_for_talks = cache_me(
     models=(models.Talk, models.ConferenceTaggedItem, models.ConferenceTag,),
-    key='talks_data:%(conference)s:%(status)s')(tags_for_talks, _i_tags_for_talks)
-
-def events(eids=None, conf=None):
-    if eids is None:
-        eids = models.Event.objects\
-            .filter(schedule__conference=conf)\
-            .values_list('id', flat=True)\
-            .order_by('start_time')
-
-    cached = list(zip(eids, event_data.get_from_cache([ (x,) for x in eids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
+    key='talks_data:%(conference)s:%(status)s',
+    namespace='talks_data')(tags_for_talks, _i_tags_for_talks)
 
+def _preload_events(eids):
     preload = {}
     events = models.Event.objects\
-        .filter(id__in=missing)\
+        .filter(id__in=eids)\
         .select_related('sponsor')
     tracks = models.EventTrack.objects\
         .filter(event__in=events)\
@@ -549,15 +516,17 @@ def events(eids=None, conf=None):
             .filter(id__in=events.values('schedule_id').distinct())\
             .values_list('id', flat=True)
     )
+    return preload
 
-    output = []
-    for ix, e in enumerate(cached):
-        eid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = event_data(eid, preload=preload[eid])
-        output.append(val)
+events_data = event_data.many(_preload_events)
 
-    return output
+def events(eids=None, conf=None):
+    if eids is None:
+        eids = models.Event.objects\
+            .filter(schedule__conference=conf)\
+            .values_list('id', flat=True)\
+            .order_by('start_time')
+    return events_data(eids)
 
 def _i_profile_data(sender, **kw):
     if sender is models.AttendeeProfile:
@@ -639,23 +608,21 @@ def profile_data(uid, preload=None):
 
 profile_data = cache_me(
     models=(models.AttendeeProfile, models.Speaker, models.TalkSpeaker, User),
-    key='profile:%(uid)s')(profile_data, _i_profile_data)
-
-def profiles_data(pids):
-    cached = list(zip(pids, profile_data.get_from_cache([ (x,) for x in pids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
+    key='profile:%(uid)s',
+    local_size=LOCAL_CACHE_SIZE)(profile_data, _i_profile_data)
 
+def _preload_profiles(pids):
     preload = {}
     profiles = models.AttendeeProfile.objects\
-        .filter(user__in=missing)\
+        .filter(user__in=pids)\
         .select_related('user')
     talks = models.TalkSpeaker.objects\
-        .filter(speaker__in=missing)\
+        .filter(speaker__in=pids)\
         .values('speaker', 'talk', 'talk__status', 'talk__conference')
     bios = models.MultilingualContent.objects\
         .filter(
             content_type=ContentType.objects.get_for_model(models.AttendeeProfile),
-            object_id__in=missing,
+            object_id__in=pids,
         )
     for p in profiles:
         preload[p.user_id] = {'profile': p, 'talks': [], 'bio': None}
@@ -665,16 +632,9 @@ def profiles_data(pids):
 
     for b in bios:
         preload[b.object_id]['bio'] = b
+    return preload
 
-    output = []
-    for ix, e in enumerate(cached):
-        pid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = profile_data(pid, preload=preload[pid])
-        output.append(val)
-
-    return output
-
+profiles_data = profile_data.many(_preload_profiles)
 
 def fares(conference):
     output = []
@@ -725,30 +685,19 @@ user_events_interest = cache_me(
     key='user_events_interest:%(uid)s:%(conference)s')(user_events_interest, _i_user_events_interest)
 
 def conference_booking_status(conference):
-    booked = models.EventBooking.objects\
-        .filter(event__schedule__conference=conference)\
-        .values_list('event', flat=True)\
-        .distinct()
-    bookable = models.Event.objects\
-        .filter(bookable=True, schedule__conference=conference)\
-        .values_list('id', flat=True)
-    output = {}
-    for e in set(list(booked) + list(bookable)):
-        output[e] = models.EventBooking.objects.booking_status(e)
-    return output
+    return models.EventBooking.objects.conference_status(conference)
 
 def _i_conference_booking_status(sender, **kw):
-    if sender is models.EventBooking:
-        conference = kw['instance'].event.schedule.conference
-    elif sender is models.Track:
-        conference = kw['instance'].schedule.conference
-    elif sender is models.Event:
-        conference = kw['instance'].schedule.conference
-    return 'conference_booking_status:%s' % conference
+    # the instances only know their schedule or event, finding the
+    # conference would take a query; the namespace is shared by all the
+    # conferences, and only the current one is usually cached
+    return 'conference_booking_status'
 
 conference_booking_status = cache_me(
     models=(models.EventBooking, models.Track, models.Event,),
-    key='conference_booking_status:%(conference)s')(conference_booking_status, _i_conference_booking_status)
+    key='conference_booking_status:%(conference)s',
+    namespace='conference_booking_status',
+    serve_stale=True)(conference_booking_status, _i_conference_booking_status)
 
 def expected_attendance(conference):
     data = models.Schedule.objects.expected_attendance(conference)
@@ -759,15 +708,13 @@ def expected_attendance(conference):
     return data
 
 def _i_expected_attendance(sender, **kw):
-    if sender is models.EventInterest:
-        conf = kw['instance'].event.schedule.conference
-    elif sender is models.Track:
-        conf = kw['instance'].schedule.conference
-    elif sender is models.EventTrack:
-        conf = kw['instance'].track.schedule.conference
-    return 'expected_attendance:%s' % conf
+    # as for conference_booking_status, no query to find the conference
+    return 'expected_attendance'
 
 expected_attendance = cache_me(
-    models=(models.EventInterest, models.Track, models.EventTrack,),
-    key='expected_attendance:%(conference)s')(expected_attendance, _i_expected_attendance)
+    models=(models.Track, models.EventTrack,),
+    signals=(signals.attendance_changed,),
+    key='expected_attendance:%(conference)s',
+    namespace='expected_attendance',
+    serve_stale=True)(expected_attendance, _i_expected_attendance)
 
@@ -13,6 +13,7 @@ from django.conf.urls import url
 from django import forms
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
+from django.db import transaction
 from django.http import HttpResponse, JsonResponse
 from django.template.response import TemplateResponse
 from django.template.loader import render_to_string
@@ -251,28 +252,31 @@ def reissue_invoice(request, invoice_id):
     if request.method == 'POST':
         form = ReissueInvoiceForm(data=request.POST)
         if form.is_valid():
-            new_code = next_invoice_code_for_year(
-                REAL_INVOICE_PREFIX,
-                old_invoice.emit_date.year
-            )
-
-            new_invoice = Invoice(
-                order=old_invoice.order,
-                code=new_code,
-                emit_date=form.cleaned_data['emit_date'],
-                payment_date=old_invoice.payment_date,
-                price=old_invoice.price,
-                issuer=old_invoice.issuer,
-                customer=form.cleaned_data['customer'],
-                local_currency=old_invoice.local_currency,
-                vat_in_local_currency=old_invoice.vat_in_local_currency,
-                exchange_rate=old_invoice.exchange_rate,
-                exchange_rate_date=old_invoice.exchange_rate_date,
-                vat=old_invoice.vat
-            )
-
-            new_invoice.html = render_invoice_as_html(new_invoice)
-            new_invoice.save()
+            # the invoice codes must not have holes: the code is reserved in
+            # the transaction that saves the invoice.
+            with transaction.atomic():
+                new_code = next_invoice_code_for_year(
+                    REAL_INVOICE_PREFIX,
+                    old_invoice.emit_date.year
+                )
+
+                new_invoice = Invoice(
+                    order=old_invoice.order,
+                    code=new_code,
+                    emit_date=form.cleaned_data['emit_date'],
+                    payment_date=old_invoice.payment_date,
+                    price=old_invoice.price,
+                    issuer=old_invoice.issuer,
+                    customer=form.cleaned_data['customer'],
+                    local_currency=old_invoice.local_currency,
+                    vat_in_local_currency=old_invoice.vat_in_local_currency,
+                    exchange_rate=old_invoice.exchange_rate,
+                    exchange_rate_date=old_invoice.exchange_rate_date,
+                    vat=old_invoice.vat
+                )
+
+                new_invoice.html = render_invoice_as_html(new_invoice)
+                new_invoice.save()
 
             return redirect('debug_panel_invoice_export_for_tax_report_2018')
     else:
@@ -2,54 +2,22 @@
 from django import forms
 from django.conf import settings as dsettings
 from django.contrib.admin import widgets as admin_widgets
-from django.core import mail
 from django.forms import widgets
 from django.forms.utils import flatatt
 from django.utils.encoding import force_text
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext as _
 
+from conference import mailing
 from conference import models
 from conference import settings
 
-from p3 import utils as p3utils
-
 from taggit.forms import TagField
 
 import logging
 
 log = logging.getLogger('conference.tags')
 
-### Helpers
-
-def mass_mail(messages, data, addresses, feedback_address):
-
-    # Mass send the emails
-    mail.send_mass_mail(messages)
-
-    # Send feedback mail
-    ctx = dict(data)
-    ctx['addresses'] = '\n'.join(addresses)
-    feedback_email = ("""
-message sent
--------------------------------
-FROM: %(from_)s
-SUBJECT: %(subject)s
-BODY:
-%(body)s
--------------------------------
-sent to:
-%(addresses)s
-""" % ctx)
-    mail.send_mail(
-        '[%s] feedback mass mailing (admin stats)' % settings.CONFERENCE,
-        feedback_email,
-        dsettings.DEFAULT_FROM_EMAIL,
-        recipient_list=[feedback_address],
-     )
-
-###
-
 def validate_tags(tags):
     """
     Returns only tags that are already present in the database
@@ -515,95 +483,27 @@ class AdminSendMailForm(forms.Form):
         real = kw.pop('real_usage', True)
         super().__init__(*args, **kw)
 
-    def load_emails(self):
-        if not settings.ADMIN_TICKETS_STATS_EMAIL_LOG:
-            return []
-
-        output = []
-        try:
-            with open(settings.ADMIN_TICKETS_STATS_EMAIL_LOG, 'r') as email_log_file:
-                while True:
-                    try:
-                        msg = {
-                            'from_': eval(email_log_file.readline()).strip(),
-                            'subject': eval(email_log_file.readline()).strip(),
-                            'body': eval(email_log_file.readline()).strip(),
-                        }
-                    except:
-                        break
-                    email_log_file.readline()
-                    if msg['from_']:
-                        output.append(msg)
-                    else:
-                        break
-        except:
-            return []
-
-        return reversed(output)
-
-    def save_email(self):
-        if not settings.ADMIN_TICKETS_STATS_EMAIL_LOG:
-            return False
-        data = self.cleaned_data
-        with open(settings.ADMIN_TICKETS_STATS_EMAIL_LOG, 'a') as email_log_file:
-            email_log_file.write('%s\n' % repr(data['from_']))
-            email_log_file.write('%s\n' % repr(data['subject']))
-            email_log_file.write('%s\n' % repr(data['body']))
-            email_log_file.write('------------------------------------------\n')
-        return True
-
     def preview(self, *uids):
-        from django.template import Template, Context
-        from django.contrib.auth.models import User
-
         data = self.cleaned_data
+        return mailing.render_messages(
+            data['subject'], data['body'], uids, models.Conference.objects.current())
 
-        if settings.ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY:
-            libs = '{%% load %s %%}' % ' '.join(settings.ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY)
-        else:
-            libs = ''
-        tSubject = Template(libs + data['subject'])
-        tBody = Template(libs + data['body'])
-
-        conf = models.Conference.objects.current()
-
-        output = []
-        for u in User.objects.filter(id__in=uids):
-            ctx = Context({
-                'user': u,
-                'conf': conf,
-                'tickets': p3utils.get_tickets_assigned_to(u),
-            })
-            output.append((
-                tSubject.render(ctx),
-                tBody.render(ctx),
-                u,
-            ))
-        return output
-
-    def send_emails(self, uids, feedback_address):
-        messages = []
-        addresses = []
+    def send_emails(self, uids, feedback_address, created_by=None, conference=None):
+        """
+        Queues the emails and sends them in background; returns the MailJob.
+        """
         data = self.cleaned_data
-
-        # Make sure we don't send duplicate emails to the same uid
-        uids = list(set(uids))
-
-        # Prepare emails
-        for sbj, body, user in self.preview(*uids):
-            messages.append((sbj, body, data['from_'], [user.email]))
-            addresses.append('"%s %s" - %s' % (user.first_name, user.last_name, user.email))
-
-        # Mass send the emails (in a separate process)
-        import multiprocessing
-        process = multiprocessing.Process(
-            target=mass_mail,
-            args=(messages, data, addresses, feedback_address))
-        process.daemon=True
-        process.start()
-        # Let it run until completion without joining it again
-        process = None
-        return len(messages)
+        job = mailing.create_job(
+            conference or settings.CONFERENCE,
+            data['from_'],
+            data['subject'],
+            data['body'],
+            uids,
+            created_by=created_by,
+            feedback_address=feedback_address,
+        )
+        mailing.run_job_in_background(job.id)
+        return job
 
 class AttendeeLinkDescriptionForm(forms.Form):
     message = forms.CharField(label='A note to yourself (when you met this persone, why you want to stay in touch)', widget=forms.Textarea)
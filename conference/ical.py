@@ -1,35 +1,40 @@
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 # FIXME: We can use an external library.
 
+CRLF = b'\r\n'
+# RFC 5545, 3.1: lines should not be longer than 75 octets, excluding the
+# line break
+MAX_LINE = 75
+
 def encode(line):
-    if isinstance(line, bytes):
-        line = line.decode('utf-8')
-    if not line.endswith('\r\n'):
-        line += '\r\n'
-    if len(line) > 75:
-        fold = [ line ]
-        while len(fold[-1]) > 75:
-            l = fold[-1]
-            # 73, because it will be added CRLF
-            pos = 73
-            # It's a bad idea to truncate the string (maybe UTF-8) with a random number,
-            # because I will break a multi-bytes sequence and the file will be unreadable.
-            while True:
-                ready = fold[-1][:pos]
-                try:
-                    ready.decode('utf-8')
-                except UnicodeDecodeError:
-                    pos -= 1
-                    if pos == 0:
-                        raise ValueError('cannot encode: %s' % line)
-                else:
-                    break
-            fold[-1] = ready
-            fold.append(' ' + l[pos:])
-        line = '\r\n'.join(fold)
-    return line
+    """
+    Returns the content line as UTF-8, folded and terminated by CRLF.
+    """
+    if not isinstance(line, bytes):
+        line = line.encode('utf-8')
+    if line.endswith(CRLF):
+        line = line[:-2]
+    size = len(line)
+    if size <= MAX_LINE:
+        return line + CRLF
+
+    chunks = []
+    start = 0
+    # a folded line starts with a space
+    limit = MAX_LINE
+    while size - start > limit:
+        end = start + limit
+        # do not split a multi-byte sequence, the continuation bytes are
+        # 10xxxxxx
+        while line[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(line[start:end])
+        start = end
+        limit = MAX_LINE - 1
+    chunks.append(line[start:])
+    return b'\r\n '.join(chunks) + CRLF
 
 def content(name, value, params=None):
     if params:
@@ -45,29 +50,36 @@ def content(name, value, params=None):
         value = value.decode('utf-8')
     return '%s:%s' % (name, value)
 
+_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    ';': '\\;',
+    ',': '\\,',
+    '\n': '\\n',
+    '\r': '\\n',
+})
+
 def TEXT(value):
     if isinstance(value, bytes):
         value = value.decode('utf-8')
     elif not isinstance(value, str):
         value = str(value)
-    return value\
-        .replace('\\', '\\\\')\
-        .replace('\r\n', '\\n')\
-        .replace('\r', '\\n')\
-        .replace('\n', '\\n')\
-        .replace(';', '\\;')\
-        .replace(',', '\\,')
+    if '\r' in value:
+        value = value.replace('\r\n', '\n')
+    return value.translate(_TEXT_ESCAPES)
 
 def DATE_TIME(value):
-    return  value.strftime('%Y%m%dT%H%M%S')
+    if value.tzinfo is not None:
+        # the UTC form, the other datetimes are in "floating" time
+        return value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    return value.strftime('%Y%m%dT%H%M%S')
 
 def FLOAT(value):
     return '%+.6f' % value
 
 def DURATION(value):
     r = value.seconds
-    h = r / 3600
-    m = (r - (h * 3600)) / 60
+    h = r // 3600
+    m = (r - (h * 3600)) // 60
     s = r - (h * 3600) - (m * 60)
     return 'P%sDT%sH%sM%sS' % (value.days, h, m, s)
 
@@ -126,7 +138,7 @@ class Event(Component):
     ):
         assert not (end and duration)
         if revised is None:
-            revised = datetime.now()
+            revised = datetime.now(timezone.utc)
         d = {
             'UID': Property(uid, fmt=TEXT),
             'DTSTART': Property(start, fmt=DATE_TIME),
@@ -153,3 +165,21 @@ class Calendar(Component):
         super(Calendar, self).__init__('VCALENDAR', d)
         self.subcomponents = events
 
+def serialize(component):
+    """
+    Returns the component encoded, see encode.
+    """
+    return b''.join(map(encode, component.encode()))
+
+def stream(calendar, events):
+    """
+    Yields the encoded calendar, the `events` are already encoded (see
+    serialize) and are yielded as they are.
+    """
+    lines = list(calendar.encode())
+    # the last line closes the calendar
+    for line in lines[:-1]:
+        yield encode(line)
+    for event in events:
+        yield event
+    yield encode(lines[-1])
@@ -0,0 +1,72 @@
+"""
+Overlap detection between time ranges, used for the schedule events.
+
+A range is a (start, end) pair; two ranges overlap when they share a positive
+amount of time, so ranges touching at one end, or empty ranges, never
+overlap.
+"""
+from bisect import bisect_left, bisect_right
+
+
+def overlap(range1, range2):
+    return min(range1[1], range2[1]) > max(range1[0], range2[0])
+
+
+def intersection_counts(ranges):
+    """
+    Returns, for every range, how many of the other ranges overlap it.
+
+    A range overlaps (start, end) if it starts before `end` and does not end
+    before `start`; with the starts and the ends sorted both are a bisect
+    away, so the whole thing costs O(n log n).
+    """
+    ranges = list(ranges)
+    starts = sorted(r[0] for r in ranges if r[1] > r[0])
+    ends = sorted(r[1] for r in ranges if r[1] > r[0])
+    output = []
+    for start, end in ranges:
+        if end > start:
+            # the range itself is among the ones starting before its end
+            output.append(bisect_left(starts, end) - bisect_right(ends, start) - 1)
+        else:
+            output.append(0)
+    return output
+
+
+class IntervalIndex(object):
+    """
+    Static index of items by time range.
+
+    `key` returns the range of an item. The items are kept sorted by start,
+    a query looks only at the ones starting in the window that can still
+    reach the queried range (bounded by the longest range), so for a
+    schedule the cost is O(log n) plus the events around that time.
+    """
+    def __init__(self, items, key):
+        entries = []
+        for ix, item in enumerate(items):
+            start, end = key(item)
+            if end > start:
+                entries.append((start, ix, end, item))
+        entries.sort(key=lambda x: x[:2])
+        self._entries = entries
+        self._starts = [ x[0] for x in entries ]
+        if entries:
+            self._longest = max(x[2] - x[0] for x in entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def overlapping(self, range_):
+        """
+        Returns the items overlapping `range_`, in the order they were given
+        to the index.
+        """
+        start, end = range_
+        if not self._entries or end <= start:
+            return []
+        lo = bisect_right(self._starts, start - self._longest)
+        hi = bisect_left(self._starts, end)
+        found = [ x for x in self._entries[lo:hi] if x[2] > start ]
+        found.sort(key=lambda x: x[1])
+        return [ x[3] for x in found ]
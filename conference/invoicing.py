@@ -9,8 +9,14 @@ This module handles all things related to creating a new invoice, including
 """
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from decimal import Decimal
 import datetime
+import hashlib
+import logging
+import os
+import tempfile
 
 import unicodecsv as csv
 
@@ -20,6 +26,8 @@ from django.db import transaction
 
 from assopy.models import Invoice, Order
 
+from conference import sequences
+from conference import settings
 from conference.models import Conference
 from conference.currencies import (
     convert_from_EUR_using_latest_exrates,
@@ -27,6 +35,8 @@ from conference.currencies import (
 )
 
 
+log = logging.getLogger('conference')
+
 ACPYSS_16 = """
 Asociación de Ciencias de la Programación Python San Sebastian (ACPySS)
 P° Manuel Lardizabal 1, Oficina 307-20018 Donostia (Spain)
@@ -132,17 +142,33 @@ def latest_invoice_code_for_year(prefix, year):
 
 
 def next_invoice_code_for_year(prefix, year):
+    return reserve_invoice_codes_for_year(prefix, year)[0]
+
+
+def reserve_invoice_codes_for_year(prefix, year, count=1):
+    """
+    Returns `count` consecutive invoice codes, reserved until the end of the
+    current transaction.
+    """
     assert 2016 <= year <= 2020, year
     assert prefix in [REAL_INVOICE_PREFIX, FAKE_INVOICE_PREFIX]
 
-    current_code = latest_invoice_code_for_year(prefix, year)
-    if current_code:
-        next_code = increment_invoice_code(current_code)
-        return next_code
+    def latest_sequential_id():
+        # codes emitted before the sequence was in use
+        current_code = latest_invoice_code_for_year(prefix, year)
+        return int(current_code.split('.')[1]) if current_code else 0
 
-    # if there are no current codes, return the first one
+    first = sequences.reserve(
+        prefix, year, count=count, initial=latest_sequential_id
+    )
     template = invoice_code_templates[prefix]
-    return template % {'year_two_digits': year % 1000, 'sequential_id': '0001'}
+    return [
+        template % {
+            'year_two_digits': year % 1000,
+            'sequential_id': str(first + ix).zfill(4),
+        }
+        for ix in range(count)
+    ]
 
 
 def extract_customer_info(order):
@@ -170,66 +196,69 @@ def create_invoices_for_order(order):
     emit_date = payment_date if payment_date else order.created
     prefix = REAL_INVOICE_PREFIX if payment_date else FAKE_INVOICE_PREFIX
 
-    # First transaction takes care of "create all invoices or nothing"
-    # Making it more reliable and threadsafe
+    # The transaction takes care of "create all invoices or nothing", and
+    # keeps the invoice codes reserved until the invoices are saved.
     with transaction.atomic():
 
-        invoices = []
-        for vat_item in order.vat_list():
-            # Second, nested, transaction is here because otherwise getting new
-            # invoice_code wouldn't work with database fetch, we would need to
-            # increment it manually. (hence another transaction per item)
-            with transaction.atomic():
-
-                code = next_invoice_code_for_year(
-                    prefix=prefix,
-                    year=emit_date.year
-                )
+        vat_list = order.vat_list()
+        codes = []
+        if vat_list:
+            codes = reserve_invoice_codes_for_year(
+                prefix=prefix,
+                year=emit_date.year,
+                count=len(vat_list),
+            )
 
-                gross_price = vat_item['price']
-                vat_rate    = 1 + vat_item['vat'].value / 100
-                net_price   = normalize_price(vat_item['price'] / vat_rate)
-                vat_price   = vat_item['price'] - net_price
-
-                currency = LOCAL_CURRENCY_BY_YEAR[emit_date.year]
-                if currency != 'EUR':
-                    conversion = convert_from_EUR_using_latest_exrates(
-                        vat_price, currency
-                    )
-                else:
-                    conversion = {
-                        'currency': 'EUR',
-                        'converted': vat_price,
-                        'exrate': Decimal('1.0'),
-                        'using_exrate_date': emit_date,
-                    }
-
-                customer = extract_customer_info(order)
-
-                invoice, _ = Invoice.objects.update_or_create(
-                    order=order,
-                    code=code,
-                    defaults={
-                        'issuer':         ISSUER_BY_YEAR[emit_date.year],
-                        'customer':       customer,
-                        'vat':            vat_item['vat'],
-                        'price':          gross_price,
-                        'payment_date':   payment_date,
-                        'emit_date':      emit_date,
-                        'local_currency': currency,
-                        'vat_in_local_currency': conversion['converted'],
-                        'exchange_rate':  conversion['exrate'],
-                        'exchange_rate_date': conversion['using_exrate_date'],
-                    }
+        invoices = []
+        for code, vat_item in zip(codes, vat_list):
+            gross_price = vat_item['price']
+            vat_rate    = 1 + vat_item['vat'].value / 100
+            net_price   = normalize_price(vat_item['price'] / vat_rate)
+            vat_price   = vat_item['price'] - net_price
+
+            currency = LOCAL_CURRENCY_BY_YEAR[emit_date.year]
+            if currency != 'EUR':
+                conversion = convert_from_EUR_using_latest_exrates(
+                    vat_price, currency
                 )
-
-                invoice.html = render_invoice_as_html(invoice)
-                invoice.save()
-
-                assert invoice.net_price() == net_price
-                assert invoice.vat_value() == vat_price
-
-                invoices.append(invoice)
+            else:
+                conversion = {
+                    'currency': 'EUR',
+                    'converted': vat_price,
+                    'exrate': Decimal('1.0'),
+                    'using_exrate_date': emit_date,
+                }
+
+            customer = extract_customer_info(order)
+
+            invoice, _ = Invoice.objects.update_or_create(
+                order=order,
+                code=code,
+                defaults={
+                    'issuer':         ISSUER_BY_YEAR[emit_date.year],
+                    'customer':       customer,
+                    'vat':            vat_item['vat'],
+                    'price':          gross_price,
+                    'payment_date':   payment_date,
+                    'emit_date':      emit_date,
+                    'local_currency': currency,
+                    'vat_in_local_currency': conversion['converted'],
+                    'exchange_rate':  conversion['exrate'],
+                    'exchange_rate_date': conversion['using_exrate_date'],
+                }
+            )
+
+            invoice.html = render_invoice_as_html(invoice)
+            invoice.save()
+
+            assert invoice.net_price() == net_price
+            assert invoice.vat_value() == vat_price
+
+            invoices.append(invoice)
+
+        transaction.on_commit(
+            lambda: prerender_invoice_pdfs_in_background(invoices)
+        )
 
     return invoices
 
@@ -291,6 +320,91 @@ def render_invoice_as_html(invoice):
     return render_to_string('assopy/invoice.html', ctx)
 
 
+def invoice_pdf_path(html):
+    """
+    Returns where the PDF rendered from `html` is stored; the files are
+    content-addressed, a changed invoice gets a new PDF.
+    """
+    key = hashlib.sha256(html.encode('utf-8')).hexdigest()
+    return os.path.join(settings.INVOICE_PDF_DIR, key[:2], key + '.pdf')
+
+
+def render_invoice_pdf(html):
+    """
+    Renders `html` as PDF and stores it, unless it's already there; returns
+    the path of the file.
+    """
+    # imported here, weasyprint is slow to load and only needed to render
+    from common.http import html_to_pdf
+
+    path = invoice_pdf_path(html)
+    if os.path.exists(path):
+        return path
+
+    content = html_to_pdf(html)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # the rename is atomic, a concurrent download never finds half a file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except Exception:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+def render_invoice_pdfs(htmls, workers=None):
+    """
+    Renders the PDFs not yet stored, using `workers` processes; returns the
+    number of PDFs rendered.
+    """
+    missing = set(h for h in htmls if not os.path.exists(invoice_pdf_path(h)))
+    if workers is None:
+        workers = os.cpu_count()
+    if workers <= 1 or len(missing) <= 1:
+        for html in missing:
+            render_invoice_pdf(html)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # list() to get the exceptions raised in the workers
+            list(pool.map(render_invoice_pdf, missing))
+    return len(missing)
+
+
+_pdf_pool = None
+
+
+def prerender_invoice_pdfs_in_background(invoices):
+    """
+    Submits the rendering of the PDFs of `invoices` to the background pool,
+    so that the first download finds them ready.
+    """
+    global _pdf_pool
+    if not settings.INVOICE_PDF_WORKERS:
+        return
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=settings.INVOICE_PDF_WORKERS)
+
+    def _done(future, code):
+        if future.exception() is not None:
+            log.error(
+                'Failed to render the PDF of invoice %s: %s',
+                code, future.exception())
+
+    for invoice in invoices:
+        try:
+            future = _pdf_pool.submit(render_invoice_pdf, invoice.html)
+        except BrokenProcessPool:
+            # a worker died, the next invoices will get a new pool; this
+            # one will be rendered on download
+            log.error('The invoice PDF pool is broken, restarting it')
+            _pdf_pool = None
+            return
+        future.add_done_callback(lambda f, code=invoice.code: _done(f, code))
+
+
 CSV_2018_REPORT_COLUMNS = [
     'ID',
     'Emit Date',
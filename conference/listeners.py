@@ -1,8 +1,9 @@
 
-from conference.models import Talk, Event, TalkSpeaker
+from conference.models import Talk, Event, EventBooking, EventInterest, MultilingualContent, TalkSpeaker
 
 from django.dispatch import Signal
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 
 import logging
 
@@ -48,3 +49,76 @@ post_save.connect(on_talk_saved, sender=TalkSpeaker)
 # Also I draw the event because there is a custom acion in the admin that
 # sets all the talks present in the schedule as accepted.
 post_save.connect(on_talk_saved, sender=Event)
+
+
+def on_talk_changed(sender, **kw):
+    """
+    Removes the social cards of the talk that do not show its current title
+    and speakers.
+    """
+    from conference import social_cards
+    if sender is Talk:
+        talk = kw['instance']
+    else:
+        try:
+            talk = kw['instance'].talk
+        except Talk.DoesNotExist:
+            # deleted together with the talk
+            return
+    if not social_cards.stored_cards(talk.id):
+        return
+    title, subtitle = social_cards.card_content(talk)
+    social_cards.remove_cards(
+        talk.id, keep=social_cards.card_path(talk, title, subtitle))
+
+def on_talk_deleted(sender, **kw):
+    from conference import social_cards
+    social_cards.remove_cards(kw['instance'].id)
+
+post_save.connect(on_talk_changed, sender=Talk)
+post_save.connect(on_talk_changed, sender=TalkSpeaker)
+post_delete.connect(on_talk_changed, sender=TalkSpeaker)
+post_delete.connect(on_talk_deleted, sender=Talk)
+
+
+def on_event_interest_changed(sender, **kw):
+    """
+    Updates the presence scores of the events when a user changes their
+    interest or booking.
+    """
+    from conference import attendance
+    o = kw['instance']
+    try:
+        schedule = o.event.schedule_id
+    except Event.DoesNotExist:
+        # deleted together with the event
+        return
+    transaction.on_commit(
+        lambda: attendance.update_user_attendance(o.user_id, schedule))
+
+def on_event_changed(sender, **kw):
+    """
+    Moving, adding or removing an event changes the events overlapping each
+    other; the scores of the whole day are recomputed.
+    """
+    from conference import attendance
+    schedule = kw['instance'].schedule_id
+    transaction.on_commit(lambda: attendance.rebuild_attendance([schedule]))
+
+post_save.connect(on_event_interest_changed, sender=EventInterest)
+post_delete.connect(on_event_interest_changed, sender=EventInterest)
+post_save.connect(on_event_interest_changed, sender=EventBooking)
+post_delete.connect(on_event_interest_changed, sender=EventBooking)
+post_save.connect(on_event_changed, sender=Event)
+post_delete.connect(on_event_changed, sender=Event)
+
+def on_multilingual_content_saved(sender, **kw):
+    """
+    Renders the markdown of the abstracts and of the bios as soon as they
+    are saved, instead of during the next request of the page.
+    """
+    from conference import markup
+    body = kw['instance'].body
+    transaction.on_commit(lambda: markup.prerender(body))
+
+post_save.connect(on_multilingual_content_saved, sender=MultilingualContent)
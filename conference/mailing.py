@@ -0,0 +1,238 @@
+"""
+Mass mailing from the admin (tickets stats section).
+
+A MailJob stores the templates of the message and one MailJobRecipient per
+user; `run_job` sends the pending messages in batches, over a single SMTP
+connection and at most at ADMIN_MASS_MAIL_RATE messages per second. The
+status of every recipient is saved after each batch, so an interrupted job
+can be resumed (a batch at most is sent twice).
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings as dsettings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.db import connection, transaction
+from django.template import Context, Template
+from django.utils import timezone
+
+from conference import models
+from conference import settings
+from p3 import models as p3models
+
+log = logging.getLogger('conference.mailing')
+
+# a job without news for this long is considered interrupted
+STALE_AFTER = timedelta(minutes=10)
+
+
+def compile_templates(subject, body):
+    """
+    Returns the templates of the subject and of the body.
+    """
+    if settings.ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY:
+        libs = '{%% load %s %%}' % ' '.join(settings.ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY)
+    else:
+        libs = ''
+    return Template(libs + subject), Template(libs + body)
+
+
+def recipient_contexts(uids, conference):
+    """
+    Returns the template contexts of the users, with the data of all of them
+    loaded at once.
+    """
+    users = list(get_user_model().objects.filter(id__in=uids))
+    tickets = defaultdict(list)
+    for tc in p3models.TicketConference.objects\
+            .filter(assigned_to__in=[u.email for u in users if u.email])\
+            .select_related('ticket__fare'):
+        tickets[tc.assigned_to].append(tc)
+
+    return {
+        u.id: Context({
+            'user': u,
+            'conf': conference,
+            'tickets': tickets[u.email],
+        })
+        for u in users
+    }
+
+
+def render_messages(subject, body, uids, conference):
+    """
+    Returns the (subject, body, user) rendered for every user.
+    """
+    tsubject, tbody = compile_templates(subject, body)
+    output = []
+    for ctx in recipient_contexts(uids, conference).values():
+        output.append((tsubject.render(ctx), tbody.render(ctx), ctx['user']))
+    return output
+
+
+@transaction.atomic
+def create_job(conference, from_email, subject, body, uids,
+               created_by=None, feedback_address=''):
+    job = models.MailJob.objects.create(
+        conference=conference,
+        from_email=from_email,
+        subject=subject,
+        body=body,
+        created_by=created_by,
+        feedback_address=feedback_address or '',
+    )
+    models.MailJobRecipient.objects.bulk_create(
+        models.MailJobRecipient(job=job, user_id=uid) for uid in set(uids))
+    return job
+
+
+def claim_job(job_id):
+    """
+    Marks the job as being sent; returns False if someone else is sending
+    it.
+    """
+    now = timezone.now()
+    runnable = models.MailJob.objects\
+        .filter(id=job_id)\
+        .exclude(status=models.MailJob.STATUS.DONE)\
+        .exclude(status=models.MailJob.STATUS.SENDING, heartbeat__gte=now - STALE_AFTER)
+    return runnable.update(status=models.MailJob.STATUS.SENDING, heartbeat=now) == 1
+
+
+def run_job(job_id, batch_size=None, rate=None):
+    """
+    Sends the pending messages of the job; returns the number of messages
+    sent, or None if the job is already being sent.
+    """
+    if batch_size is None:
+        batch_size = settings.ADMIN_MASS_MAIL_BATCH_SIZE
+    if rate is None:
+        rate = settings.ADMIN_MASS_MAIL_RATE
+    if not claim_job(job_id):
+        return None
+
+    job = models.MailJob.objects.get(id=job_id)
+    conference = models.Conference.objects.get(code=job.conference)
+    tsubject, tbody = compile_templates(job.subject, job.body)
+    pending = job.recipients\
+        .filter(status=models.MailJobRecipient.STATUS.PENDING)\
+        .order_by('id')
+
+    sent = 0
+    started = time.monotonic()
+    with mail.get_connection() as smtp:
+        while True:
+            batch = list(pending[:batch_size])
+            if not batch:
+                break
+            contexts = recipient_contexts([r.user_id for r in batch], conference)
+            done = []
+            for recipient in batch:
+                try:
+                    ctx = contexts[recipient.user_id]
+                    mail.EmailMessage(
+                        tsubject.render(ctx).strip(),
+                        tbody.render(ctx),
+                        job.from_email,
+                        [ctx['user'].email],
+                        connection=smtp,
+                    ).send()
+                except Exception as e:
+                    log.exception('cannot send "%s" to user %s', job, recipient.user_id)
+                    _failed(recipient, e)
+                    # the connection could be unusable
+                    smtp.close()
+                    smtp.open()
+                else:
+                    done.append(recipient.id)
+
+            models.MailJobRecipient.objects\
+                .filter(id__in=done)\
+                .update(status=models.MailJobRecipient.STATUS.SENT, sent=timezone.now())
+            models.MailJob.objects\
+                .filter(id=job.id)\
+                .update(heartbeat=timezone.now())
+            sent += len(done)
+
+            if rate:
+                # no more than `rate` messages per second, on average
+                delay = len(batch) / rate - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+                started = time.monotonic()
+
+    models.MailJob.objects\
+        .filter(id=job.id)\
+        .update(status=models.MailJob.STATUS.DONE, finished=timezone.now())
+    send_feedback(job)
+    return sent
+
+
+def _failed(recipient, error):
+    recipient.attempts += 1
+    recipient.error = str(error)
+    if recipient.attempts >= settings.ADMIN_MASS_MAIL_ATTEMPTS:
+        recipient.status = models.MailJobRecipient.STATUS.FAILED
+    recipient.save()
+
+
+def send_feedback(job):
+    if not job.feedback_address:
+        return
+    recipients = job.recipients.select_related('user').order_by('id')
+    lines = []
+    for r in recipients:
+        lines.append('"%s %s" - %s%s' % (
+            r.user.first_name, r.user.last_name, r.user.email,
+            '' if r.status == models.MailJobRecipient.STATUS.SENT else ' (%s)' % r.status))
+    feedback_email = ("""
+message sent
+-------------------------------
+FROM: %s
+SUBJECT: %s
+BODY:
+%s
+-------------------------------
+sent to:
+%s
+""" % (job.from_email, job.subject, job.body, '\n'.join(lines)))
+    mail.send_mail(
+        '[%s] feedback mass mailing (admin stats)' % settings.CONFERENCE,
+        feedback_email,
+        dsettings.DEFAULT_FROM_EMAIL,
+        recipient_list=[job.feedback_address],
+    )
+
+
+def run_job_in_background(job_id):
+    """
+    Sends the job from a thread, once the current transaction is committed.
+    """
+    def run():
+        try:
+            run_job(job_id)
+        except Exception:
+            log.exception('mail job %s failed', job_id)
+        finally:
+            connection.close()
+
+    transaction.on_commit(
+        lambda: threading.Thread(target=run, daemon=True).start())
+
+
+def resume_jobs():
+    """
+    Sends the jobs never started or interrupted; returns their ids.
+    """
+    resumed = []
+    for job_id in models.MailJob.objects\
+            .exclude(status=models.MailJob.STATUS.DONE)\
+            .order_by('id')\
+            .values_list('id', flat=True):
+        if run_job(job_id) is not None:
+            resumed.append(job_id)
+    return resumed
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from assopy.models import Invoice
+from conference import models
+from conference.invoicing import render_invoice_pdfs
+
+
+class Command(BaseCommand):
+    """
+    Renders, in parallel, the PDFs of the invoices of a conference that are
+    not stored yet.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('conference')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of processes, by default one per CPU',
+        )
+
+    def handle(self, *args, **options):
+        conference = models.Conference.objects.get(code=options['conference'])
+
+        htmls = Invoice.objects\
+            .filter(order__orderitem__ticket__fare__conference=conference.code)\
+            .distinct()\
+            .values_list('html', flat=True)
+        htmls = list(htmls)
+        rendered = render_invoice_pdfs(htmls, workers=options['workers'])
+        print('%d invoices / %d PDFs rendered' % (len(htmls), rendered))
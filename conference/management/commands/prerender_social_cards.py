@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from conference import models
+from conference.social_cards import render_cards
+
+
+class Command(BaseCommand):
+    """
+    Renders, in parallel, the missing social cards of the accepted talks.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('conference')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of processes, by default one per CPU',
+        )
+        parser.add_argument(
+            '--base-url',
+            default=settings.DEFAULT_URL_PREFIX + '/',
+            help='Used to resolve the urls of the images on the cards',
+        )
+
+    def handle(self, *args, **options):
+        conference = models.Conference.objects.get(code=options['conference'])
+
+        talks = models.Talk.objects.accepted(conference.code)
+        rendered = render_cards(
+            talks, options['base_url'], workers=options['workers'])
+        print('%d talks / %d cards rendered' % (len(talks), rendered))
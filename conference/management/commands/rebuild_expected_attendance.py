@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from conference import models
+from conference.attendance import rebuild_attendance
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the presence scores of the events of a conference, used to
+    forecast their attendance.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('conference')
+
+    def handle(self, *args, **options):
+        conference = models.Conference.objects.get(code=options['conference'])
+
+        schedules = models.Schedule.objects\
+            .filter(conference=conference.code)\
+            .values_list('id', flat=True)
+        rebuild_attendance(schedules)
+        print('%d events scored' % models.EventAttendance.objects\
+            .filter(event__schedule__conference=conference.code)\
+            .count())
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from conference.mailing import resume_jobs
+
+
+class Command(BaseCommand):
+    """
+    Sends the mass mailings never started or interrupted (e.g. by a restart
+    of the web server).
+    """
+
+    def handle(self, *args, **options):
+        resumed = resume_jobs()
+        print('%d mail jobs sent' % len(resumed))
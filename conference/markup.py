@@ -0,0 +1,82 @@
+"""
+Cached markdown rendering of the texts written by the users (talk
+abstracts, speaker bios).
+
+The html is cached under a hash of the text and of the options, so a text
+never needs to be invalidated: once edited it is simply a different key.
+Two tiers are used, the in-process LocalCache in front of the django cache,
+and the MultilingualContent are rendered when saved (see
+conference.listeners) so that the pages find them already in the cache.
+"""
+import hashlib
+import threading
+
+import markdown2
+
+from django.core.cache import cache
+
+from conference import settings
+from conference.cachef import LocalCache, local_tier_enabled
+
+# the safe modes accepted by markdown2
+SAFE_MODES = (None, 'escape', 'replace')
+
+_local = LocalCache(size=1000, timeout=settings.MARKDOWN_CACHE_TIMEOUT)
+_converters = threading.local()
+
+
+def cache_key(text, extras=(), safe_mode='escape'):
+    h = hashlib.sha1()
+    h.update(('%s|%s|' % (safe_mode, ','.join(extras))).encode('utf-8'))
+    h.update(text.encode('utf-8'))
+    return 'conference:markdown:%s' % h.hexdigest()
+
+
+def _converter(extras, safe_mode):
+    """
+    A Markdown instance for the options; markdown2 resets its state at
+    every conversion, but an instance can't be shared between threads.
+    """
+    try:
+        converters = _converters.instances
+    except AttributeError:
+        converters = _converters.instances = {}
+    k = (extras, safe_mode)
+    try:
+        return converters[k]
+    except KeyError:
+        converters[k] = markdown2.Markdown(extras=list(extras), safe_mode=safe_mode)
+        return converters[k]
+
+
+def render_markdown(text, extras=(), safe_mode='escape'):
+    """
+    Returns the html of the markdown `text`, from the cache if available.
+    """
+    if safe_mode not in SAFE_MODES:
+        raise ValueError('invalid safe mode: %r' % (safe_mode,))
+    if not text:
+        return ''
+    extras = tuple(extras)
+    k = cache_key(text, extras, safe_mode)
+    local = local_tier_enabled()
+    if local:
+        html = _local.get(k)
+        if html is not None:
+            return html
+    html = cache.get(k)
+    if html is None:
+        html = str(_converter(extras, safe_mode).convert(text))
+        cache.set(k, html, settings.MARKDOWN_CACHE_TIMEOUT)
+    if local:
+        _local.set(k, html)
+    return html
+
+
+def prerender(text):
+    """
+    Renders `text` with the extras used by the templates, so that the html
+    is already in the cache when the page is requested.
+    """
+    for extras in settings.MARKDOWN_PRERENDER_EXTRAS:
+        render_markdown(text, extras)
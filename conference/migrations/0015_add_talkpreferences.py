@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0014_stripe_charge_default_uuid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TalkPreferences',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('conference', models.CharField(max_length=20, unique=True)),
+                ('missing_vote', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('talks', models.TextField()),
+                ('matrix', models.BinaryField()),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Talk preferences',
+            },
+        ),
+    ]
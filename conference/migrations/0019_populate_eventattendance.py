@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+from collections import defaultdict
+
+from django.db import migrations
+
+
+def populate_event_attendance(apps, schema_editor):
+    # the computation of conference.attendance.rebuild_attendance, done
+    # with the historical models and without sending attendance_changed
+    Event = apps.get_model('conference', 'Event')
+    EventInterest = apps.get_model('conference', 'EventInterest')
+    EventBooking = apps.get_model('conference', 'EventBooking')
+    EventAttendance = apps.get_model('conference', 'EventAttendance')
+    EventAttendanceShare = apps.get_model('conference', 'EventAttendanceShare')
+
+    # the time range of every event, see Event.get_time_range
+    schedule_of = {}
+    ranges = {}
+    events = Event.objects.values_list(
+        'id', 'schedule', 'schedule__date', 'start_time', 'duration', 'talk__duration')
+    for eid, sid, date, start_time, duration, talk_duration in events:
+        start = datetime.datetime.combine(date, start_time)
+        schedule_of[eid] = sid
+        ranges[eid] = (start, start + datetime.timedelta(minutes=duration or talk_duration or 0))
+
+    def overlap(e1, e2):
+        # see conference.intervals.overlap
+        r1, r2 = ranges[e1], ranges[e2]
+        return schedule_of[e1] == schedule_of[e2] \
+            and min(r1[1], r2[1]) > max(r1[0], r2[0])
+
+    attended = defaultdict(set)
+    for qs in (EventInterest.objects.filter(interest__gt=0), EventBooking.objects.all()):
+        for uid, eid in qs.values_list('user', 'event'):
+            attended[uid].add(eid)
+
+    rows = []
+    scores = defaultdict(lambda: 0.0)
+    for uid, user_events in attended.items():
+        for eid in user_events:
+            overlapping = sum(
+                1 for other in user_events
+                if other != eid and overlap(eid, other))
+            share = 1.0 / (1 + overlapping)
+            rows.append(EventAttendanceShare(event_id=eid, user_id=uid, score=share))
+            scores[eid] += share
+
+    EventAttendanceShare.objects.bulk_create(rows, batch_size=500)
+    EventAttendance.objects.bulk_create(
+        (EventAttendance(event_id=eid, score=score) for eid, score in scores.items()),
+        batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conference', '0018_add_mailjob'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_event_attendance, migrations.RunPython.noop),
+    ]
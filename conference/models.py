@@ -14,6 +14,7 @@ from django.core import exceptions
 from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
 from django.template.defaultfilters import slugify
 from django.utils import timezone
@@ -1096,48 +1097,13 @@ class ScheduleManager(models.Manager):
         Using events Interest returns a "Presence score" for each event;
         The score is proportional to the number of people who have expressed
         interest in that event.
+
+        The scores are kept in EventAttendance, see conference.attendance.
         """
-        # I consider it an expression of interest, interest > 0, as the will to
-        # participate in an event and add the user among the participants. If the user
-        # has voted the most contemporary events. I consider his presence in proportion
-        # (so events can have fractional score)
-        events = defaultdict(set)
-        for x in EventInterest.objects\
-                    .filter(event__schedule__conference=conference, interest__gt=0)\
-                    .select_related('event__schedule'):
-            events[x.event].add(x.user_id)
-        # In addition to EventInterest keep account of EventBooking,
-        # the confidence in these cases in even greater.
-        for x in EventBooking.objects\
-                    .filter(event__schedule__conference=conference)\
-                    .select_related('event__schedule'):
-            events[x.event].add(x.user_id)
-
-        # Associate to each event the number of votes it has obtained;
-        # the operation is complicated by the fact that not all votes have the
-        # same weight; if a user has marked as +1 two events to occur
-        # Parallel obviously can not participate in both, so the
-        # his vote should be scaled
         scores = defaultdict(lambda: 0.0)
-        for evt, users in events.items():
-            group = list(Event.objects.group_events_by_times(events, event=evt))[0]
-            while users:
-                u = users.pop()
-                # what is the presence of `` evt` u` for the event? If `u` does not take
-                # part in no other event of the same group, then 1, otherwise a value proportional
-                # to the number of events of interest.
-                found = [ evt ]
-                for other in group:
-                    if other != evt:
-                        try:
-                            events[other].remove(u)
-                        except KeyError:
-                            pass
-                        else:
-                            found.append(other)
-                score = 1.0 / len(found)
-                for f in found:
-                    scores[f.id] += score
+        scores.update(EventAttendance.objects\
+            .filter(event__schedule__conference=conference)\
+            .values_list('event', 'score'))
         return scores
 
     def expected_attendance(self, conference, factor=0.85):
@@ -1153,7 +1119,7 @@ class ScheduleManager(models.Manager):
         scores = self.events_score_by_attendance(conference)
         events = Event.objects\
             .filter(schedule__conference=conference)\
-            .select_related('schedule')
+            .select_related('schedule', 'talk')
 
         output = {}
         # Now I have to make the forecast of the participants for each event,
@@ -1168,11 +1134,13 @@ class ScheduleManager(models.Manager):
         event_by_day = defaultdict(set)
         for e in events:
             event_by_day[e.schedule_id].add(e)
+        group_of = dict(
+            (sid, Event.objects.events_grouper(day_events))
+            for sid, day_events in event_by_day.items())
 
         for event in events:
             score = scores[event.id]
-            group = list(Event.objects\
-                .group_events_by_times(event_by_day[event.schedule_id], event=event))[0]
+            group = group_of[event.schedule_id](event)
 
             group_score = sum([ scores[e.id] for e in group ])
             if group_score:
@@ -1239,38 +1207,46 @@ class Track(models.Model):
 
 
 class EventManager(models.Manager):
+    def events_grouper(self, events):
+        """
+        Indexes the events by time range and returns a function that, given
+        an event, returns the group (list) of the events, among `events`,
+        overlapping it on the same day; see group_events_by_times.
+        """
+        from conference.intervals import IntervalIndex
+        events = list(events)
+        index = IntervalIndex(events, key=lambda x: x.get_time_range())
+
+        def group(event, exclude=()):
+            # `exclude` is a set of id() of events already grouped
+            r0 = event.get_time_range()
+            return [
+                e for e in reversed(index.overlapping(r0))
+                if id(e) not in exclude and e.get_time_range()[0].date() == r0[0].date()
+            ]
+        return group
+
     def group_events_by_times(self, events, event=None):
         """
         Groups the events, obviously belonging to different track, which they overlap in time.
         Return a generator that at each iteration returns a group (list) of events.
         """
-        def overlap(range1, range2):
-            # http://stackoverflow.com/questions/9044084/efficient-data-range-overlap-calculation-in-python
-            latest_start = max(range1[0], range2[0])
-            earliest_end = min(range1[1], range2[1])
-            _overlap = (earliest_end - latest_start)
-            return _overlap.days == 0 and _overlap.seconds > 0
-
-        def extract_group(event, events):
-            group = []
-            r0 = event.get_time_range()
-            for ix in reversed(list(range(len(events)))):
-                r1 = events[ix].get_time_range()
-                if r0[0].date() == r1[0].date() and overlap(r0, r1):
-                    group.append(events.pop(ix))
-            return group
-
         if event:
-            group = extract_group(event, list(events))
-            yield group
+            yield self.events_grouper(events)(event)
         else:
             sorted_events = sorted(
                 [x for x in events if x.get_duration() > 0],
                 key=lambda x: x.get_duration())
+            group = self.events_grouper(sorted_events)
+            extracted = set()
             while sorted_events:
                 evt0 = sorted_events.pop()
-                group = [evt0] + extract_group(evt0, sorted_events)
-                yield group
+                if id(evt0) in extracted:
+                    continue
+                extracted.add(id(evt0))
+                others = group(evt0, exclude=extracted)
+                extracted.update(map(id, others))
+                yield [evt0] + others
 
 
 class Event(models.Model):
@@ -1401,32 +1377,84 @@ class EventInterest(models.Model):
 
 
 class EventBookingManager(models.Manager):
+    def events_status(self, events):
+        """
+        Returns the booking status ({seats, booked, available}) of every event
+        in the `events` queryset, with a single query.
+
+        The seats of an event default to the sum of the seats of its tracks.
+        """
+        booked = EventBooking.objects\
+            .filter(event=models.OuterRef('pk'))\
+            .order_by()\
+            .values('event')\
+            .annotate(count=models.Count('id'))\
+            .values('count')
+        track_seats = EventTrack.objects\
+            .filter(event=models.OuterRef('pk'))\
+            .order_by()\
+            .values('event')\
+            .annotate(seats=models.Sum('track__seats'))\
+            .values('seats')
+        rows = events\
+            .order_by()\
+            .annotate(
+                booked_seats=Coalesce(
+                    models.Subquery(booked, output_field=models.IntegerField()), 0),
+                track_seats=Coalesce(
+                    models.Subquery(track_seats, output_field=models.IntegerField()), 0))\
+            .values_list('id', 'seats', 'track_seats', 'booked_seats')
+        output = {}
+        for eid, seats, track_seats, booked in rows:
+            seats = seats or track_seats
+            output[eid] = {
+                'seats': seats,
+                'booked': booked,
+                'available': seats - booked,
+            }
+        return output
+
+    def conference_status(self, conference):
+        """
+        Booking status of the bookable events of the conference, and of the
+        ones that are not bookable anymore but still have some bookings.
+        """
+        has_bookings = EventBooking.objects.filter(event=models.OuterRef('pk'))
+        events = Event.objects\
+            .filter(schedule__conference=conference)\
+            .annotate(has_bookings=models.Exists(has_bookings))\
+            .filter(models.Q(bookable=True) | models.Q(has_bookings=True))
+        return self.events_status(events)
+
     def booking_status(self, eid):
-        seats = Event.objects.values('seats').get(id=eid)['seats']
-        if not seats:
-            seats = sum(EventTrack.objects\
-                .filter(event=eid)\
-                .values_list('track__seats', flat=True))
-        booked = list(EventBooking.objects\
-            .filter(event=eid)\
-            .values_list('user', flat=True))
-        return {
-            'seats': seats,
-            'booked': booked,
-            'available': seats - len(booked),
-        }
+        try:
+            return self.events_status(Event.objects.filter(id=eid))[eid]
+        except KeyError:
+            raise Event.DoesNotExist()
 
     def booking_available(self, eid, uid):
-        st = self.booking_status(eid)
-        return (uid in st['booked']) or (st['available'] > 0)
+        if EventBooking.objects.filter(event=eid, user=uid).exists():
+            return True
+        return self.booking_status(eid)['available'] > 0
 
     def book_event(self, eid, uid):
-        try:
-            e = EventBooking.objects.get(event=eid, user=uid)
-        except EventBooking.DoesNotExist:
-            e = EventBooking(event_id=eid, user_id=uid)
-            e.save()
-            signals.event_booked.send(sender=Event, booked=True, event_id=eid, user_id=uid)
+        """
+        Books a seat of the event for the user, raises EventBooking.SoldOut
+        if there are none left.
+        """
+        with transaction.atomic():
+            # A no-op update locks the row of the event (select_for_update
+            # is ignored by sqlite); the bookings of its seats are serialized
+            # and the available ones can't change until we commit.
+            Event.objects.filter(id=eid).update(seats=models.F('seats'))
+            try:
+                return EventBooking.objects.get(event=eid, user=uid)
+            except EventBooking.DoesNotExist:
+                pass
+            if self.booking_status(eid)['available'] <= 0:
+                raise EventBooking.SoldOut()
+            e = EventBooking.objects.create(event_id=eid, user_id=uid)
+        signals.event_booked.send(sender=Event, booked=True, event_id=eid, user_id=uid)
         return e
 
     def cancel_reservation(self, eid, uid):
@@ -1439,6 +1467,10 @@ class EventBookingManager(models.Manager):
 
 
 class EventBooking(models.Model):
+
+    class SoldOut(Exception):
+        pass
+
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
 
@@ -1448,6 +1480,28 @@ class EventBooking(models.Model):
         unique_together = (('user', 'event'),)
 
 
+class EventAttendance(models.Model):
+    """
+    The presence score of an event (see conference.attendance), kept up to
+    date with the EventInterest and the EventBooking.
+    """
+    event = models.OneToOneField(
+        Event, primary_key=True, related_name='attendance', on_delete=models.CASCADE)
+    score = models.FloatField(default=0)
+
+
+class EventAttendanceShare(models.Model):
+    """
+    How much a user contributes to the presence score of an event.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE)
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = (('event', 'user'),)
+
+
 class Hotel(models.Model):
     """
     Hotels allow you to track affiliated places and not where finding accommodations during the conference.
@@ -1503,6 +1557,35 @@ class VotoTalk(models.Model):
         unique_together = (('user', 'talk'),)
         verbose_name = 'Talk voting'
         verbose_name_plural = 'Talk votings'
+
+
+class CodeSequence(models.Model):
+    """
+    Last number given out for the codes (of orders, invoices...) starting
+    with `prefix` in `year`; see conference.sequences.
+    """
+    prefix = models.CharField(max_length=20)
+    year = models.PositiveIntegerField()
+    value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = (('prefix', 'year'),)
+
+
+class TalkPreferences(models.Model):
+    """
+    Pairwise preferences between the talks proposed for a conference, kept up
+    to date as the votes arrive (see conference.ranking).
+    """
+    conference = models.CharField(max_length=20, unique=True)
+    missing_vote = models.DecimalField(max_digits=5, decimal_places=2)
+    # json list of the talk ids, in the order of the matrix rows
+    talks = models.TextField()
+    matrix = models.BinaryField()
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'Talk preferences'
 #
 #def _clear_track_cache(sender, **kwargs):
 #    if hasattr(sender, 'schedule_id'):
@@ -1653,3 +1736,73 @@ class StripePayment(models.Model):
         # 9.99 becomes 999
         return int(self.amount * 100)
 
+
+# ========================================
+# Mass mailing
+# TODO: split conference/models.py to multiple files and put it this model in a
+# separate file.
+# ========================================
+
+
+class MailJob(TimeStampedModel):
+    """
+    An email sent from the admin to many users; the messages are sent in
+    background, in batches, by conference.mailing.
+    """
+    STATUS = Choices(
+        ('pending', 'PENDING', 'Pending'),
+        ('sending', 'SENDING', 'Sending'),
+        ('done', 'DONE', 'Done'),
+    )
+
+    conference = models.CharField(max_length=20)
+    created_by = models.ForeignKey(
+        get_user_model(), null=True, blank=True, on_delete=models.SET_NULL)
+    from_email = models.EmailField()
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+    # where to send the report at the end of the job
+    feedback_address = models.EmailField(blank=True)
+
+    status = models.CharField(max_length=10, choices=STATUS, default=STATUS.PENDING)
+    # updated while sending, to tell a running job from an interrupted one
+    heartbeat = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created']
+
+    def __str__(self):
+        return self.subject
+
+    def progress(self):
+        """
+        Returns the number of recipients per status.
+        """
+        output = {status: 0 for status in MailJobRecipient.STATUS._db_values}
+        output.update(self.recipients\
+            .order_by()\
+            .values('status')\
+            .annotate(count=models.Count('id'))\
+            .values_list('status', 'count'))
+        output['total'] = sum(output.values())
+        return output
+
+
+class MailJobRecipient(models.Model):
+    STATUS = Choices(
+        ('pending', 'PENDING', 'Pending'),
+        ('sent', 'SENT', 'Sent'),
+        ('failed', 'FAILED', 'Failed'),
+    )
+
+    job = models.ForeignKey(MailJob, related_name='recipients', on_delete=models.CASCADE)
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
+    status = models.CharField(max_length=10, choices=STATUS, default=STATUS.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = (('job', 'user'),)
+        index_together = (('job', 'status'),)
@@ -7,6 +7,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from assopy.models import Order, OrderItem, Coupon, ORDER_TYPE
+from conference import sequences
 from conference.models import Ticket, Conference
 
 from .fares import get_available_fares_as_dict, FareIsNotAvailable
@@ -39,16 +40,24 @@ def latest_order_code_for_year(year):
 
 
 def next_order_code_for_year(year):
+    """
+    Returns the next order code, reserved until the end of the current
+    transaction.
+    """
     assert 2016 <= year <= 2020, year
 
-    current_code = latest_order_code_for_year(year)
-    if current_code:
-        next_code = increment_order_code(current_code)
-        return next_code
+    def latest_sequential_id():
+        # codes used before the sequence was in use
+        current_code = latest_order_code_for_year(year)
+        return int(current_code.split(".")[1]) if current_code else 0
 
-    # if there are no current codes, return the first one
-    template = ORDER_CODE_TEMPLATE
-    return template % {"year_two_digits": year % 1000, "sequential_id": "0001"}
+    sequential_id = sequences.reserve(
+        ORDER_CODE_PREFIX, year, initial=latest_sequential_id
+    )
+    return ORDER_CODE_TEMPLATE % {
+        "year_two_digits": year % 1000,
+        "sequential_id": str(sequential_id).zfill(4),
+    }
 
 
 def create_order(
@@ -0,0 +1,243 @@
+"""
+Schulze ranking of the talks proposed for a conference.
+
+This is the same computation voteengine (conference/tools/voteengine-0.99)
+does with `-m schulze`, done in process with NumPy:
+
+  * every user who voted at least one of the talks casts a ballot; the talks
+    he did not vote get `missing_vote`;
+  * the pairwise matrix counts, for every (i, j), the ballots preferring i to
+    j; voteengine turns it into margins before looking for the paths;
+  * the strength of the widest path between every pair of talks comes from
+    Floyd-Warshall, i beats j if its path to j is stronger than the reverse;
+  * the ties are broken using the talks ordered by creation date, the older
+    talk first.
+
+For the live ranking the pairwise matrix is stored (TalkPreferences) and
+every new vote only changes the row and the column of its talk.
+"""
+import json
+from decimal import Decimal
+
+import numpy
+from django.db import IntegrityError, transaction
+
+from conference import settings
+from conference.models import TALK_STATUS, Talk, TalkPreferences, VotoTalk
+
+
+def tie_order(talks):
+    """
+    Returns the talks in the order used to break the ties, by creation date.
+    """
+    return sorted(talks, key=lambda x: x.created)
+
+
+def ballots(talks, missing_vote=5):
+    """
+    Returns a (users x talks) matrix with the votes of every user who voted
+    at least one of `talks`; the columns follow the order of `talks`.
+    """
+    columns = dict((t.id, ix) for ix, t in enumerate(talks))
+    votes = VotoTalk.objects\
+        .filter(talk__in=list(columns))\
+        .values_list('user', 'talk', 'vote')
+    rows = {}
+    users, cols, values = [], [], []
+    for uid, tid, vote in votes:
+        users.append(rows.setdefault(uid, len(rows)))
+        cols.append(columns[tid])
+        values.append(vote)
+
+    scores = numpy.full((len(rows), len(columns)), missing_vote, dtype=float)
+    scores[users, cols] = values
+    return scores
+
+
+def pairwise_matrix(scores):
+    """
+    Given the ballots returns the pairwise matrix; p[i, j] is the number of
+    ballots where talk i got a better vote than talk j.
+
+    Instead of comparing every pair on every ballot the votes are split by
+    value: the ballots giving `v` to i and less than `v` to j are the product
+    of two (users x talks) masks, one matrix product per distinct vote.
+    """
+    n = scores.shape[1]
+    p = numpy.zeros((n, n))
+    for value in numpy.unique(scores):
+        p += numpy.dot((scores == value).T.astype(float), (scores < value).astype(float))
+    return p.round().astype(numpy.int64)
+
+
+def widest_paths(margins):
+    """
+    Floyd-Warshall on the (max, min) semiring: the strength of the strongest
+    path between every pair of candidates.
+
+    The k-th row and column are not changed by the k-th step, so the whole
+    matrix can be updated at once.
+    """
+    m = numpy.array(margins)
+    for k in range(m.shape[0]):
+        numpy.maximum(m, numpy.minimum(m[:, k, None], m[None, k, :]), out=m)
+    return m
+
+
+def schulze_order(pairwise):
+    """
+    Returns the indexes of the candidates, best first; the candidates are
+    expected in tie order.
+
+    Like voteengine, the next one is always the first, in tie order, of the
+    candidates not beaten by any of the remaining ones.
+    """
+    p = numpy.asarray(pairwise)
+    n = p.shape[0]
+    paths = widest_paths(p - p.T)
+    beats = paths > paths.T
+    # how many of the remaining candidates beat every candidate
+    defeats = beats.sum(axis=0)
+    remaining = numpy.ones(n, dtype=bool)
+    order = []
+    for _ in range(n):
+        undefeated = numpy.flatnonzero(remaining & (defeats == 0))
+        # the schulze relation has no cycles, this is just to be safe
+        ix = undefeated[0] if len(undefeated) else numpy.flatnonzero(remaining)[0]
+        order.append(int(ix))
+        remaining[ix] = False
+        defeats -= beats[ix]
+    return order
+
+
+def ranking_of_talks(talks, missing_vote=5):
+    """
+    Returns `talks` ordered by the results of the voting, best first.
+    """
+    talks = tie_order(talks)
+    if not talks:
+        return []
+    p = pairwise_matrix(ballots(talks, missing_vote=missing_vote))
+    return [ talks[ix] for ix in schulze_order(p) ]
+
+
+def build_preferences(conference, missing_vote=None):
+    """
+    Computes from scratch, and stores, the pairwise matrix of the talks
+    proposed for `conference`.
+    """
+    if missing_vote is None:
+        missing_vote = settings.TALKS_RANKING_MISSING_VOTE
+    talks = list(Talk.objects.proposed(conference))
+    p = pairwise_matrix(ballots(talks, missing_vote=missing_vote))
+    prefs, _ = TalkPreferences.objects.update_or_create(
+        conference=conference,
+        defaults={
+            'missing_vote': Decimal(str(missing_vote)),
+            'talks': json.dumps([ t.id for t in talks ]),
+            'matrix': p.astype(numpy.int32).tobytes(),
+        })
+    return prefs
+
+
+def load_preferences(prefs):
+    """
+    Returns the talk ids and the pairwise matrix stored in `prefs`.
+    """
+    tids = json.loads(prefs.talks)
+    p = numpy.frombuffer(bytes(prefs.matrix), dtype=numpy.int32)
+    return tids, p.reshape((len(tids), len(tids))).astype(numpy.int64)
+
+
+def lock_preferences(conference):
+    """
+    Returns the stored preferences of `conference` locked for update (until
+    the end of the transaction), building them the first time.
+
+    The lock must be taken before changing a vote, the update of the matrix
+    reads the other votes of the user.
+    """
+    qs = TalkPreferences.objects.select_for_update()
+    try:
+        return qs.get(conference=conference)
+    except TalkPreferences.DoesNotExist:
+        pass
+    try:
+        with transaction.atomic():
+            build_preferences(conference)
+    except IntegrityError:
+        # built in the meantime by someone else
+        pass
+    return qs.get(conference=conference)
+
+
+def vote_delta(scores, ix, old, new):
+    """
+    Given the votes of a ballot, returns how the ix-th row and column of the
+    pairwise matrix change when the ix-th vote goes from `old` to `new`.
+    """
+    row = (new > scores).astype(numpy.int64) - (old > scores)
+    col = (scores > new).astype(numpy.int64) - (scores > old)
+    row[ix] = col[ix] = 0
+    return row, col
+
+
+def record_vote(prefs, user, talk, old, new):
+    """
+    Updates the preferences, locked with `lock_preferences`, after the vote
+    of `user` for `talk` went from `old` to `new` (None for no vote).
+    """
+    if old == new or talk.status != TALK_STATUS.proposed:
+        # only the proposed talks are ranked
+        return
+    tids, p = load_preferences(prefs)
+    index = dict((tid, ix) for ix, tid in enumerate(tids))
+    if talk.id not in index:
+        # a talk proposed after the matrix was built
+        build_preferences(talk.conference, missing_vote=prefs.missing_vote)
+        return
+
+    missing = float(prefs.missing_vote)
+    scores = numpy.full(len(tids), missing)
+    votes = VotoTalk.objects\
+        .filter(user=user, talk__conference=talk.conference)\
+        .values_list('talk', 'vote')
+    for tid, vote in votes:
+        if tid in index:
+            scores[index[tid]] = vote
+
+    ix = index[talk.id]
+    row, col = vote_delta(
+        scores, ix,
+        missing if old is None else float(old),
+        missing if new is None else float(new))
+    p[ix, :] += row
+    p[:, ix] += col
+    prefs.matrix = p.astype(numpy.int32).tobytes()
+    prefs.save()
+
+
+def live_ranking(conference):
+    """
+    Returns the talks proposed for `conference` ordered by the results of the
+    voting so far, using the stored preferences.
+    """
+    talks = tie_order(Talk.objects.proposed(conference))
+    try:
+        prefs = TalkPreferences.objects.get(conference=conference)
+    except TalkPreferences.DoesNotExist:
+        prefs = None
+    if prefs is None or prefs.missing_vote != Decimal(str(settings.TALKS_RANKING_MISSING_VOTE)):
+        prefs = build_preferences(conference)
+    tids, p = load_preferences(prefs)
+    index = dict((tid, ix) for ix, tid in enumerate(tids))
+    if any(t.id not in index for t in talks):
+        tids, p = load_preferences(build_preferences(conference))
+        index = dict((tid, ix) for ix, tid in enumerate(tids))
+
+    # the preferences between two talks do not depend on the others, so
+    # the talks no more proposed can simply be left out
+    rows = [ index[t.id] for t in talks ]
+    if not rows:
+        return []
+    return [ talks[ix] for ix in schulze_order(p[numpy.ix_(rows, rows)]) ]
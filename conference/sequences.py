@@ -0,0 +1,42 @@
+"""
+Sequential numbers for the codes of orders and invoices.
+
+Every (prefix, year) has its counter row. The numbers are taken by
+incrementing the counter inside the transaction of the caller: the row stays
+locked until the commit and a rollback gives the numbers back, so the codes
+have neither duplicates nor holes, without looking at the codes already used.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from conference.models import CodeSequence
+
+
+def reserve(prefix, year, count=1, initial=None):
+    """
+    Reserves `count` consecutive numbers of the (prefix, year) sequence and
+    returns the first one.
+
+    `initial` is called when the sequence is used for the first time, it
+    returns the last number already given out (by default 0).
+
+    Must be called in the transaction that saves the codes, otherwise an
+    error after the reservation leaves a hole.
+    """
+    assert count > 0, count
+    with transaction.atomic():
+        qs = CodeSequence.objects.filter(prefix=prefix, year=year)
+        # the update locks the row, there is no need to read it first
+        if not qs.update(value=F('value') + count):
+            try:
+                with transaction.atomic():
+                    CodeSequence.objects.create(
+                        prefix=prefix,
+                        year=year,
+                        value=initial() if initial else 0,
+                    )
+            except IntegrityError:
+                # created in the meantime by someone else
+                pass
+            qs.update(value=F('value') + count)
+        return qs.values_list('value', flat=True).get() - count + 1
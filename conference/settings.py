@@ -1,4 +1,6 @@
 
+import os
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
@@ -28,7 +30,6 @@ FORMS = {
 }
 FORMS.update(getattr(settings, 'CONFERENCE_FORMS', {}))
 
-import os
 # FIXME: This part is hardcoded, why ?
 #MAX_TICKETS =  os.environ.get("MAX_TICKETS")
 # (artcz) Setting to 6 because that was/is the value in the javascript for the
@@ -57,6 +58,22 @@ STUFF_URL = getattr(settings, 'CONFERENCE_STUFF_URL', settings.MEDIA_URL)
 
 TALKS_RANKING_FILE = getattr(settings, 'CONFERENCE_TALKS_RANKING_FILE', None)
 
+# Vote given to the talks a user didn't vote, for the live ranking
+TALKS_RANKING_MISSING_VOTE = getattr(settings, 'CONFERENCE_TALKS_RANKING_MISSING_VOTE', 5)
+
+# Where the PDFs of the invoices are stored, named after the hash of their
+# html; must not be publicly served, so there is no fallback on MEDIA_ROOT
+INVOICE_PDF_DIR = getattr(settings, 'CONFERENCE_INVOICE_PDF_DIR', None)
+if INVOICE_PDF_DIR is None:
+    if not getattr(settings, 'SECURE_MEDIA_ROOT', None):
+        raise ImproperlyConfigured(
+            'Invoices PDF directory not set (CONFERENCE_INVOICE_PDF_DIR or SECURE_MEDIA_ROOT)')
+    INVOICE_PDF_DIR = os.path.join(settings.SECURE_MEDIA_ROOT, 'invoices')
+
+# Processes rendering the PDFs of the new invoices in background; with 0 the
+# PDFs are rendered on the first download
+INVOICE_PDF_WORKERS = getattr(settings, 'CONFERENCE_INVOICE_PDF_WORKERS', 2)
+
 VIDEO_DOWNLOAD_FALLBACK = getattr(settings, 'CONFERENCE_VIDEO_DOWNLOAD_FALLBACK', True)
 
 DEFAULT_VOTING_TALK_TYPES = (
@@ -156,13 +173,25 @@ TALK_SUBMISSION_NOTIFICATION_EMAIL = getattr(
 
 TALK_TYPES_TO_BE_VOTED = getattr(settings, 'CONFERENCE_VOTING_TALK_TYPES', DEFAULT_VOTING_TALK_TYPES)
 
-# absolute path of a file used to log the email sent from the admin (tickets
-# stats section); the log file is also used to show a list of "last recently
-# sent email" in the admin page.
-ADMIN_TICKETS_STATS_EMAIL_LOG = getattr(settings, 'CONFERENCE_ADMIN_TICKETS_STATS_EMAIL_LOG', None)
+# the emails sent from the admin (tickets stats section) are sent in batches
+# of ADMIN_MASS_MAIL_BATCH_SIZE messages over a single connection, at most
+# ADMIN_MASS_MAIL_RATE messages per second (None: no limit); a message is
+# tried ADMIN_MASS_MAIL_ATTEMPTS times before giving up.
+ADMIN_MASS_MAIL_BATCH_SIZE = getattr(settings, 'CONFERENCE_ADMIN_MASS_MAIL_BATCH_SIZE', 50)
+ADMIN_MASS_MAIL_RATE = getattr(settings, 'CONFERENCE_ADMIN_MASS_MAIL_RATE', None)
+ADMIN_MASS_MAIL_ATTEMPTS = getattr(settings, 'CONFERENCE_ADMIN_MASS_MAIL_ATTEMPTS', 3)
 
 ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY = getattr(settings, 'CONFERENCE_ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY', ['conference'])
 
+# the html of the markdown texts (abstracts, bios) is cached for
+# MARKDOWN_CACHE_TIMEOUT seconds; a MultilingualContent is rendered when
+# saved with every set of extras in MARKDOWN_PRERENDER_EXTRAS, the ones
+# used by the templates.
+MARKDOWN_CACHE_TIMEOUT = getattr(settings, 'CONFERENCE_MARKDOWN_CACHE_TIMEOUT', 7 * 24 * 60 * 60)
+MARKDOWN_PRERENDER_EXTRAS = getattr(settings, 'CONFERENCE_MARKDOWN_PRERENDER_EXTRAS', (
+    ('smarty-pants', 'code-color'),
+))
+
 def _VIDEO_COVER_EVENTS(conference):
     from conference import dataaccess
     return [ x['id'] for x in dataaccess.events(conf=conference) ]
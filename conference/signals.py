@@ -7,3 +7,6 @@ attendees_connected = dispatch.Signal(providing_args=['attendee1', 'attendee2'])
 
 # Issued when an event is booked (booked = True) or if the booking is canceled (booked=False)
 event_booked = dispatch.Signal(providing_args=['booked', 'event_id', 'user_id'])
+
+# Issued when the presence scores of the events of a schedule change
+attendance_changed = dispatch.Signal(providing_args=['schedule_id'])
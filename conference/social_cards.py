@@ -0,0 +1,114 @@
+"""
+Social cards (the images shown when a talk is shared) rendered once and kept
+in the media storage.
+
+A card is stored as `social_cards/<talk id>/<slug>-<hash>.png`, where the
+hash covers what is printed on the card: a new title or new speakers make a
+new file, the old ones are removed when the talk or its speakers are saved.
+"""
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.template.loader import render_to_string
+
+CARDS_DIR = 'social_cards'
+
+
+def card_content(talk):
+    """
+    Returns the title and the subtitle (the speaker names) of the card.
+    """
+    subtitle = ", ".join(
+        [
+            speaker.user.assopy_user.name()
+            for speaker in talk.speakers.all().select_related(
+                "user__assopy_user"
+            )
+        ]
+    )
+    return talk.title, subtitle
+
+
+def card_path(talk, title, subtitle):
+    key = hashlib.sha256(
+        ('%s\n%s' % (title, subtitle)).encode('utf-8')
+    ).hexdigest()[:16]
+    return '%s/%s/%s-%s.png' % (CARDS_DIR, talk.id, talk.slug, key)
+
+
+def render_card(path, title, subtitle, base_url):
+    """
+    Renders the card and stores it in `path`, unless it's already there.
+    """
+    # imported here, weasyprint is slow to load and only needed to render
+    from weasyprint import HTML
+
+    if default_storage.exists(path):
+        return path
+
+    content = render_to_string(
+        "ep19/bs/conference/talk_social_card.html",
+        {"title": title, "subtitle": subtitle},
+    )
+    data = HTML(string=content, base_url=base_url).write_png()
+    if not default_storage.exists(path):
+        default_storage.save(path, ContentFile(data))
+    return path
+
+
+def _render_card(args):
+    return render_card(*args)
+
+
+def get_card(talk, base_url):
+    """
+    Returns the path, in the media storage, of the card of the talk;
+    rendering it if needed.
+    """
+    title, subtitle = card_content(talk)
+    return render_card(card_path(talk, title, subtitle), title, subtitle, base_url)
+
+
+def render_cards(talks, base_url, workers=None):
+    """
+    Renders the missing cards of `talks` using `workers` processes; returns
+    how many have been rendered.
+    """
+    missing = []
+    for talk in talks:
+        title, subtitle = card_content(talk)
+        path = card_path(talk, title, subtitle)
+        if not default_storage.exists(path):
+            missing.append((path, title, subtitle, base_url))
+
+    if workers == 1 or len(missing) <= 1:
+        for args in missing:
+            render_card(*args)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # list() to get the exceptions raised in the workers
+            list(pool.map(_render_card, missing))
+    return len(missing)
+
+
+def stored_cards(talk_id):
+    """
+    Returns the paths of the stored cards of a talk.
+    """
+    directory = '%s/%s' % (CARDS_DIR, talk_id)
+    try:
+        _, files = default_storage.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return ['%s/%s' % (directory, name) for name in files]
+
+
+def remove_cards(talk_id, keep=None):
+    """
+    Removes the stored cards of a talk, but `keep`.
+    """
+    for path in stored_cards(talk_id):
+        if path != keep:
+            default_storage.delete(path)
@@ -2,10 +2,12 @@ import random
 
 from django.conf.urls import url
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.db.models import Q, Prefetch, Case, When, Value, BooleanField
 from django.shortcuts import get_object_or_404
 from django.template.response import TemplateResponse
 
+from conference import ranking
 from conference.models import Conference, Talk, VotoTalk, TALK_STATUS, TALK_TYPE_CHOICES
 
 
@@ -159,30 +161,7 @@ def vote_on_a_talk(request, talk_uuid):
         vote = int(request.POST.get("vote"))
         assert vote in VotingOptions.ALL
 
-        try:
-            db_vote = VotoTalk.objects.get(user=request.user, talk=talk)
-
-        except VotoTalk.DoesNotExist:
-
-            if vote == VotingOptions.no_vote:
-                return TemplateResponse(
-                    request,
-                    "ep19/bs/talk_voting/_voting_form.html",
-                    {"talk": talk, "db_vote": None, "VotingOptions": VotingOptions},
-                )
-
-            db_vote = VotoTalk.objects.create(user=request.user, talk=talk, vote=vote)
-
-        if vote == VotingOptions.no_vote:
-            db_vote.delete()
-            return TemplateResponse(
-                request,
-                "ep19/bs/talk_voting/_voting_form.html",
-                {"talk": talk, "db_vote": None, "VotingOptions": VotingOptions},
-            )
-
-        db_vote.vote = vote
-        db_vote.save()
+        db_vote = update_vote(request.user, talk, vote)
 
     return TemplateResponse(
         request,
@@ -191,6 +170,41 @@ def vote_on_a_talk(request, talk_uuid):
     )
 
 
+def update_vote(user, talk, vote):
+    """
+    Saves the vote of the user (deletes it for `no_vote`) and applies the
+    change to the preferences used for the live ranking of the talks.
+
+    Only the proposed talks are ranked, the votes of the others (accepted,
+    withdrawn, ...) are saved without touching the preferences.
+    """
+    proposed = talk.status == TALK_STATUS.proposed
+    with transaction.atomic():
+        if proposed:
+            preferences = ranking.lock_preferences(talk.conference)
+        try:
+            db_vote = VotoTalk.objects.get(user=user, talk=talk)
+            old = db_vote.vote
+        except VotoTalk.DoesNotExist:
+            db_vote = old = None
+
+        if vote == VotingOptions.no_vote:
+            if db_vote is not None:
+                db_vote.delete()
+                db_vote = None
+        elif db_vote is None:
+            db_vote = VotoTalk.objects.create(user=user, talk=talk, vote=vote)
+        else:
+            db_vote.vote = vote
+            db_vote.save()
+
+        if proposed:
+            ranking.record_vote(
+                preferences, user, talk, old, db_vote.vote if db_vote else None
+            )
+    return db_vote
+
+
 class VotingOptions:
     no_vote = -1
     not_interested = 0
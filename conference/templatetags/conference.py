@@ -539,10 +539,7 @@ def overbooked_events(context, conference):
     c = _request_cache(context['request'], 'schedules_overbook')
     if not c:
         data = models.Schedule.objects.expected_attendance(conference)
-        for k, v in data.items():
-            if not v['overbook']:
-                del data[k]
-        c['items'] = data
+        c['items'] = {k: v for k, v in data.items() if v['overbook']}
     return c['items']
 
 
@@ -1274,7 +1271,7 @@ def render_schedule_list(context, conference, exclude_tags=None, exclude_tracks=
 
 @register.filter
 def markdown2(text, arg=''):
-    from markdown2 import markdown
+    from conference.markup import render_markdown
     extensions = [e for e in arg.split(",") if e]
     if len(extensions) > 0 and extensions[0] == "nosafe":
         extensions = extensions[1:]
@@ -1282,7 +1279,7 @@ def markdown2(text, arg=''):
     else:
         safe_mode = "escape"
 
-    return mark_safe(markdown(text, safe_mode=safe_mode, extras=extensions))
+    return mark_safe(render_markdown(text, extras=extensions, safe_mode=safe_mode))
 
 
 @register.simple_tag
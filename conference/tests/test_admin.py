@@ -59,6 +59,19 @@ def test_conference_ticket_stats_details_admin(admin_client):
     assert response.status_code == 200
 
 
+# /admin/conference/conference/<cid>/ranking/ conference.admin.talks_ranking
+@mark.django_db
+def test_conference_talks_ranking_admin(admin_client):
+    conference = ConferenceFactory()
+    url = reverse('admin:conference-conference-ranking', kwargs={'cid': conference.code})
+
+    response = admin_client.get(url)
+    assert response.status_code == 200
+
+    response = admin_client.post(url)
+    assert response.status_code == 302
+
+
 # /admin/conference/speaker/stats/list/ conference.admin.stats_list
 @mark.django_db
 def test_conference_speaker_stat_list_admin(admin_client):
@@ -0,0 +1,135 @@
+import random
+from datetime import time
+from importlib import import_module
+
+from pytest import approx, mark
+
+from django.apps import apps
+
+from assopy.stripe.tests.factories import UserFactory
+from conference import attendance
+from conference.models import (
+    EventAttendance,
+    EventAttendanceShare,
+    EventBooking,
+    EventInterest,
+    Schedule,
+)
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.event import EventFactory
+from p3.tests.factories.schedule import ScheduleFactory
+
+
+def _scores(conference):
+    return dict(Schedule.objects.events_score_by_attendance(conference.code))
+
+
+def _day(conference):
+    """
+    Three parallel tracks from 10:00 to 12:00, a keynote at 12:00.
+    """
+    schedule = ScheduleFactory(conference=conference.code)
+    events = []
+    for start, duration in ((10, 60), (10, 60), (10, 120), (11, 60), (12, 60)):
+        events.append(EventFactory(
+            schedule=schedule,
+            talk__conference=conference.code,
+            talk__status='accepted',
+            start_time=time(start, 0),
+            duration=duration))
+    return schedule, events
+
+
+@mark.django_db(transaction=True)
+def test_overlapping_events_share_the_user():
+    conference = ConferenceFactory()
+    _, (a, b, long, c, keynote) = _day(conference)
+    user = UserFactory()
+
+    interest = EventInterest.objects.create(user=user, event=a, interest=1)
+    assert _scores(conference) == {a.id: 1.0}
+
+    EventInterest.objects.create(user=user, event=b, interest=1)
+    EventBooking.objects.create(user=user, event=keynote)
+    assert _scores(conference) == approx({a.id: 0.5, b.id: 0.5, keynote.id: 1.0})
+
+    # not interested anymore
+    interest.interest = 0
+    interest.save()
+    assert _scores(conference) == approx({a.id: 0, b.id: 1.0, keynote.id: 1.0})
+
+    EventBooking.objects.filter(user=user, event=keynote).delete()
+    assert _scores(conference)[keynote.id] == approx(0)
+
+
+@mark.django_db(transaction=True)
+def test_incremental_updates_match_a_rebuild():
+    conference = ConferenceFactory()
+    schedule, events = _day(conference)
+    users = [UserFactory() for _ in range(6)]
+
+    rnd = random.Random(0)
+    for _ in range(80):
+        user, event = rnd.choice(users), rnd.choice(events)
+        action = rnd.random()
+        if action < 0.4:
+            EventInterest.objects.update_or_create(
+                user=user, event=event, defaults={'interest': rnd.randint(-1, 1)})
+        elif action < 0.6:
+            EventInterest.objects.filter(user=user, event=event).delete()
+        elif action < 0.8:
+            EventBooking.objects.get_or_create(user=user, event=event)
+        else:
+            for b in EventBooking.objects.filter(user=user, event=event):
+                b.delete()
+
+    incremental = _scores(conference)
+    shares = set(EventAttendanceShare.objects.values_list('event', 'user', 'score'))
+    attendance.rebuild_attendance([schedule.id])
+
+    assert incremental == approx(_scores(conference))
+    assert {(e, u) for e, u, _ in shares} == \
+        set(EventAttendanceShare.objects.values_list('event', 'user'))
+
+
+@mark.django_db(transaction=True)
+def test_moving_an_event_rebuilds_the_day():
+    conference = ConferenceFactory()
+    _, (a, b, long, c, keynote) = _day(conference)
+    user = UserFactory()
+    EventInterest.objects.create(user=user, event=c, interest=1)
+    EventInterest.objects.create(user=user, event=keynote, interest=1)
+    assert _scores(conference) == approx({c.id: 1.0, keynote.id: 1.0})
+
+    keynote.start_time = time(11, 0)
+    keynote.save()
+    assert _scores(conference) == approx({c.id: 0.5, keynote.id: 0.5})
+
+    keynote.delete()
+    assert _scores(conference) == approx({c.id: 1.0})
+    assert not EventAttendance.objects.filter(event=keynote.id).exists()
+
+
+@mark.django_db(transaction=True)
+def test_migration_populates_the_scores(mocker):
+    conference = ConferenceFactory()
+    _, (a, b, long, c, keynote) = _day(conference)
+    user, other = UserFactory(), UserFactory()
+    EventInterest.objects.create(user=user, event=a, interest=1)
+    EventInterest.objects.create(user=user, event=long, interest=1)
+    EventInterest.objects.create(user=other, event=b, interest=0)
+    EventBooking.objects.create(user=other, event=c)
+    EventBooking.objects.create(user=other, event=long)
+    expected = _scores(conference)
+    shares = set(EventAttendanceShare.objects.values_list('event', 'user', 'score'))
+    EventAttendanceShare.objects.all().delete()
+    EventAttendance.objects.all().delete()
+
+    sent = mocker.patch('conference.signals.attendance_changed.send')
+    migration = import_module('conference.migrations.0019_populate_eventattendance')
+    migration.populate_event_attendance(apps, None)
+
+    assert expected == approx({a.id: 0.5, long.id: 1.0, c.id: 0.5})
+    assert _scores(conference) == approx(expected)
+    assert set(EventAttendanceShare.objects.values_list('event', 'user', 'score')) == shares
+    assert not sent.called
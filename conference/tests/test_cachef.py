@@ -0,0 +1,352 @@
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import Signal
+from django.test import override_settings
+
+from conference.cachef import CacheFunction, LocalCache
+
+
+def _cached_counter(**kwargs):
+    """
+    Returns a cached function that counts how many times it has been really
+    executed, plus the signal that invalidates it.
+    """
+    calls = []
+    invalidate = Signal()
+
+    def fn(x):
+        calls.append(x)
+        return {'x': x, 'calls': len(calls)}
+
+    def _i_fn(sender, **kw):
+        return 'fn:%s' % kw['x']
+
+    cache_me = CacheFunction(prefix='test:')
+    fn = cache_me(signals=(invalidate,), key='fn:%(x)s', **kwargs)(fn, _i_fn)
+    return fn, invalidate, calls
+
+
+def test_local_cache_is_bounded_lru():
+    local = LocalCache(size=2, timeout=60)
+    local.set('a', 1)
+    local.set('b', 2)
+    local.get('a')
+    local.set('c', 3)
+
+    assert len(local) == 2
+    assert local.get('a') == 1
+    assert local.get('b') is None
+    assert local.get('c') == 3
+
+
+def test_local_cache_expires_entries():
+    local = LocalCache(size=10, timeout=-1)
+    local.set('a', 1)
+
+    assert local.get('a', 'missing') == 'missing'
+    assert len(local) == 0
+
+
+def test_local_cache_returns_copies():
+    local = LocalCache(size=10, timeout=60)
+    local.set('a', {'x': 1})
+    local.get('a')['x'] = 2
+
+    assert local.get('a') == {'x': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_local_tier_serves_repeated_reads():
+    cache.clear()
+    fn, _, calls = _cached_counter(local_size=10)
+
+    assert fn(1) == fn(1) == fn(1)
+    assert calls == [1]
+    assert fn.stats == {'misses': 1, 'local_hits': 2}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_shared_tier_serves_reads_missing_locally():
+    cache.clear()
+    fn, _, calls = _cached_counter(local_size=10)
+
+    fn(1)
+    fn.local_cache.clear()
+    fn(1)
+
+    assert calls == [1]
+    assert fn.stats == {'misses': 1, 'shared_hits': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_invalidation_evicts_both_tiers():
+    cache.clear()
+    fn, invalidate, calls = _cached_counter(local_size=10)
+
+    fn(1)
+    fn(2)
+    invalidate.send(sender=None, x=1)
+
+    assert fn(1)['calls'] == 3
+    assert fn(2)['calls'] == 2
+    assert calls == [1, 2, 1]
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_get_from_cache_fills_local_tier():
+    cache.clear()
+    fn, _, calls = _cached_counter(local_size=10)
+
+    fn(1)
+    fn.local_cache.clear()
+    assert fn.get_from_cache([(1,), (2,)]) == [
+        {'x': 1, 'calls': 1}, CacheFunction.CACHE_MISS]
+    fn(1)
+
+    assert calls == [1]
+    assert fn.stats['local_hits'] == 1
+
+
+def test_local_tier_disabled_with_dummy_cache():
+    fn, _, calls = _cached_counter(local_size=10)
+
+    fn(1)
+    fn(1)
+
+    assert calls == [1, 1]
+    assert len(fn.local_cache) == 0
+
+
+def _cached_in_namespace(**kwargs):
+    calls = []
+    invalidate = Signal()
+
+    def fn(group, x):
+        calls.append((group, x))
+        return len(calls)
+
+    def _i_fn(sender, **kw):
+        return 'fn:%s' % kw['group']
+
+    cache_me = CacheFunction(prefix='test:')
+    fn = cache_me(
+        signals=(invalidate,),
+        key='fn:%(group)s:%(x)s',
+        namespace='fn:%(group)s', **kwargs)(fn, _i_fn)
+    return fn, invalidate, calls
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_namespace_invalidation_bumps_generation():
+    cache.clear()
+    fn, invalidate, calls = _cached_in_namespace()
+
+    fn('a', 1)
+    fn('a', 2)
+    fn('b', 1)
+    generation = CacheFunction().generations(['test:fn:a'])['test:fn:a']
+    invalidate.send(sender=None, group='a')
+
+    assert CacheFunction().generations(['test:fn:a']) == {
+        'test:fn:a': generation + 1}
+    fn('a', 1)
+    fn('a', 2)
+    fn('b', 1)
+    assert calls == [('a', 1), ('a', 2), ('b', 1), ('a', 1), ('a', 2)]
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_namespace_invalidation_evicts_local_tier():
+    cache.clear()
+    fn, invalidate, calls = _cached_in_namespace(local_size=10)
+
+    fn('a', 1)
+    fn('a', 1)
+    invalidate.send(sender=None, group='a')
+    fn('a', 1)
+
+    assert calls == [('a', 1), ('a', 1)]
+    assert fn.stats == {'misses': 2, 'local_hits': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_namespace_get_from_cache():
+    cache.clear()
+    fn, invalidate, calls = _cached_in_namespace()
+
+    fn('a', 1)
+    fn('b', 1)
+    invalidate.send(sender=None, group='a')
+
+    assert fn.get_from_cache([('a', 1), ('b', 1)]) == [
+        CacheFunction.CACHE_MISS, 2]
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_nested_namespaces():
+    cache.clear()
+    calls = []
+    invalidate = Signal()
+
+    def fn(group, x):
+        calls.append((group, x))
+        return len(calls)
+
+    def _i_fn(sender, **kw):
+        if 'group' in kw:
+            return 'fn:%s' % kw['group']
+        return 'fn'
+
+    fn = CacheFunction(prefix='test:')(
+        signals=(invalidate,),
+        key='fn:%(group)s:%(x)s',
+        namespace=('fn', 'fn:%(group)s'),
+        local_size=10)(fn, _i_fn)
+
+    fn('a', 1)
+    fn('b', 1)
+    invalidate.send(sender=None, group='a')
+    fn('a', 1)
+    fn('b', 1)
+    assert calls == [('a', 1), ('b', 1), ('a', 1)]
+
+    invalidate.send(sender=None)
+    fn('a', 1)
+    fn('b', 1)
+    assert calls == [('a', 1), ('b', 1), ('a', 1), ('a', 1), ('b', 1)]
+
+
+def _lock_key(rk):
+    return CacheFunction().fhash(rk) + ':lock'
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_single_flight_serves_stale_value_while_locked():
+    cache.clear()
+    fn, invalidate, calls = _cached_counter(serve_stale=True)
+
+    assert fn(1)['calls'] == 1
+    invalidate.send(sender=None, x=1)
+    cache.add(_lock_key('test:fn:1'), 1)
+
+    assert fn(1)['calls'] == 1
+    assert calls == [1]
+    assert fn.stats == {'misses': 1, 'stale_hits': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_single_flight_waits_for_lock_holder():
+    cache.clear()
+    fn, _, calls = _cached_counter(single_flight=True)
+    lock = _lock_key('test:fn:1')
+    cache.add(lock, 1)
+
+    def holder():
+        cache.set(CacheFunction().fhash('test:fn:1'), {'x': 1, 'calls': 0})
+        cache.delete(lock)
+    timer = threading.Timer(0.1, holder)
+    timer.start()
+
+    assert fn(1) == {'x': 1, 'calls': 0}
+    timer.join()
+    assert calls == []
+    assert fn.stats == {'shared_hits': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_single_flight_gives_up_waiting():
+    cache.clear()
+    calls = []
+
+    def fn(x):
+        calls.append(x)
+        return x
+
+    fn = CacheFunction(prefix='test:', lock_wait=0.1)(
+        key='fn:%(x)s', single_flight=True)(fn)
+    cache.add(_lock_key('test:fn:1'), 1)
+
+    assert fn(1) == 1
+    assert calls == [1]
+    assert fn.stats == {'misses': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_single_flight_releases_lock():
+    cache.clear()
+    fn, _, calls = _cached_counter(single_flight=True)
+
+    fn(1)
+
+    assert cache.get(_lock_key('test:fn:1')) is None
+
+
+class CountingCache(object):
+    """
+    Wraps the default cache counting the round-trips per method.
+    """
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        method = getattr(self.cache, name)
+
+        def call(*args, **kwargs):
+            self.calls[name] += 1
+            return method(*args, **kwargs)
+        return call
+
+
+def _cached_bulk():
+    calls = []
+    loads = []
+
+    def fn(x, preload=None):
+        calls.append((x, preload))
+        return x * 10
+
+    def loader(xs):
+        loads.append(sorted(xs))
+        return dict((x, 'preload-%s' % x) for x in xs)
+
+    fn = CacheFunction(prefix='test:')(key='fn:%(x)s')(fn)
+    return fn, fn.many(loader), calls, loads
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_many_fills_misses_with_one_round_trip(mocker):
+    cache.clear()
+    fn, fn_many, calls, loads = _cached_bulk()
+    fn(1)
+    counting = CountingCache(cache)
+    mocker.patch('conference.cachef.cache', counting)
+
+    assert fn_many([1, 2, 3, 2]) == [10, 20, 30, 20]
+    assert loads == [[2, 3]]
+    assert calls == [(1, None), (2, 'preload-2'), (3, 'preload-3')]
+    assert counting.calls == {'get_many': 1, 'set_many': 1}
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_many_stores_the_computed_values():
+    cache.clear()
+    fn, fn_many, calls, loads = _cached_bulk()
+
+    fn_many([1, 2])
+    assert fn_many([1, 2]) == [10, 20]
+    assert fn(2) == 20
+
+    assert loads == [[1, 2]]
+    assert len(calls) == 2
+
+
+def test_many_without_cache():
+    fn, fn_many, calls, loads = _cached_bulk()
+
+    assert fn_many([]) == []
+    assert fn_many([1]) == [10]
+    assert loads == [[1]]
@@ -0,0 +1,67 @@
+from pytest import mark
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from assopy.stripe.tests.factories import UserFactory
+from conference import dataaccess
+from conference.models import EventBooking, Track
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.event import EventFactory
+from conference.tests.factories.talk import TalkFactory
+
+
+def _count_queries(f, *args):
+    with CaptureQueriesContext(connection) as queries:
+        f(*args)
+    return len(queries)
+
+
+@mark.django_db
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_talks_data_costs_a_constant_number_of_queries():
+    cache.clear()
+    dataaccess.talk_data.local_cache.clear()
+    ConferenceFactory()
+    few = [TalkFactory().id for _ in range(2)]
+    many = [TalkFactory().id for _ in range(6)]
+
+    assert _count_queries(dataaccess.talks_data, few) == \
+        _count_queries(dataaccess.talks_data, many)
+    assert _count_queries(dataaccess.talks_data, few + many) == 0
+    assert [t['id'] for t in dataaccess.talks_data(many)] == many
+
+
+@mark.django_db
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_booking_status_is_invalidated_without_queries():
+    cache.clear()
+    events = []
+    for code in ('ep2018', 'ep2019'):
+        conference = ConferenceFactory(code=code)
+        events.append(EventFactory(
+            schedule__conference=conference.code,
+            talk__conference=conference.code,
+            seats=5, bookable=True))
+
+    def misses():
+        before = dataaccess.conference_booking_status.stats['misses']
+        for e in events:
+            dataaccess.conference_booking_status(e.schedule.conference)
+        return dataaccess.conference_booking_status.stats['misses'] - before
+
+    assert misses() == 2
+    booking = EventBooking.objects.create(event=events[0], user=UserFactory())
+    assert misses() == 2
+    assert dataaccess.conference_booking_status(events[0].schedule.conference)[events[0].id]['booked'] == 1
+
+    # a signal handler, it can only look at the instance
+    invalidators = (
+        (dataaccess._i_conference_booking_status, EventBooking, booking),
+        (dataaccess._i_expected_attendance, Track, events[0].tracks.first()),
+    )
+    for invalidate, sender, instance in invalidators:
+        assert _count_queries(lambda: invalidate(sender, instance=instance)) == 0
@@ -0,0 +1,117 @@
+import threading
+
+from pytest import mark, raises
+
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+
+from assopy.stripe.tests.factories import UserFactory
+from conference.models import EventBooking
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.event import EventFactory, EventTrackFactory
+
+
+def _event(conference, seats=0, track_seats=(), **kw):
+    event = EventFactory(
+        schedule__conference=conference.code,
+        talk__conference=conference.code,
+        talk__status='accepted',
+        seats=seats,
+        **kw)
+    for s in track_seats:
+        EventTrackFactory(event=event, track__schedule=event.schedule, track__seats=s)
+    return event
+
+
+@mark.django_db
+def test_booking_status_counts_the_seats():
+    conference = ConferenceFactory()
+    event = _event(conference, seats=3, bookable=True)
+    for user in (UserFactory(), UserFactory()):
+        EventBooking.objects.book_event(event.id, user.id)
+
+    assert EventBooking.objects.booking_status(event.id) == {
+        'seats': 3, 'booked': 2, 'available': 1}
+
+    by_tracks = _event(conference, track_seats=(10, 15), bookable=True)
+    assert EventBooking.objects.booking_status(by_tracks.id) == {
+        'seats': 25, 'booked': 0, 'available': 25}
+
+
+@mark.django_db
+def test_conference_status_is_a_single_query():
+    conference = ConferenceFactory()
+    users = [UserFactory() for _ in range(3)]
+    bookable = [_event(conference, seats=5, bookable=True) for _ in range(4)]
+    closed = _event(conference, track_seats=(2,), bookable=False)
+    EventBooking.objects.create(event=closed, user=users[0])
+    _event(conference, seats=5, bookable=False)
+    for event in bookable[:2]:
+        for user in users:
+            EventBooking.objects.book_event(event.id, user.id)
+
+    with CaptureQueriesContext(connection) as queries:
+        status = EventBooking.objects.conference_status(conference.code)
+
+    assert len(queries) == 1
+    assert status == {
+        bookable[0].id: {'seats': 5, 'booked': 3, 'available': 2},
+        bookable[1].id: {'seats': 5, 'booked': 3, 'available': 2},
+        bookable[2].id: {'seats': 5, 'booked': 0, 'available': 5},
+        bookable[3].id: {'seats': 5, 'booked': 0, 'available': 5},
+        closed.id: {'seats': 2, 'booked': 1, 'available': 1},
+    }
+
+
+@mark.django_db
+def test_book_event_refuses_to_overbook():
+    conference = ConferenceFactory()
+    event = _event(conference, seats=1, bookable=True)
+    first, second = UserFactory(), UserFactory()
+
+    booking = EventBooking.objects.book_event(event.id, first.id)
+    # booking twice is harmless
+    assert EventBooking.objects.book_event(event.id, first.id) == booking
+    assert EventBooking.objects.booking_available(event.id, first.id)
+    assert not EventBooking.objects.booking_available(event.id, second.id)
+    with raises(EventBooking.SoldOut):
+        EventBooking.objects.book_event(event.id, second.id)
+
+    EventBooking.objects.cancel_reservation(event.id, first.id)
+    EventBooking.objects.book_event(event.id, second.id)
+    assert EventBooking.objects.booking_status(event.id)['available'] == 0
+
+
+@mark.django_db(transaction=True)
+def test_concurrent_bookings_do_not_exceed_the_seats():
+    conference = ConferenceFactory()
+    event = _event(conference, seats=5, bookable=True)
+    users = [UserFactory() for _ in range(12)]
+    sold_out = []
+    errors = []
+
+    def worker(user):
+        try:
+            while True:
+                try:
+                    EventBooking.objects.book_event(event.id, user.id)
+                except EventBooking.SoldOut:
+                    sold_out.append(user)
+                except OperationalError:
+                    # sqlite refuses concurrent writers, try again
+                    continue
+                break
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert EventBooking.objects.filter(event=event).count() == 5
+    assert len(sold_out) == 7
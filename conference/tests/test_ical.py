@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+from conference import ical
+
+
+def _unfold(data):
+    return data.replace(b'\r\n ', b'')
+
+
+def _calendar(count):
+    start = datetime(2019, 7, 8, 9, tzinfo=pytz.utc)
+    abstract = 'Più veloce; meglio, \\ di prima\r\nsecond line ' * 40
+    events = [
+        ical.Event(
+            uid='https://ep2019.europython.eu/p3/event/%d' % ix,
+            start=start + timedelta(minutes=ix),
+            end=start + timedelta(minutes=ix + 30),
+            revised=start,
+            summary=('Talk %d, ünïcode' % ix, {'ALTREP': 'https://ep2019.europython.eu/talk-%d' % ix}),
+            description=abstract,
+            location='Track: Main room',
+            organizer=('mailto:info@europython.eu', {'CN': 'EuroPython'}),
+        )
+        for ix in range(count)
+    ]
+    return ical.Calendar(uid='test', events=events, ttl=timedelta(hours=1))
+
+
+def test_short_lines_are_not_folded():
+    assert ical.encode('SUMMARY:test') == b'SUMMARY:test\r\n'
+    assert ical.encode(b'SUMMARY:test\r\n') == b'SUMMARY:test\r\n'
+    assert ical.encode('X:' + 'a' * 73) == b'X:' + b'a' * 73 + b'\r\n'
+
+
+def test_lines_are_folded_at_75_octets():
+    line = 'DESCRIPTION:' + 'abcdefghij' * 30
+    encoded = ical.encode(line)
+
+    lines = encoded.split(b'\r\n')
+    assert lines[-1] == b''
+    assert len(lines[0]) == 75
+    assert all(len(l) <= 75 for l in lines)
+    assert all(l.startswith(b' ') for l in lines[1:-1])
+    assert _unfold(encoded) == line.encode('utf-8') + b'\r\n'
+
+
+def test_folding_does_not_split_multibyte_sequences():
+    for prefix in range(4):
+        line = 'SUMMARY:' + 'x' * prefix + '€ü' * 60
+        encoded = ical.encode(line)
+
+        for l in encoded.split(b'\r\n'):
+            assert len(l) <= 75
+            l.decode('utf-8')
+        assert _unfold(encoded).decode('utf-8') == line + '\r\n'
+
+
+def test_text_escaping():
+    assert ical.TEXT('a\\b;c,d\ne\r\nf\rg:h') == 'a\\\\b\\;c\\,d\\ne\\nf\\ng:h'
+    assert ical.TEXT(b'caf\xc3\xa9') == 'café'
+    assert ical.TEXT(42) == '42'
+
+
+def test_values_formats():
+    rome = pytz.timezone('Europe/Rome')
+    assert ical.DATE_TIME(datetime(2019, 7, 8, 9, 30)) == '20190708T093000'
+    assert ical.DATE_TIME(rome.localize(datetime(2019, 7, 8, 9, 30))) == '20190708T073000Z'
+    assert ical.DURATION(timedelta(days=1, hours=2, minutes=3, seconds=4)) == 'P1DT2H3M4S'
+
+
+def test_calendar_is_well_formed():
+    data = ical.serialize(_calendar(2))
+    lines = _unfold(data).decode('utf-8').split('\r\n')
+
+    assert data.endswith(b'\r\n')
+    assert lines[0] == 'BEGIN:VCALENDAR'
+    assert lines[-2:] == ['END:VCALENDAR', '']
+    assert 'VERSION:2.0' in lines
+    assert 'PRODID:test' in lines
+    assert 'X-PUBLISHED-TTL:P0DT1H0M0S' in lines
+    assert lines.count('BEGIN:VEVENT') == lines.count('END:VEVENT') == 2
+    assert 'DTSTART:20190708T090000Z' in lines
+    assert 'SUMMARY;ALTREP="https://ep2019.europython.eu/talk-0":Talk 0\\, ünïcode' in lines
+    assert 'ORGANIZER;CN=EuroPython:mailto:info@europython.eu' in lines
+
+
+def test_stream_matches_serialize():
+    cal = _calendar(3)
+    events = [ical.serialize(e) for e in cal.subcomponents]
+
+    header = _calendar(0)
+    assert b''.join(ical.stream(header, events)) == ical.serialize(cal)
+
+
+def test_thousand_events_calendar():
+    cal = _calendar(1000)
+
+    start = time.perf_counter()
+    data = ical.serialize(cal)
+    elapsed = time.perf_counter() - start
+
+    lines = data.split(b'\r\n')
+    assert max(len(l) for l in lines) <= 75
+    assert _unfold(data).count(b'BEGIN:VEVENT') == 1000
+    data.decode('utf-8')
+    # ~2.8MB of output, it takes a fraction of this on a laptop
+    assert elapsed < 5
@@ -0,0 +1,95 @@
+import random
+from datetime import datetime, timedelta
+
+from conference.intervals import IntervalIndex, intersection_counts, overlap
+from conference.models import Event
+
+
+class FakeEvent(object):
+    def __init__(self, start, duration):
+        self.start = start
+        self.duration = duration
+
+    def __repr__(self):
+        return 'FakeEvent(%s, %s)' % (self.start, self.duration)
+
+    def get_duration(self):
+        return self.duration
+
+    def get_time_range(self):
+        return self.start, self.start + timedelta(minutes=self.duration)
+
+
+def _random_events(n, seed):
+    rnd = random.Random(seed)
+    day = datetime(2019, 7, 10, 8, 0)
+    return [
+        FakeEvent(
+            day + timedelta(days=rnd.randint(0, 2), minutes=rnd.randrange(0, 600, 15)),
+            rnd.choice([0, 15, 30, 45, 60, 180]))
+        for _ in range(n)
+    ]
+
+
+def _pairwise_counts(ranges):
+    counts = [0] * len(ranges)
+    for ix, r1 in enumerate(ranges):
+        for jx, r2 in enumerate(ranges):
+            if ix != jx and overlap(r1, r2):
+                counts[ix] += 1
+    return counts
+
+
+def _quadratic_group_events_by_times(events, event=None):
+    # the original implementation, kept as a reference
+    def extract_group(event, events):
+        group = []
+        r0 = event.get_time_range()
+        for ix in reversed(list(range(len(events)))):
+            r1 = events[ix].get_time_range()
+            if r0[0].date() == r1[0].date() and overlap(r0, r1):
+                group.append(events.pop(ix))
+        return group
+
+    if event:
+        yield extract_group(event, list(events))
+    else:
+        sorted_events = sorted(
+            [x for x in events if x.get_duration() > 0],
+            key=lambda x: x.get_duration())
+        while sorted_events:
+            evt0 = sorted_events.pop()
+            yield [evt0] + extract_group(evt0, sorted_events)
+
+
+def test_overlap():
+    t = datetime(2019, 7, 10, 10, 0)
+    m = timedelta(minutes=30)
+
+    assert overlap((t, t + m), (t + m / 2, t + 2 * m))
+    assert not overlap((t, t + m), (t + m, t + 2 * m))
+    assert not overlap((t, t + 2 * m), (t + m, t + m))
+
+
+def test_intersection_counts_match_pairwise_comparison():
+    for seed in range(10):
+        ranges = [e.get_time_range() for e in _random_events(80, seed)]
+        assert intersection_counts(ranges) == _pairwise_counts(ranges)
+
+
+def test_index_returns_overlapping_items_in_input_order():
+    events = _random_events(100, 42)
+    index = IntervalIndex(events, key=lambda e: e.get_time_range())
+    for e in events:
+        r = e.get_time_range()
+        assert index.overlapping(r) == [x for x in events if overlap(r, x.get_time_range())]
+
+
+def test_group_events_by_times_is_unchanged():
+    for seed in range(10):
+        events = _random_events(60, seed)
+        assert list(Event.objects.group_events_by_times(events)) == \
+            list(_quadratic_group_events_by_times(events))
+        for e in events:
+            assert list(Event.objects.group_events_by_times(events, event=e)) == \
+                list(_quadratic_group_events_by_times(events, event=e))
@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from pytest import mark
+
+from django.core import mail
+from django.utils import timezone
+
+from assopy.stripe.tests.factories import UserFactory
+from conference import mailing
+from conference.forms import AdminSendMailForm
+from conference.models import MailJob, MailJobRecipient
+from conference.tests.factories.conference import ConferenceFactory
+
+
+def _job(count, **kw):
+    conference = ConferenceFactory()
+    users = [UserFactory() for _ in range(count)]
+    job = mailing.create_job(
+        conference.code,
+        'staff@example.com',
+        'Hello {{ user.email }}',
+        'Welcome to {{ conf.name }}, {{ tickets|length }} tickets',
+        [u.id for u in users] + [users[0].id],
+        **kw
+    )
+    return job, users
+
+
+@mark.django_db
+def test_job_is_sent_in_batches(mocker):
+    job, users = _job(5)
+    sleep = mocker.patch('conference.mailing.time.sleep')
+
+    assert mailing.run_job(job.id, batch_size=2, rate=1000) == 5
+    assert sorted(m.to[0] for m in mail.outbox) == sorted(u.email for u in users)
+    assert mail.outbox[0].subject == 'Hello %s' % mail.outbox[0].to[0]
+    assert mail.outbox[0].body.endswith(', 0 tickets')
+    assert sleep.call_count <= 3
+
+    job.refresh_from_db()
+    assert job.status == MailJob.STATUS.DONE
+    assert job.finished is not None
+    assert job.progress() == {'pending': 0, 'sent': 5, 'failed': 0, 'total': 5}
+
+
+@mark.django_db
+def test_interrupted_job_sends_only_the_pending_messages():
+    job, users = _job(4)
+    job.recipients.filter(user__in=users[:3]).update(status=MailJobRecipient.STATUS.SENT)
+    # the process sending the job died long ago
+    MailJob.objects.filter(id=job.id).update(
+        status=MailJob.STATUS.SENDING, heartbeat=timezone.now() - timedelta(hours=1))
+
+    assert mailing.resume_jobs() == [job.id]
+    assert [m.to for m in mail.outbox] == [[users[3].email]]
+    assert mailing.resume_jobs() == []
+
+
+@mark.django_db
+def test_job_being_sent_is_not_claimed_twice():
+    job, _ = _job(2)
+    assert mailing.claim_job(job.id)
+
+    assert mailing.run_job(job.id) is None
+    assert mail.outbox == []
+
+
+@mark.django_db
+def test_failed_messages_are_retried(mocker):
+    job, users = _job(3)
+    send = mail.EmailMessage.send
+    broken = users[1].email
+
+    def flaky_send(self, *args, **kw):
+        if self.to == [broken]:
+            raise OSError('connection reset')
+        return send(self, *args, **kw)
+
+    mocker.patch.object(mail.EmailMessage, 'send', flaky_send)
+    mocker.patch('conference.mailing.settings.ADMIN_MASS_MAIL_ATTEMPTS', 2)
+
+    assert mailing.run_job(job.id, batch_size=10) == 2
+    failed = job.recipients.get(user=users[1])
+    assert failed.status == MailJobRecipient.STATUS.FAILED
+    assert failed.attempts == 2
+    assert failed.error == 'connection reset'
+    assert job.progress()['failed'] == 1
+
+
+@mark.django_db
+def test_feedback_lists_the_recipients():
+    job, users = _job(2, feedback_address='admin@example.com')
+
+    mailing.run_job(job.id)
+
+    feedback = mail.outbox[-1]
+    assert feedback.to == ['admin@example.com']
+    for u in users:
+        assert u.email in feedback.body
+
+
+@mark.django_db
+def test_form_preview_and_send():
+    ConferenceFactory()
+    users = [UserFactory() for _ in range(2)]
+    form = AdminSendMailForm(data={
+        'from_': 'staff@example.com',
+        'subject': 'Hi {{ user.first_name }}',
+        'body': 'body',
+    })
+    assert form.is_valid()
+
+    preview = form.preview(users[0].id)
+    assert preview == [('Hi %s' % users[0].first_name, 'body', users[0])]
+
+    job = form.send_emails([u.id for u in users], 'admin@example.com', created_by=users[0])
+    assert job.created_by == users[0]
+    assert job.recipients.count() == 2
@@ -0,0 +1,71 @@
+from pytest import fixture, mark, raises
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import override_settings
+
+from assopy.stripe.tests.factories import UserFactory
+from conference import markup
+from conference.models import MultilingualContent
+from conference.templatetags.conference import markdown2
+
+
+@fixture(autouse=True)
+def empty_caches():
+    markup._local.clear()
+    yield
+    markup._local.clear()
+
+
+def test_render_markdown():
+    assert markup.render_markdown('*hi*') == '<p><em>hi</em></p>\n'
+    assert markup.render_markdown('') == ''
+    assert markdown2('<b>hi</b>') == '<p>&lt;b&gt;hi&lt;/b&gt;</p>\n'
+    assert markdown2('<b>hi</b>', 'nosafe') == '<p><b>hi</b></p>\n'
+    assert markdown2('"hi"', 'smarty-pants') == '<p>&#8220;hi&#8221;</p>\n'
+    with raises(ValueError):
+        markup.render_markdown('hi', safe_mode='remove')
+
+
+def test_cache_key_depends_on_the_options():
+    keys = set([
+        markup.cache_key('hi'),
+        markup.cache_key('hi', safe_mode=None),
+        markup.cache_key('hi', ('smarty-pants',)),
+        markup.cache_key('hi', ('smarty-pants', 'code-color')),
+        markup.cache_key('hi!'),
+    ])
+    assert len(keys) == 5
+
+
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_render_markdown_is_cached(mocker):
+    spy = mocker.spy(markup, '_converter')
+    html = markup.render_markdown('*hi*', ('smarty-pants',))
+    assert markup.render_markdown('*hi*', ('smarty-pants',)) == html
+    assert spy.call_count == 1
+
+    # the shared cache is used by the other processes
+    markup._local.clear()
+    assert markup.render_markdown('*hi*', ('smarty-pants',)) == html
+    assert spy.call_count == 1
+
+    markup.render_markdown('*hi*', ('smarty-pants',), safe_mode=None)
+    assert spy.call_count == 2
+
+
+@mark.django_db(transaction=True)
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_multilingual_content_is_rendered_when_saved():
+    user = UserFactory()
+    MultilingualContent.objects.create(
+        content_type=ContentType.objects.get_for_model(user),
+        object_id=user.pk,
+        language='en',
+        content='bios',
+        body='A *new* bio')
+
+    for extras in markup.settings.MARKDOWN_PRERENDER_EXTRAS:
+        k = markup.cache_key('A *new* bio', extras)
+        assert cache.get(k) == '<p>A <em>new</em> bio</p>\n'
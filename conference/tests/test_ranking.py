@@ -0,0 +1,204 @@
+import os
+import random
+import re
+import subprocess
+import sys
+from datetime import timedelta
+
+import numpy
+from pytest import mark
+
+import conference
+from assopy.stripe.tests.factories import UserFactory
+from conference import ranking, settings, utils
+from conference.models import Talk, TalkPreferences, VotoTalk
+from conference.talk_voting import VotingOptions, update_vote
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.talk import TalkFactory
+
+
+VOTEENGINE_DIR = os.path.join(
+    os.path.dirname(conference.__file__), 'tools', 'voteengine-0.99')
+
+# voteengine is written for python 2, where `from string import *` brings in
+# the string functions it uses
+VOTEENGINE_MAIN = """
+import string, sys
+names = ['find', 'index', 'join', 'ljust', 'lower', 'lstrip', 'rjust', 'split', 'strip']
+for name in names:
+    setattr(string, name, getattr(str, name))
+string.join = lambda words, sep=' ': sep.join(words)
+string.__all__ = list(string.__all__) + names
+sys.path.insert(0, '.')
+sys.argv = ['voteengine.py']
+import votemain
+votemain.vote_engine()
+"""
+
+
+def _voteengine(vinput):
+    """
+    Runs the vendored voteengine.py on the output of
+    `_input_for_ranking_of_talks` and returns the ids of the ranked talks,
+    like ranking_of_talks used to do.
+    """
+    out = subprocess.run(
+        [sys.executable, '-c', VOTEENGINE_MAIN],
+        input=vinput.encode('utf-8'),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=VOTEENGINE_DIR,
+        check=True,
+    ).stdout.decode('utf-8')
+    return [int(tid) for tid in re.findall(r'\d+', out.split('\n')[-2])]
+
+
+def _vote(seed, talks, users, density=0.6):
+    rnd = random.Random(seed)
+    for user in users:
+        for talk in talks:
+            if rnd.random() < density:
+                VotoTalk.objects.create(user=user, talk=talk, vote=rnd.randint(1, 10))
+
+
+def _talks(count):
+    ConferenceFactory()
+    talks = [TalkFactory(status='proposed') for _ in range(count)]
+    # distinct creation dates, to make the tie order explicit
+    for ix, t in enumerate(talks):
+        Talk.objects.filter(id=t.id).update(created=t.created - timedelta(days=ix % 7, seconds=ix))
+    return list(Talk.objects.filter(id__in=[t.id for t in talks]))
+
+
+@mark.django_db
+def test_ranking_matches_voteengine():
+    talks = _talks(12)
+    users = [UserFactory() for _ in range(15)]
+    for seed in range(5):
+        VotoTalk.objects.all().delete()
+        _vote(seed, talks, users, density=0.2 + seed * 0.15)
+        for missing_vote in (0, 5):
+            expected = _voteengine(
+                utils._input_for_ranking_of_talks(talks, missing_vote=missing_vote))
+            result = utils.ranking_of_talks(talks, missing_vote=missing_vote)
+            assert [t.id for t in result] == expected
+
+
+@mark.django_db
+def test_ranking_without_votes_follows_creation_date():
+    talks = _talks(5)
+
+    assert utils.ranking_of_talks(talks) == ranking.tie_order(talks)
+    assert utils.ranking_of_talks([]) == []
+
+
+def test_pairwise_matrix_counts_preferences():
+    scores = numpy.array([
+        [3, 1, 2],
+        [1, 1, 5],
+        [2, 2, 2],
+    ])
+
+    assert ranking.pairwise_matrix(scores).tolist() == [
+        [0, 1, 1],
+        [0, 0, 0],
+        [1, 2, 0],
+    ]
+
+
+def test_widest_paths_matches_floyd_warshall():
+    rnd = numpy.random.RandomState(0)
+    m = rnd.randint(-20, 20, size=(30, 30))
+    expected = m.tolist()
+    n = len(expected)
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                expected[i][j] = max(expected[i][j], min(expected[i][k], expected[k][j]))
+
+    assert ranking.widest_paths(m).tolist() == expected
+
+
+def test_schulze_order_breaks_ties_in_tie_order():
+    # a cycle between 0, 1 and 2, each with the same strength
+    p = numpy.array([
+        [0, 2, 1],
+        [1, 0, 2],
+        [2, 1, 0],
+    ])
+
+    assert ranking.schulze_order(p) == [0, 1, 2]
+    assert ranking.schulze_order(p[::-1, ::-1]) == [0, 1, 2]
+
+
+def _stored_pairwise(conference, talks):
+    tids, p = ranking.load_preferences(TalkPreferences.objects.get(conference=conference))
+    rows = [tids.index(t.id) for t in ranking.tie_order(talks)]
+    return p[numpy.ix_(rows, rows)].tolist()
+
+
+@mark.django_db
+def test_update_vote_keeps_the_preferences_up_to_date():
+    talks = _talks(8)
+    conference = talks[0].conference
+    users = [UserFactory() for _ in range(6)]
+    _vote(0, talks, users[:3])
+    ranking.build_preferences(conference)
+
+    rnd = random.Random(1)
+    options = [VotingOptions.no_vote, VotingOptions.not_interested,
+               VotingOptions.maybe, VotingOptions.want_to_see, VotingOptions.must_see]
+    for _ in range(60):
+        update_vote(rnd.choice(users), rnd.choice(talks), rnd.choice(options))
+
+    expected = ranking.pairwise_matrix(ranking.ballots(
+        ranking.tie_order(talks), missing_vote=settings.TALKS_RANKING_MISSING_VOTE))
+    assert _stored_pairwise(conference, talks) == expected.tolist()
+    assert ranking.live_ranking(conference) == ranking.ranking_of_talks(
+        talks, missing_vote=settings.TALKS_RANKING_MISSING_VOTE)
+
+
+@mark.django_db
+def test_live_ranking_includes_new_talks():
+    talks = _talks(3)
+    conference = talks[0].conference
+    user = UserFactory()
+    first = talks[0]
+    update_vote(user, first, VotingOptions.must_see)
+
+    late = TalkFactory(conference=conference, status='proposed')
+    update_vote(user, late, VotingOptions.want_to_see)
+    talks = list(Talk.objects.proposed(conference))
+
+    assert ranking.live_ranking(conference) == ranking.ranking_of_talks(
+        talks, missing_vote=settings.TALKS_RANKING_MISSING_VOTE)
+    assert ranking.live_ranking(conference)[:2] == [first, late]
+
+
+def test_vote_delta_changes_one_row_and_column():
+    scores = numpy.array([5., 3., 7., 5.])
+    row, col = ranking.vote_delta(scores, 0, 5., 8.)
+
+    assert row.tolist() == [0, 0, 1, 1]
+    assert col.tolist() == [0, 0, -1, 0]
+
+
+@mark.django_db
+def test_votes_on_talks_not_proposed_leave_the_preferences_alone(mocker):
+    talks = _talks(3)
+    conference = talks[0].conference
+    user = UserFactory()
+    update_vote(user, talks[0], VotingOptions.must_see)
+    accepted = TalkFactory(conference=conference, status='accepted')
+    build = mocker.spy(ranking, 'build_preferences')
+    lock = mocker.spy(ranking, 'lock_preferences')
+
+    vote = update_vote(user, accepted, VotingOptions.maybe)
+    assert VotoTalk.objects.get(user=user, talk=accepted) == vote
+    vote = update_vote(user, accepted, VotingOptions.must_see)
+    assert VotoTalk.objects.get(user=user, talk=accepted).vote == VotingOptions.must_see
+    assert update_vote(user, accepted, VotingOptions.no_vote) is None
+    assert not VotoTalk.objects.filter(user=user, talk=accepted).exists()
+
+    assert build.call_count == lock.call_count == 0
+    assert ranking.live_ranking(conference)[0] == talks[0]
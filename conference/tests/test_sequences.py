@@ -0,0 +1,123 @@
+import random
+import threading
+from datetime import date
+from decimal import Decimal
+
+from freezegun import freeze_time
+from pytest import mark, raises
+
+from django.db import OperationalError, connection, transaction
+
+from assopy.models import Invoice, Order, Vat
+from assopy.stripe.tests.factories import AssopyUserFactory
+from conference import sequences
+from conference.invoicing import (
+    REAL_INVOICE_PREFIX,
+    next_invoice_code_for_year,
+    reserve_invoice_codes_for_year,
+)
+from conference.models import CodeSequence
+from conference.orders import next_order_code_for_year
+
+
+@mark.django_db
+def test_reserve_hands_out_consecutive_numbers():
+    assert sequences.reserve('T/', 2019) == 1
+    assert sequences.reserve('T/', 2019, count=3) == 2
+    assert sequences.reserve('T/', 2019) == 5
+    assert sequences.reserve('T/', 2018) == 1
+    assert sequences.reserve('X/', 2019, initial=lambda: 41) == 42
+
+
+@mark.django_db
+def test_rolled_back_numbers_are_given_out_again():
+    sequences.reserve('T/', 2019)
+    with raises(ValueError):
+        with transaction.atomic():
+            sequences.reserve('T/', 2019, count=2)
+            raise ValueError()
+
+    assert sequences.reserve('T/', 2019) == 2
+
+
+@mark.django_db
+def test_invoice_codes_continue_the_existing_ones():
+    # Order.objects.create is overloaded by the OrderManager
+    order = Order(user=AssopyUserFactory(), code='O/19.0001')
+    order.save()
+    Invoice.objects.create(
+        code='I/19.0041',
+        order=order,
+        emit_date=date(2019, 5, 1),
+        price=Decimal(10),
+        vat=Vat.objects.create(value=10),
+        exchange_rate_date=date(2019, 5, 1),
+    )
+
+    assert next_invoice_code_for_year(REAL_INVOICE_PREFIX, 2019) == 'I/19.0042'
+    assert reserve_invoice_codes_for_year(REAL_INVOICE_PREFIX, 2019, count=2) == [
+        'I/19.0043', 'I/19.0044']
+    assert next_invoice_code_for_year(REAL_INVOICE_PREFIX, 2018) == 'I/18.0001'
+
+
+@mark.django_db
+def test_order_codes_continue_the_existing_ones():
+    with freeze_time('2019-05-01'):
+        Order(user=AssopyUserFactory(), code='O/19.0007').save()
+
+    assert next_order_code_for_year(2019) == 'O/19.0008'
+    assert next_order_code_for_year(2019) == 'O/19.0009'
+
+
+@mark.django_db(transaction=True)
+def test_concurrent_reservations_have_no_duplicates_or_holes():
+    committed = []
+    errors = []
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        try:
+            for _ in range(20):
+                count = rnd.randint(1, 3)
+                fail = rnd.random() < 0.2
+                while True:
+                    try:
+                        with transaction.atomic():
+                            first = sequences.reserve('S/', 2019, count=count)
+                            if fail:
+                                raise ValueError()
+                    except ValueError:
+                        break
+                    except OperationalError:
+                        # sqlite refuses concurrent writers, try again
+                        continue
+                    committed.extend(range(first, first + count))
+                    break
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert committed
+    assert sorted(committed) == list(range(1, len(committed) + 1))
+    assert CodeSequence.objects.get(prefix='S/', year=2019).value == len(committed)
+
+
+@mark.django_db
+@freeze_time('2019-05-01')
+def test_failed_order_creation_gives_the_code_back(mocker):
+    user = AssopyUserFactory()
+    mocker.patch('assopy.models.order_created.send', side_effect=ValueError)
+    with raises(ValueError):
+        Order.objects.create(user=user, payment='cc', items=[])
+    mocker.stopall()
+
+    assert not Order.objects.exists()
+    assert next_order_code_for_year(2019) == 'O/19.0001'
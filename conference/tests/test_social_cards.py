@@ -0,0 +1,71 @@
+from pytest import fixture, mark
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from conference import social_cards
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.talk import TalkFactory
+
+
+@fixture
+def media(settings, tmpdir):
+    settings.MEDIA_ROOT = str(tmpdir)
+    return tmpdir
+
+
+def _store_card(talk):
+    path = social_cards.card_path(talk, *social_cards.card_content(talk))
+    default_storage.save(path, ContentFile(b'png'))
+    return path
+
+
+@mark.django_db
+def test_card_path_follows_the_content():
+    ConferenceFactory()
+    talk = TalkFactory(status='proposed')
+    path = social_cards.card_path(talk, 'A title', 'A speaker')
+
+    assert path.startswith('social_cards/%s/%s-' % (talk.id, talk.slug))
+    assert path == social_cards.card_path(talk, 'A title', 'A speaker')
+    assert path != social_cards.card_path(talk, 'A new title', 'A speaker')
+    assert path != social_cards.card_path(talk, 'A title', 'Another speaker')
+
+
+@mark.django_db
+def test_remove_cards_keeps_the_current_one(media):
+    ConferenceFactory()
+    talk = TalkFactory(status='proposed')
+    old = 'social_cards/%s/old.png' % talk.id
+    default_storage.save(old, ContentFile(b'png'))
+    current = _store_card(talk)
+
+    social_cards.remove_cards(talk.id, keep=current)
+    assert not default_storage.exists(old)
+    assert default_storage.exists(current)
+
+    social_cards.remove_cards(talk.id)
+    assert not default_storage.exists(current)
+    # nothing stored, nothing to do
+    social_cards.remove_cards(talk.id)
+
+
+@mark.django_db
+def test_stale_cards_are_removed_when_the_talk_changes(media):
+    ConferenceFactory()
+    talk = TalkFactory(status='proposed')
+    old = _store_card(talk)
+
+    talk.title = 'Something else'
+    talk.save()
+    assert not default_storage.exists(old)
+
+    current = _store_card(talk)
+    talk.save()
+    assert default_storage.exists(current)
+
+    talk_id = talk.id
+    talk.delete()
+    assert not default_storage.exists(current)
+    assert not social_cards.render_cards([], base_url='/')
+    assert default_storage.listdir('social_cards/%s' % talk_id) == ([], [])
@@ -3,7 +3,6 @@ import json
 import logging
 import os.path
 import re
-import subprocess
 import tempfile
 from collections import defaultdict
 
@@ -11,7 +10,7 @@ from django.conf import settings as dsettings
 from django.core.mail import send_mail as real_send_mail
 from django.core.urlresolvers import reverse
 
-from conference import settings
+from conference import ranking, settings
 from conference.models import VotoTalk, EventTrack
 
 
@@ -91,22 +90,10 @@ def _input_for_ranking_of_talks(talks, missing_vote=5):
     return '\n'.join(vinput)
 
 def ranking_of_talks(talks, missing_vote=5):
-    import conference
-    vengine = os.path.join(os.path.dirname(conference.__file__), 'tools', 'voteengine-0.99', 'voteengine.py')
-
-    talks_map = dict((t.id, t) for t in talks)
-    in_ = _input_for_ranking_of_talks(list(talks_map.values()), missing_vote=missing_vote)
-
-    pipe = subprocess.Popen(
-        [vengine],
-        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        close_fds=True
-    )
-    out, err = pipe.communicate(in_)
-    if pipe.returncode != 0:
-        raise RuntimeError("voteengine.py exits with code: %s; %s" % (pipe.returncode, err))
-
-    return [ talks_map[int(tid)] for tid in re.findall(r'\d+', out.split('\n')[-2]) ]
+    """
+    Returns the talks ordered by the results of the voting (schulze method).
+    """
+    return ranking.ranking_of_talks(talks, missing_vote=missing_vote)
 
 def voting_results():
     """
@@ -132,6 +119,7 @@ def voting_results():
     return None
 
 from datetime import datetime, date, timedelta, time
+from conference.intervals import intersection_counts
 from conference.models import Event, Track
 
 class TimeTable2(object):
@@ -225,25 +213,14 @@ class TimeTable2(object):
             return
         # step 1 - I try "stacked" events
         for t in self._tracks:
-            events = {}
-            timeline = []
-            for e in self.events.get(t, []):
-                row = (e['time'], e['time'] + timedelta(seconds=e['duration'] * 60), e['id'])
-                events[e['id']] = e
-                timeline.append(row)
-            for ix, e1 in enumerate(timeline):
-                for e2 in timeline[ix+1:]:
-                    # http://stackoverflow.com/questions/9044084/efficient-data-range-overlap-calculation-in-python
-                    latest_start = max(e1[0], e2[0])
-                    earliest_end = min(e1[1], e2[1])
-                    overlap = (earliest_end - latest_start)
-                    if overlap.seconds > 0 and overlap.days >= 0:
-                        for eid in (e1[2], e2[2]):
-                            e = events[eid]
-                            try:
-                                e['intersection'] += 1
-                            except KeyError:
-                                e['intersection'] = 1
+            events = self.events.get(t, [])
+            ranges = [
+                (e['time'], e['time'] + timedelta(seconds=e['duration'] * 60))
+                for e in events
+            ]
+            for e, count in zip(events, intersection_counts(ranges)):
+                if count:
+                    e['intersection'] = e.get('intersection', 0) + count
         self._analyzed = True
 
     def iterOnTracks(self, start=None):
@@ -637,7 +614,6 @@ def render_event_video_cover(eid, thumb=(256, 256)):
     import os
     import os.path
     from conference import dataaccess
-    from conference import settings
     from django.conf import settings as dsettings
 
     event = dataaccess.event_data(eid)
@@ -675,10 +651,13 @@ def archive_dir(directory):
     tar.close()
     return archive.getvalue()
 
-def timetables2ical(tts, altf=lambda d, comp: d):
+def event2ical(e, altf=lambda d, comp: d):
+    """
+    Returns the VEVENT of an event (as returned by dataaccess.event_data),
+    already encoded; `altf` can change the properties of the event.
+    """
     from conference import ical
     from conference import dataaccess
-    from datetime import timedelta
     from django.utils.html import strip_tags
 
     import pytz
@@ -686,48 +665,41 @@ def timetables2ical(tts, altf=lambda d, comp: d):
     utc = pytz.utc
     tz = timezone(dsettings.TIME_ZONE)
 
-    cal = altf({
-        'uid': '1',
-        'events': [],
-    }, 'calendar')
-    for tt in tts:
-        sdata = dataaccess.schedule_data(tt.sid)
-        for time, events in tt.iterOnTimes():
-            uniq = set()
-            for e in events:
-                if e['id'] in uniq:
-                    continue
-                uniq.add(e['id'])
-                track = strip_tags(sdata['tracks'][e['tracks'][0]].title)
-                # iCal supports dates in a different timezone to UTC through TZID parameter:
-                # DTSTART;TZID=Europe/Rome:20120702T093000
-                #
-                # So, decided to convert the time in UTC.
-                start = utc.normalize(tz.localize(e['time']).astimezone(utc))
-                end = utc.normalize(tz.localize(e['time'] + timedelta(seconds=e['duration']*60)).astimezone(utc))
-                ce = {
-                    'uid': e['id'],
-                    'start': start,
-                    #'duration': timedelta(seconds=e['duration']*60),
-                    'end': end,
-                    'location': 'Track: %s' % track,
-                }
-                if e['talk']:
-                    url = dsettings.DEFAULT_URL_PREFIX + reverse('conference-talk', kwargs={'slug': e['talk']['slug']})
-                    ce['summary'] = (e['talk']['title'], {'ALTREP': url})
-                else:
-                    ce['summary'] = e['name']
-                cal['events'].append(ical.Event(**altf(ce, 'event')))
-    return ical.Calendar(**cal)
+    # iCal supports dates in a different timezone to UTC through TZID parameter:
+    # DTSTART;TZID=Europe/Rome:20120702T093000
+    #
+    # So, decided to convert the time in UTC.
+    start = utc.normalize(tz.localize(e['time']).astimezone(utc))
+    end = utc.normalize(tz.localize(e['end_time']).astimezone(utc))
+    ce = {
+        'uid': e['id'],
+        'start': start,
+        'end': end,
+    }
+    if e['tracks']:
+        sdata = dataaccess.schedule_data(e['schedule_id'])
+        track = strip_tags(sdata['tracks'][e['tracks'][0]].title)
+        ce['location'] = 'Track: %s' % track
+    if e['talk']:
+        url = dsettings.DEFAULT_URL_PREFIX + reverse('conference-talk', kwargs={'slug': e['talk']['slug']})
+        ce['summary'] = (e['talk']['title'], {'ALTREP': url})
+    else:
+        ce['summary'] = e['name']
+    return ical.serialize(ical.Event(**altf(ce, 'event')))
 
 def conference2ical(conf, altf=lambda d, comp: d):
-    from conference import models
+    """
+    Yields the iCal of the conference, one (encoded) VEVENT at a time.
+    """
+    from conference import ical
+    from conference import dataaccess
 
-    sids = models.Schedule.objects\
-        .filter(conference=conf)\
-        .values_list('id', flat=True)
-    tts = list(map(TimeTable2.fromSchedule, sids))
-    return timetables2ical(tts, altf=altf)
+    cal = ical.Calendar(**altf({
+        'uid': '1',
+        'events': [],
+    }, 'calendar'))
+    events = sorted(dataaccess.events(conf=conf), key=lambda e: (e['time'], e['id']))
+    return ical.stream(cal, (event2ical(e, altf=altf) for e in events))
 
 def oembed(url, **kw):
     for pattern, sub in settings.OEMBED_URL_FIX:
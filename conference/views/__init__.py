@@ -201,47 +201,48 @@ def schedule_event_interest(request, conference, slug, eid):
 @render_to_json
 def schedule_event_booking(request, conference, slug, eid):
     evt = get_object_or_404(models.Event, schedule__conference=conference, schedule__slug=slug, id=eid)
-    status = models.EventBooking.objects.booking_status(evt.id)
     if request.method == 'POST':
         fc = utils.dotted_import(settings.FORMS['EventBooking'])
         form = fc(event=evt.id, user=request.user.id, data=request.POST)
         if form.is_valid():
             if form.cleaned_data['value']:
-                models.EventBooking.objects.book_event(evt.id, request.user.id)
-                if request.user.id not in status['booked']:
-                    status['booked'].append(request.user.id)
+                try:
+                    models.EventBooking.objects.book_event(evt.id, request.user.id)
+                except models.EventBooking.SoldOut:
+                    # the last seat has been taken after the form validation
+                    return http.HttpResponseBadRequest('sold out')
             else:
                 models.EventBooking.objects.cancel_reservation(evt.id, request.user.id)
-                try:
-                    status['booked'].remove(request.user.id)
-                except ValueError:
-                    pass
         else:
             try:
                 msg = str(form.errors['value'][0])
             except:
                 msg = ""
             return http.HttpResponseBadRequest(msg)
+    status = models.EventBooking.objects.booking_status(evt.id)
     return {
-        'booked': len(status['booked']),
+        'booked': status['booked'],
         'available': max(status['available'], 0),
         'seats': status['seats'],
-        'user': request.user.id in status['booked'],
+        'user': models.EventBooking.objects.filter(event=evt, user=request.user).exists(),
     }
 
 
 @render_to_json
 def schedule_events_booking_status(request, conference):
     data = dataaccess.conference_booking_status(conference)
-    uid = request.user.id if request.user.is_authenticated else 0
-    for k, v in data.items():
-        if uid and uid in v['booked']:
-            v['user'] = True
-        else:
-            v['user'] = False
-        del v['booked']
-    return dat
-    a
+    if request.user.is_authenticated:
+        booked = set(models.EventBooking.objects\
+            .filter(user=request.user, event__schedule__conference=conference)\
+            .values_list('event', flat=True))
+    else:
+        booked = set()
+    # data comes from the cache, it must not be changed in place
+    return {
+        eid: dict(status, user=eid in booked)
+        for eid, status in data.items()
+    }
+
 
 @render_to_template('conference/schedule.xml')
 def schedule_xml(request, conference, slug):
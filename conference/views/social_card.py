@@ -1,31 +1,15 @@
 from django import http
+from django.core.files.storage import default_storage
 from django.shortcuts import get_object_or_404
-from django.template.loader import render_to_string
-
-from weasyprint import HTML
 
 from conference.models import Talk
+from conference.social_cards import get_card
 
 
 def talk_social_card_png(request, slug):
     talk = get_object_or_404(Talk, slug=slug)
 
-    subtitle = ", ".join(
-        [
-            speaker.user.assopy_user.name()
-            for speaker in talk.speakers.all().select_related(
-                "user__assopy_user"
-            )
-        ]
-    )
-
-    content = render_to_string(
-        "ep19/bs/conference/talk_social_card.html",
-        {"title": talk.title, "subtitle": subtitle},
-    )
-
-    data = HTML(
-        string=content, base_url=request.build_absolute_uri("/")
-    ).write_png()
+    # usually already rendered by the prerender_social_cards command
+    path = get_card(talk, base_url=request.build_absolute_uri("/"))
 
-    return http.HttpResponse(data, content_type="image/png")
+    return http.FileResponse(default_storage.open(path), content_type="image/png")
@@ -1,12 +1,19 @@
 
+import bisect
+import re
+from collections import defaultdict
+
 from conference import cachef
 from conference import dataaccess as cdata
 from conference import models as cmodels
+from conference import utils as cutils
 from assopy import models as amodels
-from assopy import utils as autils
 from p3 import models
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.urlresolvers import reverse
+from django.utils import timezone
 
 
 cache_me = cachef.CacheFunction(prefix='p3:')
@@ -64,7 +71,8 @@ def _i_profile_data(sender, **kw):
 profile_data = cache_me(
     signals=(cdata.profile_data.invalidated,),
     models=(models.P3Profile,),
-    key='profile:%(uid)s')(profile_data, _i_profile_data)
+    key='profile:%(uid)s',
+    local_size=cdata.LOCAL_CACHE_SIZE)(profile_data, _i_profile_data)
 
 
 def talk_data(tid, preload=None):
@@ -87,24 +95,22 @@ def _i_talk_data(sender, **kw):
 talk_data = cache_me(
     signals=(cdata.talk_data.invalidated,),
     models=(models.P3Talk,),
-    key='talk:%(tid)s')(talk_data, _i_talk_data)
-
-def profiles_data(uids):
-    cached = list(zip(uids, profile_data.get_from_cache([ (x,) for x in uids ])))
-    missing = [ x[0] for x in cached if x[1] is cache_me.CACHE_MISS ]
+    key='talk:%(tid)s',
+    local_size=cdata.LOCAL_CACHE_SIZE)(talk_data, _i_talk_data)
 
+def _preload_profiles(uids):
     preload = {}
     profiles = models.P3Profile.objects\
-        .filter(profile__in=missing)\
+        .filter(profile__in=uids)\
         .select_related('profile__user')
     tags = cmodels.ConferenceTaggedItem.objects\
         .filter(
             content_type=ContentType.objects.get_for_model(models.P3Profile),
-            object_id__in=missing
+            object_id__in=uids
         )\
         .values('object_id', 'tag__name')
     speakers = models.SpeakerConference.objects\
-        .filter(speaker__in=missing)
+        .filter(speaker__in=uids)
 
     for p in profiles:
         preload[p.profile_id] = {
@@ -116,16 +122,10 @@ def profiles_data(uids):
     for spk in speakers:
         preload[spk.speaker_id]['speaker'] = spk
 
-    cdata.profiles_data(missing)
-
-    output = []
-    for ix, e in enumerate(cached):
-        pid, val = e
-        if val is cache_me.CACHE_MISS:
-            val = profile_data(pid, preload=preload[pid])
-        output.append(val)
+    cdata.profiles_data(uids)
+    return preload
 
-    return output
+profiles_data = profile_data.many(_preload_profiles)
 
 def _user_ticket(user, conference):
     q1 = user.ticket_set.all()\
@@ -155,12 +155,32 @@ def _ticket_complete(t):
     return (order.method in ('bank', 'admin')) or order.complete()
 
 
+def user_email(uid):
+    """
+    The email of the user, lowercased like the assignments are matched.
+    """
+    email = User.objects.filter(id=uid).values_list('email', flat=True).first()
+    return (email or '').lower()
+
+
+def _i_user_email(sender, **kw):
+    return 'user_email:%s' % (kw['instance'].id,)
+
+user_email = cache_me(
+    models=(User,),
+    key='user_email:%(uid)s')(user_email, _i_user_email)
+
+
 def all_user_tickets(uid, conference):
     """
     Cache-friendly version of user_tickets: returns a list of
         (ticket_id, fare_type, fare_code, complete)
     for each ticket associated to the user.
     """
+    return _all_user_tickets(uid, user_email(uid), conference)
+
+
+def _all_user_tickets(uid, email, conference):
     qs = _user_ticket(User.objects.get(id=uid), conference)
     output = []
     for t in qs:
@@ -177,44 +197,38 @@ def _i_all_user_tickets(sender, **kw):
     I think this _i_ means 'invalidate' (judging by the partial in
     CacheFunction class.
 
-    So it's a signal(?) that invalidates the all_user_tickets caching.
-
-    However this signal doesnt seem to be attached to anything.
-
     NOTE(umgelurgel)(2018-10-20)
     This is connected to using the p3.dataaccess.all_user_tickets call that
     generates the post_save and pre_delete signals in
     conference.cachef.CacheFunction._decorator
+
+    The tickets are cached under the id and the email of the user, so the
+    namespaces come from the instance without any query: an assignment
+    invalidates the current and previous assignees (see p3.listeners) by
+    email, a new ticket its buyer; for the other changes the users involved
+    are not on the instance and the tickets of everyone are invalidated.
     """
     o = kw['instance']
     if sender is models.TicketConference:
-        conference = o.ticket.fare.conference
-        params = [ (o.ticket.user_id, conference) ]
-        if o.assigned_to:
-            try:
-                uid = autils.get_user_account_from_email(o.assigned_to).id
-            except User.DoesNotExist:
-                pass
-            else:
-                params.append((uid, conference))
-    elif sender is cmodels.Ticket:
-        params = [ (o.user_id, o.fare.conference) ]
-    else:
-        uid = o.user.user_id
-        try:
-            conference = o.orderitem_set\
-                .all()\
-                .distinct()\
-                .values('ticket__fare__conference')[0]
-        except IndexError:
-            return []
-        params = [ (uid, conference) ]
-    return [ 'all_user_tickets:%s:%s' % (uid, conference) for uid, conference in params ]
-
-
-all_user_tickets = cache_me(
+        # the tickets of the buyer don't depend on the assignment
+        emails = [o.assigned_to, getattr(o, '_previous_assigned_to', None)]
+        return [ 'all_user_tickets:email:%s' % e.lower() for e in set(emails) if e ]
+    elif kw.get('created'):
+        if sender is cmodels.Ticket:
+            return 'all_user_tickets:%s' % (o.user_id,)
+        # the tickets are added to the order after its creation
+        return []
+    return 'all_user_tickets'
+
+
+_all_user_tickets = cache_me(
     models=(models.TicketConference, cmodels.Ticket, amodels.Order,),
-    key='all_user_tickets:%(uid)s:%(conference)s')(all_user_tickets, _i_all_user_tickets)
+    key='all_user_tickets:%(uid)s:%(email)s:%(conference)s',
+    namespace=(
+        'all_user_tickets',
+        'all_user_tickets:%(uid)s',
+        'all_user_tickets:email:%(email)s',
+    ))(_all_user_tickets, _i_all_user_tickets)
 
 def user_tickets(user, conference, only_complete=False):
     """
@@ -237,44 +251,6 @@ def user_tickets(user, conference, only_complete=False):
                 del tickets[ix]
         return tickets
 
-def conference_users(conference, speakers=True):
-    """
-    Returns the list of all user_ids partecipating to the conference.
-    """
-    ticket_qs = cmodels.Ticket.objects\
-        .filter(fare__conference=conference)\
-        .filter(fare__code__startswith='T')\
-    # Unassigned tickets
-    q1 = User.objects\
-        .filter(id__in=\
-            ticket_qs\
-                .filter(p3_conference__assigned_to__in=(None, ''))\
-                .values_list('user', flat=True)
-        )\
-        .values_list('id', flat=True)
-
-    # Assigned tickets
-    q2 = User.objects\
-        .filter(email__in=\
-            ticket_qs\
-                .exclude(p3_conference__assigned_to=None)\
-                .exclude(p3_conference__assigned_to='')\
-                .values('p3_conference__assigned_to')
-        )\
-        .values_list('id', flat=True)
-
-    if speakers:
-        q3 = User.objects\
-            .filter(id__in=\
-                cmodels.TalkSpeaker.objects\
-                    .filter(talk__conference=conference, talk__status='accepted')\
-                    .values('speaker')
-            )\
-            .values_list('id', flat=True)
-    else:
-        q3 = User.objects.none()
-    return q1 | q2 | q3
-
 def tags():
     """
     Same as `conference.dataaccess.tags` but removing data about
@@ -294,3 +270,300 @@ def tags():
 tags = cache_me(
     signals=(cdata.tags.invalidated,),
     models=(models.P3Profile, cmodels.AttendeeProfile))(tags)
+
+
+def whos_coming_directory(conference):
+    """
+    The partecipants of the conference that show their profile to the
+    others, sorted by name, and the facets used to filter them.
+
+    `keys` are the (first name, last name, user id) of the people, in order,
+    `positions` maps an id to its index in `keys`; the facets are sets of
+    user ids:
+        public -> the profiles visible to everyone
+        speakers -> the speakers of the accepted talks
+        countries -> {iso: (country name, ids)}
+        tags -> {tag name: ids}
+    """
+    attendees = models.ConferenceAttendee.objects.filter(conference=conference)
+    rows = cmodels.AttendeeProfile.objects\
+        .filter(visibility__in=('m', 'p'))\
+        .filter(user__in=attendees.values('user'))\
+        .values_list(
+            'user', 'visibility', 'p3_profile__country',
+            'user__first_name', 'user__last_name')
+
+    keys = []
+    public = set()
+    countries = defaultdict(set)
+    for uid, visibility, country, first_name, last_name in rows:
+        keys.append((first_name, last_name, uid))
+        if visibility == 'p':
+            public.add(uid)
+        if country:
+            countries[country].add(uid)
+    keys.sort()
+    people = set(uid for _, _, uid in keys)
+
+    tags = defaultdict(set)
+    for uid, name in cmodels.ConferenceTaggedItem.objects\
+            .filter(
+                content_type=ContentType.objects.get_for_model(models.P3Profile),
+                object_id__in=attendees.values('user'))\
+            .values_list('object_id', 'tag__name'):
+        if uid in people:
+            tags[name].add(uid)
+
+    names = dict(amodels.Country.objects\
+        .filter(iso__in=list(countries))\
+        .values_list('iso', 'name'))
+    speakers = set(attendees\
+        .filter(speaker=True)\
+        .values_list('user', flat=True))
+
+    return {
+        'keys': keys,
+        'positions': {uid: ix for ix, (_, _, uid) in enumerate(keys)},
+        'public': public,
+        'speakers': speakers & people,
+        'countries': {
+            iso: (names.get(iso, iso), uids)
+            for iso, uids in countries.items()
+        },
+        'tags': dict(tags),
+    }
+
+def _i_whos_coming_directory(sender, **kw):
+    if sender is User and not getattr(kw['instance'], '_name_changed', True):
+        # of the users only the names are in the directory (see
+        # p3.listeners)
+        return None
+    # the conferences of the changed profile are not worth the queries
+    return 'whos_coming_directory'
+
+whos_coming_directory = cache_me(
+    models=(
+        cmodels.AttendeeProfile,
+        cmodels.ConferenceTaggedItem,
+        models.P3Profile,
+        models.ConferenceAttendee,
+        User,
+    ),
+    key='whos_coming_directory:%(conference)s',
+    namespace='whos_coming_directory',
+    serve_stale=True)(whos_coming_directory, _i_whos_coming_directory)
+
+def whos_coming_page(directory, filters=(), after=None, skip=0, size=10):
+    """
+    Returns the ids of the next `size` people of the directory, after the
+    user `after`, that are in every one of `filters` (sets of user ids).
+
+    The cost depends on the size of the page and not on its position.
+    """
+    keys = directory['keys']
+    positions = directory['positions']
+    if after is None:
+        start = 0
+    elif after in positions:
+        start = positions[after] + 1
+    else:
+        # not in the directory anymore, go on from where it was
+        try:
+            first_name, last_name = User.objects\
+                .values_list('first_name', 'last_name')\
+                .get(id=after)
+        except User.DoesNotExist:
+            return []
+        start = bisect.bisect_right(keys, (first_name, last_name, after))
+
+    filters = sorted(filters, key=len)
+    if filters and len(filters[0]) < len(keys) - start:
+        # the smallest filter is quicker to go through than the directory
+        candidates = sorted(
+            positions[uid] for uid in filters[0]
+            if positions.get(uid, -1) >= start)
+        filters = filters[1:]
+    else:
+        candidates = range(start, len(keys))
+
+    output = []
+    for ix in candidates:
+        uid = keys[ix][2]
+        if all(uid in f for f in filters):
+            if skip:
+                skip -= 1
+                continue
+            output.append(uid)
+            if len(output) == size:
+                break
+    return output
+
+
+def event_ical(eid, abstract=False):
+    """
+    Returns the VEVENT of the event, already encoded, as {'vevent': ...};
+    with `abstract` the description of the event is the abstract of the
+    talk.
+    """
+    e = cdata.event_data(eid)
+
+    def altf(data, component):
+        data['uid'] = settings.DEFAULT_URL_PREFIX + '/p3/event/' + str(eid)
+        data['organizer'] = ('mailto:info@europython.eu', {'CN': 'EuroPython'})
+        data['revised'] = now
+        if not isinstance(data['summary'], tuple):
+            # this is a custom event, if it starts with an anchor I can
+            # extract the reference
+            m = re.match(r'<a href="(.*)">(.*)</a>', data['summary'])
+            if m:
+                url = m.group(1)
+                if url.startswith('/'):
+                    url = settings.DEFAULT_URL_PREFIX + url
+                data['summary'] = (m.group(2), {'ALTREP': url})
+        if abstract:
+            if e['talk']:
+                speakers = ", ".join(s['name'] for s in e['talk']['speakers'])
+                data['summary'] = (data['summary'][0] + ' by ' + speakers, data['summary'][1])
+            data['description'] = e['talk']['abstract'] if e['talk'] else e['abstract']
+        return data
+
+    now = timezone.now()
+    return {
+        'vevent': cutils.event2ical(e, altf=altf),
+    }
+
+def _i_event_ical(sender, **kw):
+    # invalidation signal is handled by cachef, the namespace is the key of
+    # event_data
+    return None
+
+event_ical = cache_me(
+    signals=(cdata.event_data.invalidated,),
+    key='event_ical:%(eid)s:%(abstract)s',
+    namespace='event:%(eid)s',
+    serve_stale=True)(event_ical, _i_event_ical)
+
+def events_ical(eids, abstract=False):
+    """
+    Bulk version of event_ical; the cached VEVENTs are read at once and the
+    data of the missing events is loaded with few queries.
+    """
+    eids = list(eids)
+    output = event_ical.get_from_cache(
+        [((eid,), {'abstract': abstract}) for eid in eids])
+    missing = [
+        ix for ix, data in enumerate(output)
+        if data is cachef.CacheFunction.CACHE_MISS
+    ]
+    if missing:
+        cdata.events_data([eids[ix] for ix in missing])
+        for ix in missing:
+            output[ix] = event_ical(eids[ix], abstract=abstract)
+    return output
+
+
+def _live_event(e):
+    if e.get('talk'):
+        url = reverse('conference-talk', kwargs={'slug': e['talk']['slug']})
+        speakers = [
+            (reverse('conference-speaker', kwargs={'slug': s['slug']}), s['name'], s['id'])
+            for s in e['talk']['speakers']
+        ]
+        tags = e['talk']['tags']
+    else:
+        url = None
+        speakers = None
+        tags = []
+    return {
+        'id': e['id'],
+        'name': e['name'],
+        'url': url,
+        'speakers': speakers,
+        'start': e['time'],
+        'end': e['end_time'],
+        'tags': tags,
+        'event': e,
+    }
+
+def live_timeline(conference, date):
+    """
+    The events of a day of the conference for the live pages, None if there
+    is no schedule for that day.
+
+    `tracks` maps a track to the list of its events; `live` maps a track to
+    the start times and the events (the special ones excluded), sorted, to
+    find the current event with live_now.
+    """
+    from conference.utils import TimeTable2
+    try:
+        sid = cmodels.Schedule.objects\
+            .values_list('id', flat=True)\
+            .get(conference=conference, date=date)
+    except cmodels.Schedule.DoesNotExist:
+        return None
+
+    tt = TimeTable2.fromSchedule(sid)
+    tracks = {}
+    live = {}
+    for track in tt._tracks:
+        tracks[track] = []
+    for track, events in tt.iterOnTracks():
+        for e in events:
+            if e.get('talk'):
+                speakers = ', '.join([x['name'] for x in e['talk']['speakers']])
+            else:
+                speakers = None
+            tracks[track].append({
+                'name': e['name'],
+                'time': e['time'],
+                'duration': e['duration'],
+                'tags': e['tags'],
+                'speakers': speakers,
+            })
+        events = [_live_event(e) for e in events if 'special' not in e['tags']]
+        live[track] = ([e['start'].time() for e in events], events)
+    return {
+        'tracks': tracks,
+        'live': live,
+    }
+
+def _i_live_timeline(sender, **kw):
+    return 'live_timeline'
+
+live_timeline = cache_me(
+    models=(
+        cmodels.Schedule,
+        cmodels.Track,
+        cmodels.Event,
+        cmodels.EventTrack,
+        cmodels.Talk,
+        cmodels.TalkSpeaker,
+    ),
+    key='live_timeline:%(conference)s:%(date)s',
+    namespace='live_timeline',
+    local_size=cdata.LOCAL_CACHE_SIZE,
+    serve_stale=True)(live_timeline, _i_live_timeline)
+
+def live_now(timeline, t):
+    """
+    Returns, for every track of the timeline, the event in progress at time
+    `t` (a datetime.time) and the one after it, as a pair; the current event
+    is None when the track is idle, an event still to start is returned as
+    current only if it is the first of the day.
+    """
+    output = {}
+    for track, (starts, events) in timeline['live'].items():
+        if not events:
+            output[track] = (None, None)
+            continue
+        ix = bisect.bisect_left(starts, t)
+        if ix == len(starts):
+            ix -= 1
+        elif starts[ix] != t and ix > 0:
+            ix -= 1
+        curr = events[ix]
+        nxt = events[ix + 1] if ix + 1 < len(events) else None
+        if curr['end'].time() < t:
+            curr = None
+        output[track] = (curr, nxt)
+    return output
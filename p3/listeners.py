@@ -1,15 +1,17 @@
 
 import logging
 from . import models
+from . import ticket_search
 
-from assopy.models import order_created, purchase_completed, ticket_for_user, user_created, user_identity_created
+from assopy.models import Order, order_created, purchase_completed, ticket_for_user, user_created, user_identity_created
 from conference.listeners import fare_price, fare_tickets
 from conference.signals import attendees_connected, event_booked
-from conference.models import AttendeeProfile, Ticket, Talk
+from conference.models import AttendeeProfile, Fare, Ticket, Talk, TalkSpeaker
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from email_template import utils
 
 log = logging.getLogger('p3')
@@ -224,3 +226,128 @@ def _on_attendees_connected(sender, **kw):
         to=[scanned.email]
     ).send()
 attendees_connected.connect(_on_attendees_connected)
+
+
+def _sync_attendees(conference, users, emails=()):
+    """
+    Updates, after the commit, the ConferenceAttendee rows of `users` and of
+    the users with one of the `emails`.
+    """
+    emails = [e for e in emails if e]
+    def sync():
+        ids = set(users)
+        if emails:
+            ids.update(User.objects.filter(email__in=emails).values_list('id', flat=True))
+        models.ConferenceAttendee.objects.sync(conference, ids)
+    transaction.on_commit(sync)
+
+def _on_ticket_conference_pre_save(sender, **kw):
+    o = kw['instance']
+    # the previous assignee could not be partecipating anymore
+    o._previous_assigned_to = None
+    if o.pk:
+        o._previous_assigned_to = models.TicketConference.objects\
+            .filter(pk=o.pk)\
+            .values_list('assigned_to', flat=True)\
+            .first()
+
+def _on_ticket_changed(sender, **kw):
+    o = kw['instance']
+    if sender is Ticket:
+        ticket = o
+        emails = [ticket.assigned_email]
+    else:
+        try:
+            ticket = o.ticket
+        except Ticket.DoesNotExist:
+            # deleted together with the ticket
+            return
+        emails = [o.assigned_to, getattr(o, '_previous_assigned_to', None)]
+    try:
+        conference = ticket.fare.conference
+    except Fare.DoesNotExist:
+        return
+    _sync_attendees(conference, [ticket.user_id], emails)
+
+def _on_ticket_conference_saved(sender, **kw):
+    if kw.get('raw'):
+        return
+    models.TicketConferenceDay.objects.sync(kw['instance'])
+
+def _on_ticket_search_changed(sender, **kw):
+    if not ticket_search.has_indexes():
+        return
+    o = kw['instance']
+    if sender is Ticket:
+        tids = [o.id]
+    elif sender is Order:
+        tids = list(o.orderitem_set
+            .exclude(ticket=None)
+            .values_list('ticket', flat=True))
+    else:
+        tids = [o.ticket_id]
+    # the ticket is gone, not just its p3 data
+    deleted = sender is Ticket and 'created' not in kw
+    transaction.on_commit(lambda: ticket_search.refresh_tickets(tids, deleted=deleted))
+
+def _on_talk_speakers_changed(sender, **kw):
+    o = kw['instance']
+    if sender is Talk:
+        talk = o
+        speakers = TalkSpeaker.objects\
+            .filter(talk=talk)\
+            .values_list('speaker', flat=True)
+    else:
+        try:
+            talk = o.talk
+        except Talk.DoesNotExist:
+            return
+        speakers = [o.speaker_id]
+    _sync_attendees(talk.conference, list(speakers))
+
+def _on_user_pre_save(sender, **kw):
+    o = kw['instance']
+    fields = kw.get('update_fields')
+    # the email is what links a user to the tickets assigned to them, the
+    # name is shown in the who's coming directory (see p3.dataaccess)
+    o._email_changed = fields is None or 'email' in fields
+    o._name_changed = bool(o.pk) and (
+        fields is None or 'first_name' in fields or 'last_name' in fields)
+    if (o._email_changed or o._name_changed) and o.pk:
+        previous = User.objects\
+            .filter(pk=o.pk)\
+            .values_list('email', 'first_name', 'last_name')\
+            .first()
+        if previous is not None:
+            email, first_name, last_name = previous
+            o._email_changed = email != o.email
+            o._name_changed = (first_name, last_name) != (o.first_name, o.last_name)
+
+def _on_user_saved(sender, **kw):
+    o = kw['instance']
+    if kw.get('raw') or not getattr(o, '_email_changed', True):
+        return
+    conferences = set(models.ConferenceAttendee.objects
+        .filter(user=o)
+        .values_list('conference', flat=True))
+    if o.email:
+        conferences.update(Ticket.objects
+            .filter(p3_conference__assigned_to=o.email)
+            .values_list('fare__conference', flat=True))
+    for conference in conferences:
+        _sync_attendees(conference, [o.id])
+
+pre_save.connect(_on_ticket_conference_pre_save, sender=models.TicketConference)
+post_save.connect(_on_ticket_changed, sender=models.TicketConference)
+post_save.connect(_on_ticket_conference_saved, sender=models.TicketConference)
+post_delete.connect(_on_ticket_changed, sender=models.TicketConference)
+post_save.connect(_on_ticket_changed, sender=Ticket)
+post_delete.connect(_on_ticket_changed, sender=Ticket)
+post_save.connect(_on_talk_speakers_changed, sender=Talk)
+post_save.connect(_on_talk_speakers_changed, sender=TalkSpeaker)
+post_delete.connect(_on_talk_speakers_changed, sender=TalkSpeaker)
+pre_save.connect(_on_user_pre_save, sender=User)
+post_save.connect(_on_user_saved, sender=User)
+for sender in (Ticket, models.TicketConference, Order):
+    post_save.connect(_on_ticket_search_changed, sender=sender)
+    post_delete.connect(_on_ticket_search_changed, sender=sender)
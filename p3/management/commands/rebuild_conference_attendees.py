@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from conference import models as cmodels
+from p3 import models
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the partecipants of a conference, e.g. after the users have
+    been changed bypassing the signals (bulk updates, raw sql).
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('conference')
+
+    def handle(self, *args, **options):
+        conference = cmodels.Conference.objects.get(code=options['conference'])
+
+        models.ConferenceAttendee.objects.rebuild(conference.code)
+        print('%d attendees' % models.ConferenceAttendee.objects\
+            .filter(conference=conference.code)\
+            .count())
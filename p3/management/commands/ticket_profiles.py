@@ -7,6 +7,7 @@ from django.core.management.base import BaseCommand, CommandError
 from conference import models
 
 from ...utils import (
+    attendee_profiles,
     get_profile_company,
     get_all_order_tickets
 )
@@ -84,15 +85,19 @@ class Command(BaseCommand):
             'frozen' : False,
         }
 
+        attendees = attendee_profiles(tickets)
         profiles = [] #OrderedDict()
         for ticket in tickets:
             p3_tkt = ticket.p3_conference
             subj = dflt_profile.copy()
             try:
-                profile = p3_tkt.profile()
-            except:
+                profile = attendees[ticket.id]
+            except KeyError:
                 msg = 'Could not find a profile for ticket_id {}.'.format(ticket.id)
+                if options['raise']:
+                    raise CommandError(msg)
                 log.error(msg)
+                continue
 
             title, company = get_profile_company(profile)
             subj['title'] = title
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('p3', '0003_add_name_field_to_ticket_conference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConferenceAttendee',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('conference', models.CharField(max_length=20)),
+                ('ticket', models.BooleanField(default=False)),
+                ('speaker', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='conferenceattendee',
+            unique_together=set([('conference', 'user')]),
+        ),
+    ]
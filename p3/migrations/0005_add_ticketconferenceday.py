@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_attendance_days(apps, schema_editor):
+    TicketConference = apps.get_model('p3', 'TicketConference')
+    TicketConferenceDay = apps.get_model('p3', 'TicketConferenceDay')
+
+    rows = []
+    for tcid, value in TicketConference.objects.exclude(days='').values_list('id', 'days'):
+        # see p3.models.parse_days
+        days = set()
+        for x in value.split(','):
+            try:
+                days.add(datetime.datetime.strptime(x.strip(), '%Y-%m-%d').date())
+            except ValueError:
+                continue
+        rows.extend(
+            TicketConferenceDay(ticket_conference_id=tcid, day=day)
+            for day in days)
+    TicketConferenceDay.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('p3', '0004_add_conferenceattendee'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketConferenceDay',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True)),
+                ('ticket_conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_days', to='p3.TicketConference')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='ticketconferenceday',
+            unique_together=set([('ticket_conference', 'day')]),
+        ),
+        migrations.RunPython(populate_attendance_days, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations
+
+
+def populate_conference_attendees(apps, schema_editor):
+    # the computation of ConferenceAttendee.objects.rebuild, done with the
+    # historical models for all the conferences at once
+    Ticket = apps.get_model('conference', 'Ticket')
+    TalkSpeaker = apps.get_model('conference', 'TalkSpeaker')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    ConferenceAttendee = apps.get_model('p3', 'ConferenceAttendee')
+
+    # {(conference, user id): [has a ticket, is a speaker]}
+    members = defaultdict(lambda: [False, False])
+
+    tickets = Ticket.objects\
+        .filter(fare__code__startswith='T')\
+        .exclude(p3_conference=None)\
+        .values_list('fare__conference', 'user', 'p3_conference__assigned_to')
+    assigned = defaultdict(set)
+    for conference, uid, email in tickets:
+        if email:
+            assigned[email].add(conference)
+        else:
+            members[(conference, uid)][0] = True
+    if assigned:
+        accounts = User.objects\
+            .filter(email__in=list(assigned))\
+            .values_list('email', 'id')
+        for email, uid in accounts:
+            for conference in assigned[email]:
+                members[(conference, uid)][0] = True
+
+    speakers = TalkSpeaker.objects\
+        .filter(talk__status='accepted')\
+        .values_list('talk__conference', 'speaker')
+    for conference, uid in speakers:
+        members[(conference, uid)][1] = True
+
+    ConferenceAttendee.objects.bulk_create(
+        (ConferenceAttendee(conference=conference, user_id=uid, ticket=ticket, speaker=speaker)
+         for (conference, uid), (ticket, speaker) in members.items()),
+        batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('p3', '0005_add_ticketconferenceday'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_conference_attendees, migrations.RunPython.noop),
+    ]
@@ -2,8 +2,9 @@
 import datetime
 
 from django.conf import settings as dsettings
+from django.contrib.auth import get_user_model
 from django.core.urlresolvers import reverse
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import ugettext as _
 from assopy import utils as autils
 
@@ -119,6 +120,66 @@ class TicketConference(models.Model):
         return AttendeeProfile.objects.get(user=user)
 
 
+def parse_days(value):
+    """
+    Returns the sorted dates of a TicketConference.days value, a comma
+    separated list of ISO dates; what is not a date is ignored.
+    """
+    output = set()
+    for x in value.split(','):
+        try:
+            output.add(datetime.datetime.strptime(x.strip(), '%Y-%m-%d').date())
+        except ValueError:
+            continue
+    return sorted(output)
+
+
+class TicketConferenceDayManager(models.Manager):
+    def sync(self, ticket_conference):
+        """
+        Updates the days of attendance of the ticket to match its `days`.
+        """
+        days = set(parse_days(ticket_conference.days))
+        current = set(self
+            .filter(ticket_conference=ticket_conference)
+            .values_list('day', flat=True))
+        if current - days:
+            self.filter(ticket_conference=ticket_conference, day__in=current - days).delete()
+        if days - current:
+            self.bulk_create(
+                TicketConferenceDay(ticket_conference=ticket_conference, day=day)
+                for day in days - current)
+
+    def headcount(self, tickets):
+        """
+        Returns the (day, attendees) pairs, sorted by day, of the tickets of
+        the queryset.
+        """
+        qs = self\
+            .filter(ticket_conference__ticket__in=tickets)\
+            .values_list('day')\
+            .annotate(total=models.Count('id'))\
+            .order_by('day')
+        return list(qs)
+
+
+class TicketConferenceDay(models.Model):
+    """
+    A day of attendance of a ticket, one row for every date in
+    TicketConference.days; kept up to date by p3.listeners.
+    """
+    ticket_conference = models.ForeignKey(
+        TicketConference,
+        related_name='attendance_days',
+        on_delete=models.CASCADE)
+    day = models.DateField(db_index=True)
+
+    objects = TicketConferenceDayManager()
+
+    class Meta:
+        unique_together = (('ticket_conference', 'day'),)
+
+
 class P3ProfileManager(models.Manager):
     def by_tags(self, tags, ignore_case=True, conf=dsettings.CONFERENCE_CONFERENCE):
         if ignore_case:
@@ -129,10 +190,9 @@ class P3ProfileManager(models.Manager):
                     .filter(name__iexact=t)\
                     .values_list('name', flat=True))
             tags = names
-        from p3 import dataaccess
         return P3Profile.objects\
             .filter(interests__name__in=tags)\
-            .filter(profile__user__in=dataaccess.conference_users(conf))\
+            .filter(profile__user__in=ConferenceAttendee.objects.users(conf))\
             .distinct()
 
 
@@ -212,5 +272,90 @@ class P3Profile(models.Model):
         log.info('email from "%s" to "%s" sent', from_.email, self.profile.user.email)
 
 
+class ConferenceAttendeeManager(models.Manager):
+    def users(self, conference, speakers=True):
+        """
+        Returns the ids of the users partecipating to the conference, as a
+        queryset to be used in a `__in` lookup.
+        """
+        qs = self.filter(conference=conference)
+        if not speakers:
+            qs = qs.filter(ticket=True)
+        return qs.values_list('user', flat=True)
+
+    def compute(self, conference, users=None):
+        """
+        Returns {user id: (has a ticket, is a speaker)} for the partecipants
+        of the conference, among `users` if given, looking at the tickets and
+        at the accepted talks.
+        """
+        from conference.models import TalkSpeaker
+        tickets = Ticket.objects\
+            .filter(fare__conference=conference)\
+            .filter(fare__code__startswith='T')
+        # Unassigned tickets
+        bought = tickets.filter(p3_conference__assigned_to='')
+        # Assigned tickets
+        assigned = tickets\
+            .exclude(p3_conference__assigned_to=None)\
+            .exclude(p3_conference__assigned_to='')\
+            .values('p3_conference__assigned_to')
+        speakers = TalkSpeaker.objects\
+            .filter(talk__conference=conference, talk__status='accepted')
+        accounts = get_user_model().objects.filter(email__in=assigned)
+        if users is not None:
+            users = list(users)
+            bought = bought.filter(user__in=users)
+            speakers = speakers.filter(speaker__in=users)
+            accounts = accounts.filter(id__in=users)
+
+        with_ticket = set(bought.values_list('user', flat=True))
+        with_ticket.update(accounts.values_list('id', flat=True))
+        with_talk = set(speakers.values_list('speaker', flat=True))
+        return {
+            uid: (uid in with_ticket, uid in with_talk)
+            for uid in with_ticket | with_talk
+        }
+
+    @transaction.atomic
+    def sync(self, conference, users):
+        """
+        Updates the rows of the given users.
+        """
+        users = list(users)
+        members = self.compute(conference, users)
+        self.filter(conference=conference, user__in=users)\
+            .exclude(user__in=list(members))\
+            .delete()
+        for uid, (ticket, speaker) in members.items():
+            self.update_or_create(
+                conference=conference, user_id=uid,
+                defaults={'ticket': ticket, 'speaker': speaker})
+
+    @transaction.atomic
+    def rebuild(self, conference):
+        self.filter(conference=conference).delete()
+        self.bulk_create(
+            ConferenceAttendee(conference=conference, user_id=uid, ticket=ticket, speaker=speaker)
+            for uid, (ticket, speaker) in self.compute(conference).items())
+
+
+class ConferenceAttendee(models.Model):
+    """
+    The users partecipating to a conference: who has a ticket (bought or
+    assigned to them) and the speakers of the accepted talks. Kept up to date
+    by p3.listeners.
+    """
+    conference = models.CharField(max_length=20)
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
+    ticket = models.BooleanField(default=False)
+    speaker = models.BooleanField(default=False)
+
+    objects = ConferenceAttendeeManager()
+
+    class Meta:
+        unique_together = (('conference', 'user'),)
+
+
 #TODO: what is this import doing here?!
 import p3.listeners
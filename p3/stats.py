@@ -1,15 +1,22 @@
 from collections import defaultdict
 
+import numpy
+
 from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
 from django.conf import settings
 from django.db.models import Q, Count
 
+from assopy import models as amodels
 from p3 import models
+from p3.dataaccess import cache_me
 from conference import models as cmodels
 from conference.models import Ticket, Speaker, Talk
 from conference.tickets import count_number_of_sold_training_tickets_including_combined_tickets
 
+# seconds the tickets snapshot used by the stats is cached for
+STATS_SNAPSHOT_TIMEOUT = getattr(settings, 'P3_STATS_SNAPSHOT_TIMEOUT', 60)
+
 
 def _create_option(id, title, total_qs, **kwargs):
     output = {
@@ -69,17 +76,117 @@ def _unassigned_tickets(conf, ticket_type='conference', only_complete=True):
         .filter(Q(p3_conference=None)|Q(name='')|Q(p3_conference__assigned_to=''))
 
 
+# (column, lookup, dtype) of the tickets snapshot
+_SNAPSHOT_FIELDS = (
+    ('id', 'id', 'i8'),
+    ('user', 'user', 'i8'),
+    ('name', 'name', 'O'),
+    ('ticket_type', 'ticket_type', 'O'),
+    ('fare', 'fare__code', 'O'),
+    ('fare_type', 'fare__ticket_type', 'O'),
+    ('complete', 'orderitem__order___complete', '?'),
+    ('p3', 'p3_conference__ticket', '?'),
+    ('assigned_to', 'p3_conference__assigned_to', 'O'),
+    ('shirt_size', 'p3_conference__shirt_size', 'O'),
+    ('diet', 'p3_conference__diet', 'O'),
+    ('days', 'p3_conference__days', 'O'),
+)
+
+
+def tickets_snapshot(conf):
+    """
+    Returns the tickets of the conference counted by the stats, the ones of
+    the complete orders and of the bank ones (see _tickets), as a numpy
+    record array with a row per ticket and the _SNAPSHOT_FIELDS columns.
+
+    `p3` tells if the ticket has its TicketConference; when it doesn't the
+    TicketConference columns are empty strings.
+
+    `attendance` is the tuple of the days of attendance of the ticket, read
+    from TicketConferenceDay while building the snapshot, so that the
+    headcounts agree with the other columns.
+    """
+    rows = list(_tickets(conf, only_complete=False)
+                .values_list(*[lookup for _, lookup, _ in _SNAPSHOT_FIELDS]))
+    dtypes = [(name, dtype) for name, _, dtype in _SNAPSHOT_FIELDS]
+    snapshot = numpy.zeros(len(rows), dtype=dtypes + [('attendance', 'O')])
+    for ix, (name, _, dtype) in enumerate(_SNAPSHOT_FIELDS):
+        column = [r[ix] for r in rows]
+        if name == 'p3':
+            column = [x is not None for x in column]
+        elif dtype == 'O':
+            column = [x or '' for x in column]
+        snapshot[name] = column
+
+    attendance = defaultdict(list)
+    days = models.TicketConferenceDay.objects\
+        .filter(ticket_conference__ticket__fare__conference=conf)\
+        .values_list('ticket_conference__ticket', 'day')
+    for tid, day in days:
+        attendance[tid].append(day)
+    # assigned one by one, numpy would unpack the tuples
+    for ix, tid in enumerate(snapshot['id']):
+        snapshot['attendance'][ix] = tuple(sorted(attendance.get(tid, ())))
+    return snapshot
+
+
+def _i_tickets_snapshot(sender, **kw):
+    return 'stats_tickets'
+
+tickets_snapshot = cache_me(
+    models=(Ticket, models.TicketConference, models.TicketConferenceDay,
+            cmodels.Fare, amodels.Order, amodels.OrderItem),
+    key='stats_tickets:%(conf)s',
+    namespace='stats_tickets',
+    timeout=STATS_SNAPSHOT_TIMEOUT)(tickets_snapshot, _i_tickets_snapshot)
+
+
+# The masks of the snapshot rows that match the querysets above.
+
+def _snapshot_tickets(snapshot, ticket_type=None, fare_code=None, only_complete=True):
+    mask = numpy.ones(len(snapshot), dtype=bool)
+    if only_complete:
+        mask &= snapshot['complete']
+    if ticket_type:
+        mask &= snapshot['fare_type'] == ticket_type
+    if fare_code:
+        mask &= snapshot['fare'] == fare_code
+    return mask
+
+
+def _snapshot_assigned(snapshot):
+    return _snapshot_tickets(snapshot, 'conference')\
+        & snapshot['p3']\
+        & (snapshot['name'] != '')\
+        & (snapshot['assigned_to'] != '')
+
+
+def _snapshot_unassigned(snapshot, only_complete=True):
+    return _snapshot_tickets(snapshot, 'conference', only_complete=only_complete)\
+        & (~snapshot['p3'] | (snapshot['name'] == '') | (snapshot['assigned_to'] == ''))
+
+
+def _count_values(values):
+    """
+    Returns the (value, occurrences) pairs of the values of a snapshot
+    column.
+    """
+    if not len(values):
+        return []
+    keys, counts = numpy.unique(values, return_counts=True)
+    return list(zip(keys.tolist(), counts.tolist()))
+
+
 def shirt_sizes(conf):
     sizes = dict(models.TICKET_CONFERENCE_SHIRT_SIZES)
-    qs = _assigned_tickets(conf)\
-        .values('p3_conference__shirt_size')\
-        .annotate(total=Count('id'))
+    snapshot = tickets_snapshot(conf)
+    values = snapshot['shirt_size'][_snapshot_assigned(snapshot)]
 
     output = []
-    for x in qs:
+    for size, total in _count_values(values):
         output.append({
-            'title': sizes.get(x['p3_conference__shirt_size']),
-            'total': x['total'],
+            'title': sizes.get(size),
+            'total': total,
         })
 
     return output
@@ -88,36 +195,37 @@ shirt_sizes.short_description = "Tshirts size"
 
 def diet_types(conf):
     diets = dict(models.TICKET_CONFERENCE_DIETS)
-    qs = _assigned_tickets(conf)\
-        .values('p3_conference__diet')\
-        .annotate(total=Count('id'))
+    snapshot = tickets_snapshot(conf)
+    values = snapshot['diet'][_snapshot_assigned(snapshot)]
 
     output = []
-    for x in qs:
+    for diet, total in _count_values(values):
         output.append({
-            'title': diets.get(x['p3_conference__diet']),
-            'total': x['total'],
+            'title': diets.get(diet),
+            'total': total,
         })
     return output
 diet_types.short_description = "Diet"
 
 
 def presence_days(conf, code=None):
-    qs = {
+    snapshot = tickets_snapshot(conf)
+    nostaff = snapshot['ticket_type'] != 'staff'
+    masks = {
         'all': {
-            'c': _assigned_tickets(conf),
-            'n': _unassigned_tickets(conf, only_complete=False),
+            'c': _snapshot_assigned(snapshot),
+            'n': _snapshot_unassigned(snapshot, only_complete=False),
         },
-        'nostaff': {
-            'c': _assigned_tickets(conf).exclude(ticket_type='staff'),
-            'n': _unassigned_tickets(conf, only_complete=False).exclude(ticket_type='staff'),
-        }
+    }
+    masks['nostaff'] = {
+        'c': masks['all']['c'] & nostaff,
+        'n': masks['all']['n'] & nostaff,
     }
     totals = {}
-    for key in qs:
+    for key in masks:
         totals[key] = {
-            'c': qs[key]['c'].count(),
-            'n': qs[key]['n'].count(),
+            'c': int(masks[key]['c'].sum()),
+            'n': int(masks[key]['n'].sum()),
         }
     output = {
         'columns': (
@@ -132,14 +240,16 @@ def presence_days(conf, code=None):
         'all': defaultdict(lambda: 0),
         'nostaff': defaultdict(lambda: 0),
     }
-    for key in qs:
-        for x in qs[key]['c'].values_list('p3_conference__days', flat=True):
-            val = [_f for _f in [v.strip() for v in x.split(',')] if _f]
-            if not val:
-                days[key]['x'] += 1
-            else:
-                for v in val:
-                    days[key][v] += 1
+    # the tickets without a day of attendance, `days` could be empty as
+    # well as unparsable
+    nodays = numpy.array([not x for x in snapshot['attendance']], dtype=bool)
+    for key in masks:
+        for attendance in snapshot['attendance'][masks[key]['c']]:
+            for day in attendance:
+                days[key][day.isoformat()] += 1
+        dX = int((masks[key]['c'] & nodays).sum())
+        if dX:
+            days[key]['x'] = dX
 
     for key in days:
         dX = days[key].get('x', 0)
@@ -177,7 +287,7 @@ def tickets_status(conf, code=None):
     spam_recruiting = spam_recruiter_by_conf(conf)
     if code is None:
         # FIXME: remove hotel and sim (sim_tickets has been removed from the parameters of ticket_status_no_code function
-        output = ticket_status_no_code(conf, multiple_assignments, orphan_tickets, spam_recruiting, voupe03)
+        output = ticket_status_no_code(conf, orphan_tickets, spam_recruiting)
 
     else:
         if code in (
@@ -368,25 +478,34 @@ def ticket_status_for_voupe03_tickets(code, voupe03):
     return output
 
 
-def ticket_status_no_code(conf, multiple_assignments, orphan_tickets, spam_recruiting, voupe03):
+def ticket_status_no_code(conf, orphan_tickets, spam_recruiting):
+    snapshot = tickets_snapshot(conf)
+    assigned = _snapshot_assigned(snapshot)
+    assignments = _count_values(snapshot['assigned_to'][assigned])
+
+    def option(id, title, total):
+        return {
+            'id': id,
+            'title': title,
+            'total': int(total),
+        }
+
     return [
-        _create_option('ticket_sold', 'Sold tickets', _tickets(conf, 'conference')),
+        option('ticket_sold', 'Sold tickets', _snapshot_tickets(snapshot, 'conference').sum()),
         {
             'id': 'training_tickets_sold',
             'title': 'Sold training tickets (including combined)',
             'total': count_number_of_sold_training_tickets_including_combined_tickets(conference_code=conf),
         },
-        _create_option(
-            'tickets_with_unique_email',
-            'Sold tickets with unique email',
-            _tickets_with_unique_email(conf, 'conference')
-        ),
-        _create_option('assigned_tickets', 'Assigned tickets', _assigned_tickets(conf)),
-        _create_option('unassigned_tickets', 'Unassigned tickets', _unassigned_tickets(conf)),
+        option('tickets_with_unique_email', 'Sold tickets with unique email', len(assignments)),
+        option('assigned_tickets', 'Assigned tickets', assigned.sum()),
+        option('unassigned_tickets', 'Unassigned tickets', _snapshot_unassigned(snapshot).sum()),
         # _create_option('sim_tickets', 'Tickets with SIM card orders', sim_tickets),  # FIXME: remove hotels and sim
-        _create_option('voupe03_tickets', 'Social event tickets (VOUPE03)', voupe03),
+        option('voupe03_tickets', 'Social event tickets (VOUPE03)',
+               _snapshot_tickets(snapshot, fare_code='VOUPE03').sum()),
         _create_option('spam_recruiting', 'Recruiting emails (opt-in)', spam_recruiting),
-        _create_option('multiple_assignments', 'Tickets assigned to the same person', multiple_assignments),
+        option('multiple_assignments', 'Tickets assigned to the same person',
+               len([x for x, count in assignments if count > 1])),
         _create_option('orphan_tickets', 'Assigned tickets without user record (orphaned)', orphan_tickets),
     ]
 
@@ -579,9 +698,13 @@ def pp_tickets(conf, code=None):
         qs[fcode] = _tickets(conf, fare_code=fcode)
     all_attendees = User.objects.filter(id__in=_tickets(conf, ticket_type='partner').values('user'))
     if code is None:
-        output = [
-            _create_option('all', 'Tickets partner program', all_attendees)
-        ]
+        snapshot = tickets_snapshot(conf)
+        partners = snapshot['user'][_snapshot_tickets(snapshot, ticket_type='partner')]
+        output = [{
+            'id': 'all',
+            'title': 'Tickets partner program',
+            'total': len(numpy.unique(partners)),
+        }]
         from conference.templatetags.conference import fare_blob
         titles = {}
         for f in cmodels.Fare.objects.filter(code__in=fcodes):
@@ -589,7 +712,7 @@ def pp_tickets(conf, code=None):
         for fcode in fcodes:
             output.append({
                 'id': fcode,
-                'total': qs[fcode].count(),
+                'total': int(_snapshot_tickets(snapshot, fare_code=fcode).sum()),
                 'title': fcode + ' - ' + titles[fcode],
             })
     else:
@@ -0,0 +1,76 @@
+from datetime import date
+
+from pytest import mark
+
+from django.conf import settings
+from django.core.urlresolvers import reverse
+
+from assopy.stripe.tests.factories import UserFactory
+from conference.models import AttendeeProfile, Ticket
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.fare import FareFactory, TicketFactory
+from p3.models import TicketConference
+from p3.utils import attendee_profiles, conference_ticket_badge, ticket_badges
+
+
+def _profile(user):
+    return AttendeeProfile.objects.getOrCreateForUser(user)
+
+
+def _conference():
+    conference = ConferenceFactory(
+        conference_start=date(2019, 7, 8), conference_end=date(2019, 7, 14))
+    return FareFactory(conference=conference.code, code='TRSP')
+
+
+@mark.django_db
+def test_conference_ticket_badge():
+    fare = _conference()
+    buyer = UserFactory(email='buyer@example.com')
+    friend = UserFactory(email='friend@example.com')
+    buyer_profile = _profile(buyer)
+    _profile(friend)
+
+    own = TicketFactory(user=buyer, fare=fare, name='Joe Doe', ticket_type='standard')
+    TicketConference.objects.create(
+        ticket=own, assigned_to='', tagline='hi', days='2019-07-09,2019-07-11')
+    gift = TicketFactory(user=buyer, fare=fare, name='Jane Doe', ticket_type='staff')
+    TicketConference.objects.create(ticket=gift, assigned_to='FRIEND@example.com')
+
+    groups = conference_ticket_badge(Ticket.objects.order_by('id'))
+
+    assert len(groups) == 1
+    assert groups[0]['name'] == fare.conference
+    first, second = groups[0]['tickets']
+    assert first['name'] == 'Joe Doe'
+    assert first['tagline'] == 'hi'
+    assert first['days'] == '2,4'
+    assert not first['staff']
+    assert first['profile-link'] == settings.DEFAULT_URL_PREFIX + reverse(
+        'conference-profile-link', kwargs={'uuid': buyer_profile.uuid})
+    assert second['name'] == 'Jane Doe'
+    assert second['days'] == ''
+    assert second['staff']
+    assert attendee_profiles([own, gift]) == {
+        own.id: buyer_profile,
+        gift.id: AttendeeProfile.objects.get(user=friend),
+    }
+
+
+@mark.django_db
+def test_ticket_badges_query_count(django_assert_num_queries):
+    fare = _conference()
+    for ix in range(20):
+        buyer = UserFactory()
+        _profile(buyer)
+        attendee = UserFactory()
+        _profile(attendee)
+        TicketConference.objects.create(
+            ticket=TicketFactory(user=buyer, fare=fare),
+            assigned_to=attendee.email if ix % 2 else '')
+
+    # the tickets, one for the conference and two every 10 tickets
+    with django_assert_num_queries(1 + 1 + 2 * 2):
+        badges = list(ticket_badges(Ticket.objects.all(), chunk_size=10))
+
+    assert len(badges) == 20
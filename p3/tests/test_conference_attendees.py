@@ -0,0 +1,140 @@
+from importlib import import_module
+
+from pytest import mark
+
+from django.apps import apps
+
+from assopy.stripe.tests.factories import UserFactory
+from conference.models import TalkSpeaker
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.fare import FareFactory, TicketFactory
+from conference.tests.factories.speaker import SpeakerFactory
+from conference.tests.factories.talk import TalkFactory
+from p3.models import ConferenceAttendee, TicketConference
+
+
+def _attendees(conference, speakers=True):
+    return set(ConferenceAttendee.objects.users(conference.code, speakers=speakers))
+
+
+def _from_scratch(conference):
+    return set(ConferenceAttendee.objects.compute(conference.code))
+
+
+@mark.django_db(transaction=True)
+def test_attendees_follow_the_tickets():
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code, code='TESS')
+    buyer, friend, other = UserFactory(), UserFactory(), UserFactory()
+
+    ticket = TicketFactory(user=buyer, fare=fare)
+    # without the p3 data the ticket is not complete
+    assert _attendees(conference) == set()
+
+    tc = TicketConference.objects.create(ticket=ticket, assigned_to='')
+    assert _attendees(conference) == {buyer.id} == _from_scratch(conference)
+
+    tc.assigned_to = friend.email
+    tc.save()
+    assert _attendees(conference) == {friend.id} == _from_scratch(conference)
+
+    tc.assigned_to = other.email
+    tc.save()
+    assert _attendees(conference) == {other.id} == _from_scratch(conference)
+
+    # not a conference ticket
+    hotel = FareFactory(conference=conference.code, code='HB2')
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=hotel), assigned_to='')
+    assert _attendees(conference) == {other.id}
+
+    ticket.delete()
+    assert _attendees(conference) == set() == _from_scratch(conference)
+
+
+@mark.django_db(transaction=True)
+def test_attendees_include_the_speakers_of_accepted_talks():
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code, code='TESS')
+    speaker = SpeakerFactory()
+    talk = TalkFactory(conference=conference.code, status='proposed')
+    TalkSpeaker.objects.create(talk=talk, speaker=speaker)
+    assert _attendees(conference) == set()
+
+    talk.status = 'accepted'
+    talk.save()
+    assert _attendees(conference) == {speaker.user_id} == _from_scratch(conference)
+    assert _attendees(conference, speakers=False) == set()
+
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=speaker.user, fare=fare), assigned_to='')
+    assert _attendees(conference, speakers=False) == {speaker.user_id}
+
+    TalkSpeaker.objects.filter(talk=talk).delete()
+    assert _attendees(conference) == {speaker.user_id}
+    assert ConferenceAttendee.objects.get(user=speaker.user).speaker is False
+
+
+@mark.django_db
+def test_rebuild_matches_the_tickets():
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code, code='TESS')
+    buyer, friend = UserFactory(), UserFactory()
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=fare), assigned_to=friend.email)
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=fare), assigned_to='')
+    ConferenceAttendee.objects.create(conference=conference.code, user=UserFactory())
+
+    ConferenceAttendee.objects.rebuild(conference.code)
+    assert _attendees(conference) == {buyer.id, friend.id}
+
+
+@mark.django_db(transaction=True)
+def test_attendees_follow_the_email_of_the_users():
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code, code='TESS')
+    buyer, friend = UserFactory(), UserFactory()
+    email = friend.email
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=fare), assigned_to=email)
+    assert _attendees(conference) == {friend.id}
+
+    friend.email = 'another-' + email
+    friend.save()
+    assert _attendees(conference) == set() == _from_scratch(conference)
+
+    # an account registered with the email of the ticket
+    newcomer = UserFactory(email=email)
+    assert _attendees(conference) == {newcomer.id} == _from_scratch(conference)
+
+
+@mark.django_db
+def test_migration_populates_the_attendees():
+    migration = import_module('p3.migrations.0006_populate_conferenceattendee')
+    conferences = [ConferenceFactory(code=code) for code in ('ep2018', 'ep2019')]
+    buyer, friend = UserFactory(), UserFactory()
+    speaker = SpeakerFactory()
+    for conference in conferences:
+        fare = FareFactory(conference=conference.code, code='TESS')
+        TicketConference.objects.create(
+            ticket=TicketFactory(user=buyer, fare=fare), assigned_to='')
+        talk = TalkFactory(conference=conference.code, status='accepted')
+        TalkSpeaker.objects.create(talk=talk, speaker=speaker)
+    hotel = FareFactory(conference=conferences[0].code, code='HB2')
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=friend, fare=hotel), assigned_to='')
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=fare), assigned_to=friend.email)
+    TicketConference.objects.create(
+        ticket=TicketFactory(user=buyer, fare=fare), assigned_to=speaker.user.email)
+    ConferenceAttendee.objects.all().delete()
+
+    migration.populate_conference_attendees(apps, None)
+    for conference in conferences:
+        stored = dict(
+            (x.user_id, (x.ticket, x.speaker))
+            for x in ConferenceAttendee.objects.filter(conference=conference.code))
+        assert stored == ConferenceAttendee.objects.compute(conference.code)
+    assert _attendees(conferences[0]) == {buyer.id, speaker.user_id}
+    assert _attendees(conferences[1]) == {buyer.id, friend.id, speaker.user_id}
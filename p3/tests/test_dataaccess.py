@@ -0,0 +1,56 @@
+from pytest import mark
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from assopy.stripe.tests.factories import UserFactory
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.fare import FareFactory, TicketFactory
+from p3 import dataaccess
+from p3.models import TicketConference
+
+
+@mark.django_db
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_all_user_tickets_invalidates_only_the_users_involved():
+    cache.clear()
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code)
+    buyer, friend, other = UserFactory(), UserFactory(), UserFactory()
+    ticket = TicketFactory(user=buyer, fare=fare)
+    tc = TicketConference.objects.create(ticket=ticket, assigned_to='')
+
+    def misses():
+        before = dataaccess._all_user_tickets.stats['misses']
+        for u in (buyer, friend, other):
+            dataaccess.all_user_tickets(u.id, conference.code)
+        return dataaccess._all_user_tickets.stats['misses'] - before
+
+    assert misses() == 3
+    assert misses() == 0
+
+    tc.assigned_to = friend.email.upper()
+    with CaptureQueriesContext(connection) as queries:
+        tc.save()
+    # only the p3 listeners query the database
+    assert not [q for q in queries.captured_queries if 'auth_user' in q['sql']]
+    assert misses() == 1
+    assert [t[0] for t in dataaccess.all_user_tickets(friend.id, conference.code)] == [ticket.id]
+
+    # the previous assignee loses the ticket
+    tc.assigned_to = other.email
+    tc.save()
+    assert misses() == 2
+    assert dataaccess.all_user_tickets(friend.id, conference.code) == []
+
+    TicketFactory(user=buyer, fare=fare)
+    assert misses() == 1
+
+    # a new email is a new set of tickets
+    friend.email = other.email.upper()
+    friend.save()
+    assert misses() == 1
+    assert [t[0] for t in dataaccess.all_user_tickets(friend.id, conference.code)] == [ticket.id]
@@ -0,0 +1,144 @@
+import json
+from datetime import date, time
+
+from freezegun import freeze_time
+from pytest import fixture, mark
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from conference.models import Track
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.event import EventFactory, EventTrackFactory
+from p3 import dataaccess
+from p3.tests.factories.schedule import ScheduleFactory
+
+DAY = date(2019, 7, 10)
+
+
+@fixture
+def live(settings):
+    settings.CONFERENCE_CONFERENCE = 'ep2019'
+    settings.DEBUG = False
+    settings.P3_LIVE_TRACKS = {'room1': {}, 'room2': {}}
+    settings.P3_LIVE_EMBED = lambda request, track=None, event=None: 'embed'
+    conference = ConferenceFactory(
+        code='ep2019', conference_start=DAY, conference_end=DAY)
+    schedule = ScheduleFactory(conference=conference.code, date=DAY)
+    tracks = {
+        name: Track.objects.create(schedule=schedule, track=name, title=name, order=ix)
+        for ix, name in enumerate(['room1', 'room2', 'room3'])
+    }
+
+    def event(track, hour, minute=0, duration=45, **kw):
+        if 'talk' not in kw:
+            kw['talk__conference'] = conference.code
+        e = EventFactory(
+            schedule=schedule,
+            start_time=time(hour, minute),
+            duration=duration,
+            **kw)
+        EventTrackFactory(event=e, track=tracks[track])
+        return e.id
+
+    return {
+        'conference': conference,
+        'events': {
+            'talk1': event('room1', 9),
+            'talk2': event('room1', 10),
+            'break': event('room1', 9, 45, tags='special', talk=None, custom='Break', duration=15),
+            'talk3': event('room2', 11),
+            'other': event('room3', 9),
+        },
+    }
+
+
+def _now(timeline, hour, minute=0):
+    return {
+        track: tuple(e and e['id'] for e in pair)
+        for track, pair in dataaccess.live_now(timeline, time(hour, minute)).items()
+    }
+
+
+@mark.django_db
+def test_live_now_finds_current_and_next_events(live):
+    ev = live['events']
+    timeline = dataaccess.live_timeline('ep2019', DAY)
+
+    assert _now(timeline, 8) == {
+        'room1': (ev['talk1'], ev['talk2']),
+        'room2': (ev['talk3'], None),
+        'room3': (ev['other'], None),
+    }
+    assert _now(timeline, 9, 30)['room1'] == (ev['talk1'], ev['talk2'])
+    # the special events are skipped
+    assert _now(timeline, 9, 50)['room1'] == (None, ev['talk2'])
+    assert _now(timeline, 10)['room1'] == (ev['talk2'], None)
+    assert _now(timeline, 10, 45)['room1'] == (ev['talk2'], None)
+    assert _now(timeline, 11)['room1'] == (None, None)
+    assert _now(timeline, 11, 10)['room2'] == (ev['talk3'], None)
+    assert [e['name'] for e in timeline['tracks']['room1']][1] == 'Break'
+
+
+@mark.django_db
+def test_live_timeline_is_missing_without_schedule(live):
+    assert dataaccess.live_timeline('ep2019', date(2019, 7, 11)) is None
+
+
+@mark.django_db
+@freeze_time('2019-07-10 09:30:00')
+def test_live_events(client, live):
+    ev = live['events']
+    response = client.get(reverse('p3-live-events'))
+
+    assert response.status_code == 200
+    assert 'private' in response['Cache-Control']
+    # the first talk ends at 9:45
+    assert 'max-age=60' in response['Cache-Control']
+    data = json.loads(response.content.decode('utf-8'))
+    assert set(data.keys()) == {'room1', 'room2'}
+    assert data['room1']['id'] == ev['talk1']
+    assert data['room1']['next']['url'].startswith('/conference/talks/')
+    # the first event of the day is shown before it starts
+    assert data['room2']['id'] == ev['talk3']
+    assert data['room2']['next'] is None
+
+
+@mark.django_db
+@freeze_time('2019-07-10 09:44:30')
+def test_live_events_expire_when_the_timeline_changes(client, live):
+    response = client.get(reverse('p3-live-events'))
+
+    assert 'max-age=30' in response['Cache-Control']
+
+
+@mark.django_db
+@freeze_time('2019-07-10 09:30:00')
+def test_live_track_events(client, live):
+    response = client.get(reverse('p3-live-track-events', args=('room1',)))
+    data = json.loads(response.content.decode('utf-8'))
+
+    assert [e['name'] for e in data][1] == 'Break'
+    assert client.get(reverse('p3-live-track-events', args=('nope',))).status_code == 404
+
+
+@mark.django_db
+@freeze_time('2019-07-10 09:30:00')
+def test_live_events_are_served_from_memory(client, live):
+    with override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE):
+        cache.clear()
+        dataaccess.live_timeline.local_cache.clear()
+        url = reverse('p3-live-events')
+        client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                client.get(url)
+        cache.clear()
+        dataaccess.live_timeline.local_cache.clear()
+
+    # the session and the current conference come from the cache too
+    assert len(queries) == 0
@@ -7,7 +7,7 @@ from django_factory_boy import auth as auth_factories
 from conference.tests.factories.attendee_profile import AttendeeProfileFactory
 from conference.tests.factories.conference import ConferenceFactory
 from conference.tests.factories.fare import TicketFactory, FareFactory
-from p3.models import TicketConference
+from p3.models import TicketConference, TicketConferenceDay, parse_days
 from p3.models import P3Profile
 from p3.tests.factories.ticket_conference import TicketConferenceFactory
 
@@ -44,6 +44,39 @@ class TicketConferenceModelTestCase(TestCase):
         self.assertEqual(attendee_profile, profile)
 
 
+    def test_attendance_days(self):
+        ticket_conference = TicketConferenceFactory(
+            ticket=TicketFactory(user=self.user, fare=self.fare),
+            days='2019-07-10, 2019-07-08,,nope')
+
+        def days():
+            return sorted(TicketConferenceDay.objects
+                .filter(ticket_conference=ticket_conference)
+                .values_list('day', flat=True))
+
+        self.assertEqual(days(), [datetime.date(2019, 7, 8), datetime.date(2019, 7, 10)])
+
+        ticket_conference.days = '2019-07-10,2019-07-11'
+        ticket_conference.save()
+        self.assertEqual(days(), [datetime.date(2019, 7, 10), datetime.date(2019, 7, 11)])
+
+        TicketConferenceFactory(
+            ticket=TicketFactory(user=self.user, fare=self.fare),
+            days='2019-07-11')
+        self.assertEqual(
+            TicketConferenceDay.objects.headcount(TicketConference.objects.values('ticket')),
+            [(datetime.date(2019, 7, 10), 1), (datetime.date(2019, 7, 11), 2)])
+
+        ticket_conference.days = ''
+        ticket_conference.save()
+        self.assertEqual(days(), [])
+
+    def test_parse_days(self):
+        self.assertEqual(parse_days(''), [])
+        self.assertEqual(
+            parse_days('2019-07-09,2019-07-08,2019-07-09,2019-7-10'),
+            [datetime.date(2019, 7, 8), datetime.date(2019, 7, 9), datetime.date(2019, 7, 10)])
+
 class P3ProfileModelTestCase(TestCase):
     def setUp(self):
         self.user = auth_factories.UserFactory()
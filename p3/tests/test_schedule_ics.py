@@ -0,0 +1,116 @@
+from datetime import time
+
+from pytest import fixture, mark
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
+from django.test import override_settings
+
+from conference import dataaccess as cdata
+from conference.models import Event, EventInterest
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.event import EventFactory
+from django_factory_boy import auth as auth_factories
+from p3 import dataaccess
+from p3.tests.factories.schedule import ScheduleFactory
+
+
+@fixture
+def locmem_cache():
+    with override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE):
+        cache.clear()
+        cdata.event_data.local_cache.clear()
+        yield
+        cache.clear()
+        cdata.event_data.local_cache.clear()
+
+
+def _events(conference, count=3):
+    schedule = ScheduleFactory(conference=conference.code)
+    return [
+        EventFactory(
+            schedule=schedule,
+            talk__conference=conference.code,
+            talk__title='Talk %s' % ix,
+            start_time=time(10 + ix))
+        for ix in range(count)
+    ]
+
+
+def _ics(client, url, **headers):
+    response = client.get(url, **headers)
+    body = b''.join(response.streaming_content) if response.status_code == 200 else b''
+    return response, body.decode('utf-8')
+
+
+@mark.django_db
+def test_ics_lists_the_events_in_order(client):
+    conference = ConferenceFactory(code=settings.CONFERENCE_CONFERENCE)
+    events = _events(conference)
+
+    response, body = _ics(client, reverse('p3-schedule-ics', args=(conference.code,)))
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/calendar; charset=utf-8'
+    lines = body.split('\r\n')
+    assert lines[0] == 'BEGIN:VCALENDAR'
+    assert lines[-2:] == ['END:VCALENDAR', '']
+    assert body.count('BEGIN:VEVENT') == 3
+    positions = [body.index('/p3/event/%s\r\n' % e.id) for e in events]
+    assert positions == sorted(positions)
+    assert 'SUMMARY;ALTREP=' in body
+
+
+@mark.django_db
+def test_ics_is_conditional(client, locmem_cache):
+    conference = ConferenceFactory(code=settings.CONFERENCE_CONFERENCE)
+    _events(conference)
+    url = reverse('p3-schedule-ics', args=(conference.code,))
+
+    first, _ = _ics(client, url)
+    again, _ = _ics(client, url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert again.status_code == 304
+    assert not first.has_header('Last-Modified')
+
+    Event.objects.filter(schedule__conference=conference.code).first().delete()
+    changed, body = _ics(client, url, HTTP_IF_NONE_MATCH=first['ETag'])
+    assert changed.status_code == 200
+    assert changed['ETag'] != first['ETag']
+    assert body.count('BEGIN:VEVENT') == 2
+
+
+@mark.django_db
+def test_my_schedule_has_only_the_starred_events(client):
+    conference = ConferenceFactory(code=settings.CONFERENCE_CONFERENCE)
+    events = _events(conference)
+    user = auth_factories.UserFactory(password='password1234')
+    EventInterest.objects.create(event=events[1], user=user, interest=1)
+    EventInterest.objects.create(event=events[2], user=user, interest=0)
+    url = reverse('p3-schedule-my-schedule-ics', args=(conference.code,))
+
+    assert client.get(url).status_code == 404
+
+    client.login(username=user.username, password='password1234')
+    _, body = _ics(client, url + '?abstract')
+    assert body.count('BEGIN:VEVENT') == 1
+    assert '/p3/event/%s\r\n' % events[1].id in body
+    assert 'DESCRIPTION:' in body
+
+
+@mark.django_db
+def test_events_are_cached_until_changed(locmem_cache):
+    conference = ConferenceFactory()
+    events = _events(conference)
+    eids = [e.id for e in events]
+
+    blocks = dataaccess.events_ical(eids)
+    assert dataaccess.events_ical(eids) == blocks
+    assert dataaccess.events_ical(eids, abstract=True) != blocks
+
+    talk = events[0].talk
+    talk.title = 'A new title'
+    talk.save()
+    changed = dataaccess.events_ical(eids)
+    assert 'A new title' in changed[0]['vevent'].replace(b'\r\n ', b'').decode('utf-8')
+    assert changed[1:] == blocks[1:]
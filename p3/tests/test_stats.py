@@ -1,4 +1,6 @@
 import mock
+from freezegun import freeze_time
+from pytest import mark
 from django.test import TestCase
 from django_factory_boy import auth as auth_factories
 
@@ -7,6 +9,7 @@ from assopy.stripe.tests.factories import (
     AssopyUserFactory,
     VatFactory
 )
+from assopy.models import Order
 from assopy.tests.factories.order import CreditCardOrderFactory
 from conference.tests.factories.conference import ConferenceFactory
 from conference.tests.factories.fare import TicketFactory, FareFactory
@@ -108,3 +111,79 @@ class StatsTestCase(TestCase):
     def test_pp_tickets(self):
         from p3.stats import pp_tickets
         repartition = pp_tickets(self.conference)
+
+
+@mark.django_db
+@freeze_time('2019-05-01')
+@mock.patch('email_template.utils.email')
+@mock.patch('django.core.mail.send_mail')
+def test_stats_from_the_snapshot_match_the_querysets(mock_send_email, mock_email):
+    from p3 import stats
+
+    conference = ConferenceFactory()
+    conference_fare = FareFactory(conference=conference, ticket_type='conference')
+    partner_fare = FareFactory(conference=conference, ticket_type='partner', code='PP1')
+    social_fare = FareFactory(conference=conference, ticket_type='event', code='VOUPE03')
+    vat = VatFactory()
+    buyer = AssopyUserFactory()
+    complete = CreditCardOrderFactory(user=buyer)
+    complete._complete = True
+    complete.save()
+    bank = CreditCardOrderFactory(user=buyer, payment='bank')
+
+    def ticket(order, fare, name='Joe', ticket_type='standard', **p3):
+        t = TicketFactory(fare=fare, user=buyer.user, name=name, ticket_type=ticket_type, frozen=False)
+        OrderItemFactory(order=order, ticket=t, price=1, vat=vat)
+        if p3:
+            TicketConferenceFactory(ticket=t, **p3)
+        return t
+
+    ticket(complete, conference_fare, assigned_to='a@example.com', days='2019-07-09,2019-07-10',
+           shirt_size='m', diet='omnivorous')
+    ticket(complete, conference_fare, assigned_to='a@example.com', days='2019-07-10',
+           shirt_size='m', diet='vegan')
+    ticket(complete, conference_fare, assigned_to='b@example.com', days='', ticket_type='staff',
+           shirt_size='l', diet='vegan')
+    ticket(complete, conference_fare, assigned_to='f@example.com', days=',',
+           shirt_size='l', diet='vegan')
+    ticket(complete, conference_fare, name='', assigned_to='c@example.com')
+    ticket(complete, conference_fare, assigned_to='')
+    ticket(complete, conference_fare)
+    ticket(bank, conference_fare, assigned_to='d@example.com', days='2019-07-09')
+    ticket(complete, partner_fare)
+    ticket(complete, partner_fare)
+    ticket(complete, social_fare)
+    frozen = ticket(complete, conference_fare, assigned_to='e@example.com')
+    frozen.frozen = True
+    frozen.save()
+    # saving the order items completes the bank order
+    Order.objects.filter(id=bank.id).update(_complete=False)
+
+    def totals(rows):
+        return dict((x['id'], x['total']) for x in rows)
+
+    status = totals(stats.tickets_status(conference))
+    # still counted by the database
+    del status['orphan_tickets'], status['spam_recruiting']
+    assert status == {
+        'ticket_sold': stats._tickets(conference, 'conference').count(),
+        'training_tickets_sold': 0,
+        'tickets_with_unique_email': stats._tickets_with_unique_email(conference).count(),
+        'assigned_tickets': stats._assigned_tickets(conference).count(),
+        'unassigned_tickets': stats._unassigned_tickets(conference).count(),
+        'voupe03_tickets': 1,
+        'multiple_assignments': 1,
+    }
+    assert sorted((x['title'], x['total']) for x in shirt_sizes(conference)) == [
+        ('L (male)', 2), ('M (male)', 2)]
+    assert sum(x['total'] for x in diet_types(conference)) == 4
+    assert [(x['title'], x['total'], x['total_nc']) for x in stats.presence_days(conference)['data']] == [
+        ('2019-07-09', 1, 4),
+        ('2019-07-10', 2, 7),
+        ('x', 2, 0),
+        ('2019-07-09 (no staff)', 1, 3),
+        ('2019-07-10 (no staff)', 2, 6),
+        ('x (no staff)', 1, 0),
+    ]
+    assert totals(stats.pp_tickets(conference))['all'] == 1
+    assert totals(stats.pp_tickets(conference))['PP1'] == 2
@@ -0,0 +1,133 @@
+import json
+import random
+
+from freezegun import freeze_time
+from pytest import fixture, mark
+
+from django.core.urlresolvers import reverse
+
+from assopy.stripe.tests.factories import AssopyUserFactory, OrderItemFactory, VatFactory
+from assopy.tests.factories.order import CreditCardOrderFactory
+from conference.tests.factories.conference import ConferenceFactory
+from conference.tests.factories.fare import FareFactory, TicketFactory
+from p3 import ticket_search
+from p3.models import TicketConference
+from p3.ticket_search import Entry, TicketIndex
+
+
+@fixture(autouse=True)
+def no_indexes():
+    ticket_search.reset()
+    yield
+    ticket_search.reset()
+
+
+def _names(results):
+    return [e.name for _, e in results]
+
+
+def test_search_is_fuzzy():
+    index = TicketIndex([
+        Entry(1, 'Guido van Rossum', 'guido@example.com', 'TRSP', 'conference'),
+        Entry(2, 'Raymond Hettinger', 'raymond@example.com', 'TRTP', 'conference'),
+        Entry(3, 'Guido Rossi', 'grossi@example.com', 'VOUPE03', 'event'),
+        Entry(40, 'Łukasz Langa', 'ambv@example.com', 'TRSP', 'conference'),
+    ])
+
+    assert _names(index.search('guido rosum')) == ['Guido van Rossum', 'Guido Rossi']
+    assert _names(index.search('hetinger')) == ['Raymond Hettinger']
+    assert _names(index.search('lukasz')) == ['Łukasz Langa']
+    assert _names(index.search('AMBV@example'))[0] == 'Łukasz Langa'
+    assert _names(index.search('40')) == ['Łukasz Langa']
+    assert _names(index.search('guido', fare_type='event')) == ['Guido Rossi']
+    assert index.search('  ') == []
+    assert index.search('zzzz') == []
+
+    index.remove(1)
+    index.add(Entry(2, 'Raymond Hettinger', 'rh@example.org', 'TRSP', 'conference'))
+    assert _names(index.search('guido')) == ['Guido Rossi']
+    assert index.search('raymond@example.com')[0][1].email == 'rh@example.org'
+
+
+def test_search_10k_tickets():
+    rnd = random.Random(0)
+    syllables = ['an', 'bo', 'ca', 'de', 'el', 'fi', 'go', 'ha', 'ir', 'jo',
+                 'ka', 'lu', 'ma', 'ne', 'or', 'pi', 'ra', 'si', 'tu', 'vo']
+
+    def word():
+        return ''.join(rnd.choice(syllables) for _ in range(rnd.randint(2, 4))).title()
+
+    entries = []
+    for tid in range(1, 10001):
+        name = '%s %s' % (word(), word())
+        entries.append(Entry(tid, name, '%s@example.com' % name.replace(' ', '.').lower(), 'TRSP', 'conference'))
+    index = TicketIndex(entries)
+
+    # the timings are measured by scripts/benchmark_ticket_search.py
+    for e in rnd.sample(entries, 100):
+        # a typo: a missing letter in the surname
+        surname = e.name.split()[1]
+        ix = rnd.randrange(len(surname))
+        query = '%s %s' % (e.name.split()[0], surname[:ix] + surname[ix + 1:])
+        assert e in [x for _, x in index.search(query)]
+
+
+def _ticket(fare, order, **kwargs):
+    ticket = TicketFactory(fare=fare, user=order.user.user, frozen=False, **kwargs)
+    OrderItemFactory(order=order, ticket=ticket, price=1, vat=VatFactory())
+    return ticket
+
+
+@mark.django_db(transaction=True)
+@freeze_time('2019-05-01')
+def test_index_follows_the_tickets(mocker):
+    mocker.patch('email_template.utils.email')
+    conference = ConferenceFactory()
+    fare = FareFactory(conference=conference.code, ticket_type='conference', code='TRSP')
+    order = CreditCardOrderFactory(user=AssopyUserFactory(user__first_name='Joe', user__last_name='Buyer'))
+    order._complete = True
+    order.save()
+    own = _ticket(fare, order, name='')
+    given = _ticket(fare, order, name='Jane Doe')
+    tc = TicketConference.objects.create(ticket=given, assigned_to='jane@example.com')
+
+    index = ticket_search.ticket_index(conference.code)
+    assert _names(index.search('joe buyer')) == ['Joe Buyer']
+    assert [e.email for _, e in index.search('jane doe')] == ['jane@example.com']
+
+    given.name = 'Mary Major'
+    given.save()
+    tc.assigned_to = 'mary@example.com'
+    tc.save()
+    assert index.search('jane doe') == []
+    assert [e.email for _, e in index.search('mary major')] == ['mary@example.com']
+
+    own.frozen = True
+    own.save()
+    assert index.search('joe buyer') == []
+
+    given.delete()
+    assert index.search('mary') == []
+    assert ticket_search.ticket_index(conference.code) is index
+
+
+@mark.django_db
+def test_ticket_search_view(admin_client):
+    conference = ConferenceFactory()
+    ticket_search.ticket_index(conference.code).add(
+        Entry(7, 'Guido van Rossum', 'guido@example.com', 'TRSP', 'conference'))
+    url = reverse('p3-ticket-search', args=[conference.code])
+
+    response = admin_client.get(url, {'q': 'rossum'})
+    assert response.status_code == 200
+    assert json.loads(response.content.decode('utf-8'))['results'] == [{
+        'tid': 7,
+        'name': 'Guido van Rossum',
+        'email': 'guido@example.com',
+        'fare': 'TRSP',
+        'type': 'conference',
+        'score': 1.5,
+    }]
+    assert admin_client.get(url, {'q': 'rossum', 'type': 'hotel'}).status_code == 400
+    assert admin_client.get(reverse('p3-ticket-search', args=['nope'])).status_code == 404
+    assert admin_client.get(reverse('p3-ticket-search-app', args=[conference.code])).status_code == 200
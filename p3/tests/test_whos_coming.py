@@ -0,0 +1,99 @@
+from pytest import mark
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django_factory_boy import auth as auth_factories
+
+from conference.tests.factories.attendee_profile import AttendeeProfileFactory
+from conference.tests.factories.conference import ConferenceFactory
+from p3 import dataaccess
+from p3.models import ConferenceAttendee
+
+
+def _person(conference, first_name, visibility='p', country='', tags=(), speaker=False):
+    user = auth_factories.UserFactory(first_name=first_name, last_name='Doe')
+    profile = AttendeeProfileFactory(user=user, visibility=visibility)
+    p3p = profile.p3_profile
+    p3p.country = country
+    p3p.save()
+    if tags:
+        p3p.interests.add(*tags)
+    ConferenceAttendee.objects.create(
+        conference=conference.code, user=user, ticket=True, speaker=speaker)
+    return user.id
+
+
+def _all_pages(directory, filters=(), size=2):
+    pages = []
+    after = None
+    while True:
+        page = dataaccess.whos_coming_page(directory, filters, after=after, size=size)
+        if not page:
+            return pages
+        pages.append(page)
+        after = page[-1]
+
+
+@mark.django_db
+def test_directory_is_sorted_by_name_with_facets():
+    conference = ConferenceFactory()
+    dan = _person(conference, 'Dan', country='IT', tags=['python'])
+    ann = _person(conference, 'Ann', visibility='m', tags=['django', 'python'])
+    bob = _person(conference, 'Bob', country='IT', speaker=True)
+    _person(conference, 'Cid', visibility='x')
+    # not partecipating
+    AttendeeProfileFactory(visibility='p')
+
+    directory = dataaccess.whos_coming_directory(conference.code)
+
+    assert [uid for _, _, uid in directory['keys']] == [ann, bob, dan]
+    assert directory['public'] == {bob, dan}
+    assert directory['speakers'] == {bob}
+    assert directory['countries']['IT'][1] == {bob, dan}
+    assert directory['tags'] == {'python': {ann, dan}, 'django': {ann}}
+
+
+@mark.django_db
+def test_pages_follow_the_cursor():
+    conference = ConferenceFactory()
+    names = ['Ann', 'Bob', 'Cid', 'Dan', 'Eve', 'Fay', 'Gus']
+    uids = [_person(conference, n, speaker=n in ('Bob', 'Fay')) for n in names]
+    directory = dataaccess.whos_coming_directory(conference.code)
+
+    assert _all_pages(directory) == [uids[0:2], uids[2:4], uids[4:6], uids[6:]]
+    assert _all_pages(directory, [directory['speakers']]) == [[uids[1], uids[5]]]
+    assert _all_pages(directory, [directory['speakers'], set(uids[2:])]) == [[uids[5]]]
+    assert dataaccess.whos_coming_page(directory, skip=3, size=2) == uids[3:5]
+
+    # the cursor is not in the directory anymore
+    ConferenceAttendee.objects.filter(user=uids[2]).delete()
+    directory = dataaccess.whos_coming_directory(conference.code)
+    assert dataaccess.whos_coming_page(directory, after=uids[2], size=2) == uids[3:5]
+
+
+@mark.django_db
+@override_settings(CACHES=settings.ENABLE_LOCMEM_CACHE)
+def test_directory_follows_the_names():
+    cache.clear()
+    conference = ConferenceFactory()
+    ann = _person(conference, 'Ann')
+    bob = _person(conference, 'Bob')
+
+    def misses():
+        before = dataaccess.whos_coming_directory.stats['misses']
+        directory = dataaccess.whos_coming_directory(conference.code)
+        return dataaccess.whos_coming_directory.stats['misses'] - before, directory
+
+    assert misses()[0] == 1
+    user = User.objects.get(id=ann)
+    user.save(update_fields=['last_login'])
+    user.save()
+    assert misses()[0] == 0
+
+    user.first_name = 'Zoe'
+    user.save()
+    missed, directory = misses()
+    assert missed == 1
+    assert directory['keys'] == [('Bob', 'Doe', bob), ('Zoe', 'Doe', ann)]
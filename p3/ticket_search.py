@@ -0,0 +1,202 @@
+"""
+Fuzzy search over the tickets of a conference, used at the registration
+desk to find the ticket (and so the badge) of an attendee.
+
+The name, email and id of every ticket are split in trigrams and kept in
+an in-process inverted index, built with a single query and updated by
+p3.listeners when a ticket changes; the changes made by other processes
+are picked up when the index becomes older than INDEX_MAX_AGE.
+"""
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict, namedtuple
+
+from conference.models import Ticket
+
+# seconds after which an index is built again from the database
+INDEX_MAX_AGE = 300
+
+# the searchable tickets, see conference_tickets
+FARE_TYPES = ('conference', 'event')
+
+# the smallest fraction of the trigrams of the query that a ticket must
+# have to match
+MIN_SCORE = 0.5
+
+Entry = namedtuple('Entry', 'tid name email fare fare_type')
+
+
+def normalize(text):
+    """
+    Lowercase `text` without accents and with only letters, digits and
+    single spaces.
+    """
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(re.split(r'[\W_]+', text)).strip()
+
+
+def trigrams(text):
+    """
+    The set of the trigrams of the words in `text` (normalized), padded
+    with a space at both ends.
+    """
+    output = set()
+    for word in normalize(text).split():
+        word = ' %s ' % word
+        for ix in range(len(word) - 2):
+            output.add(word[ix:ix + 3])
+    return output
+
+
+def conference_tickets(conference, tids=None):
+    """
+    Returns the searchable tickets of the conference, as Entry: the ones of
+    the complete orders which are not frozen. A ticket without a name is
+    found by the name of the buyer, unless assigned to someone else.
+    """
+    qs = Ticket.objects\
+        .filter(
+            fare__conference=conference,
+            fare__ticket_type__in=FARE_TYPES,
+            orderitem__order___complete=True,
+            frozen=False)
+    if tids is not None:
+        qs = qs.filter(id__in=tids)
+    rows = qs.values_list(
+        'id', 'name', 'fare__code', 'fare__ticket_type',
+        'p3_conference__assigned_to', 'user__first_name', 'user__last_name', 'user__email')
+    output = []
+    for tid, name, fare, fare_type, assigned_to, first_name, last_name, email in rows:
+        name = name.strip()
+        if assigned_to:
+            email = assigned_to
+        elif not name:
+            name = ('%s %s' % (first_name, last_name)).strip()
+        output.append(Entry(tid, name, email, fare, fare_type))
+    return output
+
+
+class TicketIndex(object):
+    """
+    Trigram index of a set of tickets.
+    """
+    def __init__(self, entries=()):
+        self.entries = {}
+        # {tid: normalized text}
+        self.texts = {}
+        self.postings = defaultdict(set)
+        self.built = time.monotonic()
+        self.lock = threading.Lock()
+        for e in entries:
+            self.add(e)
+
+    def add(self, entry):
+        text = normalize('%s %s %s' % (entry.name, entry.email, entry.tid))
+        with self.lock:
+            self._remove(entry.tid)
+            self.entries[entry.tid] = entry
+            self.texts[entry.tid] = text
+            for g in trigrams(text):
+                self.postings[g].add(entry.tid)
+
+    def remove(self, tid):
+        with self.lock:
+            self._remove(tid)
+
+    def _remove(self, tid):
+        try:
+            del self.entries[tid]
+        except KeyError:
+            return
+        for g in trigrams(self.texts.pop(tid)):
+            tids = self.postings[g]
+            tids.discard(tid)
+            if not tids:
+                del self.postings[g]
+
+    def search(self, query, fare_type=None, limit=20):
+        """
+        Returns up to `limit` (score, Entry) pairs matching the query, the
+        best first. The score is the fraction of the trigrams of the query
+        found in the ticket; a ticket id is an exact match.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        grams = trigrams(query)
+        counts = Counter()
+        with self.lock:
+            for g in grams:
+                counts.update(self.postings.get(g, ()))
+            matches = []
+            for tid, count in counts.items():
+                score = count / len(grams)
+                if score < MIN_SCORE:
+                    continue
+                e = self.entries[tid]
+                if fare_type and e.fare_type != fare_type:
+                    continue
+                if query == str(tid):
+                    score = 2.0
+                elif query in self.texts[tid]:
+                    score += 0.5
+                matches.append((score, e))
+        matches.sort(key=lambda x: (-x[0], x[1].name.lower(), x[1].tid))
+        return matches[:limit]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def ticket_index(conference):
+    """
+    The index of the tickets of the conference, built if missing or older
+    than INDEX_MAX_AGE.
+    """
+    index = _indexes.get(conference)
+    if index is None or time.monotonic() - index.built > INDEX_MAX_AGE:
+        with _indexes_lock:
+            index = _indexes.get(conference)
+            if index is None or time.monotonic() - index.built > INDEX_MAX_AGE:
+                index = TicketIndex(conference_tickets(conference))
+                _indexes[conference] = index
+    return index
+
+
+def has_indexes():
+    """
+    Whether this process has built an index.
+    """
+    return bool(_indexes)
+
+
+def refresh_tickets(tids, deleted=False):
+    """
+    Updates the indexes built by this process after a change of the tickets.
+    """
+    if not _indexes:
+        return
+    tids = set(tids)
+    for conference, index in list(_indexes.items()):
+        if deleted:
+            for tid in tids:
+                index.remove(tid)
+            continue
+        entries = conference_tickets(conference, tids)
+        for e in entries:
+            index.add(e)
+        # the tickets not searchable anymore (e.g. frozen)
+        for tid in tids - set(e.tid for e in entries):
+            index.remove(tid)
+
+
+def reset():
+    """
+    Forgets the indexes built by this process.
+    """
+    with _indexes_lock:
+        _indexes.clear()
@@ -29,16 +29,19 @@ urlpatterns = [
     url(r'^live/(?P<track>[\w-]+)/$', p3_views.live_track, name='p3-live-track'),
     url(r'^live/(?P<track>[\w-]+)/video$', p3_views.live_track_video, name='p3-live-track-video'),
     url(r'^live/(?P<track>[\w-]+)/events$', p3_views.live_track_events, name='p3-live-track-events'),
+
+    url(r'^(?P<conference>[\w-]+)/ticket-search/$', p3_views.ticket_search_app, name='p3-ticket-search-app'),
+    url(r'^(?P<conference>[\w-]+)/ticket-search/search$', p3_views.ticket_search, name='p3-ticket-search'),
 ]
 
 
 urlpatterns += [
-    # url(r'^schedule/(?P<conference>[\w-]+).ics$', p3_views.schedule_ics, name='p3-schedule-ics'),
+    url(r'^schedule/(?P<conference>[\w-]+).ics$', p3_views.schedule_ics, name='p3-schedule-ics'),
 
     # url(r'^schedule/(?P<conference>[\w-]+)/my-schedule/$',
     #     p3_views.my_schedule, name='p3-schedule-my-schedule'),
-    # url(r'^schedule/(?P<conference>[\w-]+)/my-schedule.ics$',
-    #     p3_views.schedule_ics, name='p3-schedule-my-schedule-ics', kwargs={'mode': 'my-schedule'}),
+    url(r'^schedule/(?P<conference>[\w-]+)/my-schedule.ics$',
+        p3_views.schedule_ics, name='p3-schedule-my-schedule-ics', kwargs={'mode': 'my-schedule'}),
 
     # url(r'^schedule/(?P<conference>[\w-]+)/list/$',
     #     p3_views.schedule_list, name='p3-schedule-list'),
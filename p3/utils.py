@@ -1,5 +1,4 @@
 
-import datetime
 import os.path
 from collections import defaultdict, OrderedDict
 
@@ -70,23 +69,75 @@ def assign_ticket_to_user(ticket, user=None):
     p3c.save()
 
 
-def conference_ticket_badge(tickets):
-    """See conference.settings.TICKET_BADGE_PREPARE_FUNCTION."""
-    conferences = {}
-    for c in Conference.objects.all():
-        conferences[c.code] = {
-            'obj': c,
-            'days': c.days(),
-        }
-    groups = {}
+def attendee_profiles(tickets):
+    """ Return a dict {ticket id: AttendeeProfile} with the profiles of
+        the attendees of the tickets (the user the ticket is assigned to,
+        or its buyer), loaded with two queries.
+
+        The tickets without a profile are missing from the result.
+    """
+    assigned = {}
+    owners = {}
+    for t in tickets:
+        try:
+            email = t.p3_conference.assigned_to
+        except p3models.TicketConference.DoesNotExist:
+            email = ''
+        if email:
+            assigned[t.id] = email
+        else:
+            owners[t.id] = t.user_id
+    uids = autils.get_user_ids_from_emails(assigned.values())
+    for tid, email in assigned.items():
+        if email in uids:
+            owners[tid] = uids[email]
+    profiles = AttendeeProfile.objects\
+        .select_related('user')\
+        .in_bulk(set(owners.values()))
+    return {
+        tid: profiles[uid]
+        for tid, uid in owners.items()
+        if uid in profiles
+    }
+
+
+BADGE_CHUNK_SIZE = 500
+
+def ticket_badges(tickets, chunk_size=BADGE_CHUNK_SIZE):
+    """ Yield a (conference code, badge) pair for every ticket of the
+        queryset; see conference_ticket_badge.
+
+        The tickets are read from the database `chunk_size` at a time,
+        with the attendee profiles of every chunk loaded in bulk.
+    """
+    # {conference code: {day: day number}}
+    conference_days = {}
+    # the profile link of every badge, reversed once
+    link = settings.DEFAULT_URL_PREFIX + reverse(
+        'conference-profile-link', kwargs={'uuid': '000000'})
+    link_prefix, link_suffix = link.rsplit('000000', 1)
+
     qs = tickets\
             .select_related('fare', 'p3_conference', 'orderitem__order__user__user')
-    for t in qs:
-        if t.fare.conference not in groups:
-            groups[t.fare.conference] = {
-                'name': t.fare.conference,
-                'plugin': os.path.join(settings.OTHER_STUFF, 'badge', t.fare.conference, 'conf.py'),
-                'tickets': [],
+    chunk = []
+    for t in qs.iterator():
+        chunk.append(t)
+        if len(chunk) < chunk_size:
+            continue
+        yield from _ticket_badges(chunk, conference_days, link_prefix, link_suffix)
+        chunk = []
+    if chunk:
+        yield from _ticket_badges(chunk, conference_days, link_prefix, link_suffix)
+
+
+def _ticket_badges(tickets, conference_days, link_prefix, link_suffix):
+    profiles = attendee_profiles(tickets)
+    for t in tickets:
+        code = t.fare.conference
+        if code not in conference_days:
+            conference = Conference.objects.get(code=code)
+            conference_days[code] = {
+                d: ix for ix, d in enumerate(conference.days(), 1)
             }
         try:
             p3c = t.p3_conference
@@ -100,16 +151,14 @@ def conference_ticket_badge(tickets):
         else:
             tagline = p3c.tagline
             experience = p3c.python_experience
-            tdays = [datetime.date(*list(map(int, x.split('-')))) for x in [_f for _f in p3c.days.split(',') if _f]]
-            cdays = conferences[t.fare.conference]['days']
-            days = ','.join(map(str,[cdays.index(x)+1 for x in tdays]))
+            cdays = conference_days[code]
+            days = ','.join(str(cdays[x]) for x in p3models.parse_days(p3c.days))
             badge_image = p3c.badge_image.path if p3c.badge_image else None
-        if p3c and p3c.assigned_to:
-            profile = AttendeeProfile.objects\
-                        .select_related('user')\
-                        .get(user__email=p3c.assigned_to)
-        else:
-            profile = t.user.attendeeprofile
+        try:
+            profile = profiles[t.id]
+        except KeyError:
+            raise AttendeeProfile.DoesNotExist(
+                'No profile for the attendee of ticket %s' % t.id)
         name = t.name.strip()
         if not name:
             if profile.user.first_name or profile.user.last_name:
@@ -118,7 +167,7 @@ def conference_ticket_badge(tickets):
                 name = t.orderitem.order.user.name()
                 if p3c and p3c.assigned_to:
                     name = p3c.assigned_to + ' (%s)' % name
-        groups[t.fare.conference]['tickets'].append({
+        yield code, {
             'name': name,
             'tagline': tagline,
             'days': days,
@@ -129,9 +178,21 @@ def conference_ticket_badge(tickets):
             'experience': experience,
             'badge_image': badge_image,
             'staff': t.ticket_type == 'staff',
-            'profile-link': settings.DEFAULT_URL_PREFIX + reverse(
-                'conference-profile-link', kwargs={'uuid': profile.uuid}),
-        })
+            'profile-link': link_prefix + profile.uuid + link_suffix,
+        }
+
+
+def conference_ticket_badge(tickets):
+    """See conference.settings.TICKET_BADGE_PREPARE_FUNCTION."""
+    groups = OrderedDict()
+    for code, badge in ticket_badges(tickets):
+        if code not in groups:
+            groups[code] = {
+                'name': code,
+                'plugin': os.path.join(settings.OTHER_STUFF, 'badge', code, 'conf.py'),
+                'tickets': [],
+            }
+        groups[code]['tickets'].append(badge)
     return list(groups.values())
 
 
@@ -169,69 +230,33 @@ def invalidate_template_cache(fragment_name, *variables):
     return
 
 def conference2ical(conf, user=None, abstract=False):
-    from conference import dataaccess
-    from conference import models as cmodels
+    """
+    Returns the iCal of the conference, or of the events starred by `user`,
+    as the calendar (without events) and the list of its events, as returned
+    by dataaccess.event_ical; see conference.ical.stream.
+    """
+    from conference import ical
+    from p3 import dataaccess
     from datetime import timedelta
 
     curr = cmodels.Conference.objects.current()
-    hotel = None
-
-    def altf(data, component):
-        if component == 'calendar':
-            if user is None:
-                url = reverse('schedule:schedule')
-            else:
-                url = reverse('p3-schedule-my-schedule', kwargs={'conference': conf})
-            data['uid'] = settings.DEFAULT_URL_PREFIX + url
-            if curr.code == conf:
-                data['ttl'] = timedelta(seconds=3600)
-            else:
-                data['ttl'] = timedelta(days=365)
-        elif component == 'event':
-            eid = data['uid']
-            data['uid'] = settings.DEFAULT_URL_PREFIX + '/p3/event/' + str(data['uid'])
-            data['organizer'] = ('mailto:info@europython.eu', {'CN': 'EuroPython'})
-            if hotel:
-                data['coordinates'] = [hotel.lat, hotel.lng]
-            if not isinstance(data['summary'], tuple):
-                # this is a custom event, if it starts with an anchor I can
-                # extract the reference
-                import re
-                m = re.match(r'<a href="(.*)">(.*)</a>', data['summary'])
-                if m:
-                    url = m.group(1)
-                    if url.startswith('/'):
-                        url = settings.DEFAULT_URL_PREFIX + url
-                    data['summary'] = (m.group(2), {'ALTREP': url})
-            if abstract:
-                e = dataaccess.event_data(eid)
-                if e['talk']:
-                    speakers = [s['name'] for s in e['talk']['speakers'] ]
-                    speakers = ", ".join(speakers)
-                    data['summary'] = (data['summary'][0] + ' by ' + speakers, data['summary'][1])
-                ab = e['talk']['abstract'] if e['talk'] else e['abstract']
-                data['description'] = ab
-        return data
     if user is None:
-        from conference.utils import conference2ical as f
-        cal = f(conf, altf=altf)
+        url = reverse('schedule:schedule')
+    else:
+        url = reverse('p3-schedule-my-schedule-ics', kwargs={'conference': conf})
+    if curr.code == conf:
+        ttl = timedelta(seconds=3600)
     else:
-        from conference.utils import TimeTable2
-        from conference.utils import timetables2ical as f
-
-        qs = cmodels.Event.objects\
-            .filter(eventinterest__user=user, eventinterest__interest__gt=0)\
-            .filter(schedule__conference=conf)\
-            .values('id', 'schedule')
-
-        events = defaultdict(list)
-        for x in qs:
-            events[x['schedule']].append(x['id'])
-
-        sids = sorted(events.keys())
-        timetables = [ TimeTable2.fromEvents(x, events[x]) for x in sids ]
-        cal = f(timetables, altf=altf)
-    return cal
+        ttl = timedelta(days=365)
+    cal = ical.Calendar(uid=settings.DEFAULT_URL_PREFIX + url, events=[], ttl=ttl)
+
+    events = cmodels.Event.objects.filter(schedule__conference=conf)
+    if user is not None:
+        events = events.filter(eventinterest__user=user, eventinterest__interest__gt=0)
+    eids = events\
+        .order_by('schedule__date', 'start_time', 'id')\
+        .values_list('id', flat=True)
+    return cal, dataaccess.events_ical(eids, abstract=abstract)
 
 
 # Database access helpers
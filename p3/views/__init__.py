@@ -7,7 +7,6 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.urlresolvers import reverse
 from django.db import transaction
-from django.db.models import Count
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template import RequestContext, Template
 
@@ -280,15 +279,16 @@ def whos_coming(request, conference=None):
         if any(tid for tid, _, _, complete in t if complete):
             access = ('m', 'p')
 
-    countries = [('', 'All')] + list(amodels.Country.objects\
-        .filter(iso__in=models.P3Profile.objects\
-            .filter(profile__visibility__in=access)\
-            .exclude(country='')\
-            .values('country')
-        )\
-        .values_list('iso', 'name')\
-        .distinct()
-    )
+    directory = dataaccess.whos_coming_directory(conference)
+    public_only = 'm' not in access
+
+    countries = [('', 'All')] + sorted(
+        [
+            (iso, name)
+            for iso, (name, uids) in directory['countries'].items()
+            if not public_only or uids & directory['public']
+        ],
+        key=lambda x: x[1])
 
     class FormWhosFilter(forms.Form):
         country = forms.ChoiceField(choices=countries, required=False)
@@ -298,48 +298,37 @@ def whos_coming(request, conference=None):
             widget=cforms.ReadonlyTagWidget(),
         )
 
-    qs = cmodels.AttendeeProfile.objects\
-        .filter(visibility__in=('m', 'p'))\
-        .filter(user__in=dataaccess.conference_users(conference))\
-        .values('visibility')\
-        .annotate(total=Count('visibility'))
     profiles = {
-        'all': sum([ row['total'] for row in qs ]),
-        'visible': 0,
+        'all': len(directory['keys']),
+        'visible': len(directory['public']) if public_only else len(directory['keys']),
     }
-    for row in qs:
-        if row['visibility'] in access:
-            profiles['visible'] += row['total']
-
-    people = cmodels.AttendeeProfile.objects\
-        .filter(visibility__in=access)\
-        .filter(user__in=dataaccess.conference_users(conference))\
-        .values_list('user', flat=True)\
-        .order_by('user__first_name', 'user__last_name')
 
+    filters = []
+    if public_only:
+        filters.append(directory['public'])
     form = FormWhosFilter(data=request.GET)
     if form.is_valid():
         data = form.cleaned_data
         if data.get('country'):
-            people = people.filter(p3_profile__country=data['country'])
+            filters.append(directory['countries'][data['country']][1])
         if data.get('tags'):
-            qs = cmodels.ConferenceTaggedItem.objects\
-                .filter(
-                    content_type__app_label='p3', content_type__model='p3profile',
-                    tag__name__in=data['tags'])\
-                .values('object_id')
-            people = people.filter(user__in=qs)
+            filters.append(set().union(*[
+                directory['tags'].get(t, ()) for t in data['tags']]))
         if data.get('speaker'):
-            speakers = cmodels.TalkSpeaker.objects\
-                .filter(talk__conference=conference, talk__status='accepted')\
-                .values('speaker')
-            people = people.filter(user__speaker__in=speakers)
+            filters.append(directory['speakers'])
 
+    # the next page starts after the last person shown, `counter` (the
+    # number of people shown) is still accepted from old pages
+    try:
+        after = int(request.GET['after'])
+    except (KeyError, ValueError):
+        after = None
     try:
-        ix = max(int(request.GET.get('counter', 0)), 0)
-    except:
-        ix = 0
-    pids = people[ix:ix+10]
+        skip = max(int(request.GET.get('counter', 0)), 0)
+    except ValueError:
+        skip = 0
+    pids = dataaccess.whos_coming_page(
+        directory, filters, after=after, skip=skip if after is None else 0)
     ctx = {
         'profiles': profiles,
         'pids': pids,
@@ -356,3 +345,5 @@ def whos_coming(request, conference=None):
 from p3.views.cart import *
 from p3.views.live import *
 from p3.views.profile import *
+from p3.views.schedule import *
+from p3.views.ticket_search import *
@@ -3,14 +3,17 @@ import datetime
 
 from django import http
 from django.conf import settings
-from django.core.urlresolvers import reverse
 from django.shortcuts import render
+from django.utils.cache import patch_cache_control
 
 from common.decorators import render_to_json
+from common.jsonify import json_dumps
 from conference import models as cmodels
-from conference.utils import TimeTable2
 from p3 import dataaccess
 
+# the longest time (seconds) the browser can keep the live data
+LIVE_MAX_AGE = 60
+
 
 def _live_conference():
     conf = cmodels.Conference.objects.current()
@@ -52,101 +55,69 @@ def live_track_video(request, track):
         allowed_schemes = ['http', 'https', 'rtsp', 'rtmp']
     return R(url)
 
+def _live_response(data, max_age):
+    """
+    The `data` as JSON; the response depends on the address of the client
+    (see P3_LIVE_EMBED), only the browser can keep it.
+    """
+    response = http.HttpResponse(json_dumps(data), content_type='application/json')
+    patch_cache_control(response, private=True, max_age=max(int(max_age), 1))
+    return response
+
 @render_to_json
 def live_track_events(request, track):
-    # FIXME: We don't handle the case where the track does not exist
     conf, date = _live_conference()
 
-    tid = cmodels.Track.objects\
-        .get(track=track, schedule__date=date).id
-    tt = TimeTable2.fromTracks([tid])
-    output = []
-    for _, events in tt.iterOnTracks():
-        for e in events:
-            if e.get('talk'):
-                speakers = ', '.join([ x['name'] for x in e['talk']['speakers']])
-            else:
-                speakers = None
-            output.append({
-                'name': e['name'],
-                'time': e['time'],
-                'duration': e['duration'],
-                'tags': e['tags'],
-                'speakers': speakers,
-            })
-    return output
+    timeline = dataaccess.live_timeline(conf.code, date)
+    if timeline is None or track not in timeline['tracks']:
+        return http.HttpResponseNotFound()
+    return _live_response(timeline['tracks'][track], LIVE_MAX_AGE)
 
 @render_to_json
 def live_events(request):
     conf, date = _live_conference()
-    sid = cmodels.Schedule.objects\
-        .values('id')\
-        .get(conference=conf.code, date=date)
-
-    tt = TimeTable2.fromSchedule(sid['id'])
-    tt.removeEventsByTag('special')
-    t0 = datetime.datetime.now().time()
-
-    tracks = list(settings.P3_LIVE_TRACKS.keys())
-    events = {}
-    for track, tevts in tt.iterOnTracks(start=('current', t0)):
-        curr = None
-        try:
-            curr = dict(tevts[0])
-            curr['next'] = dict(tevts[1])
-        except IndexError:
-            pass
-        # I've deleted all special events, t0 could be on one of them
-        if curr and (curr['time'] + datetime.timedelta(seconds=curr['duration']*60)).time() < t0:
-            curr = None
-
-        if track not in tracks:
-            continue
-        events[track] = curr
-
-    def event_url(event):
-        if event.get('talk'):
-            return reverse('conference-talk', kwargs={'slug': event['talk']['slug']})
-        else:
-            return None
-
+    timeline = dataaccess.live_timeline(conf.code, date)
+    if timeline is None:
+        return http.HttpResponseNotFound()
+    now = datetime.datetime.now()
+    t0 = now.time()
+
+    # the response is good until the first event starts or ends
+    max_age = LIVE_MAX_AGE
     output = {}
-    for track, event in events.items():
+    for track, (event, next) in dataaccess.live_now(timeline, t0).items():
+        if track not in settings.P3_LIVE_TRACKS:
+            continue
         if event is None:
+            if next is not None:
+                max_age = min(max_age, (next['start'] - now).total_seconds())
             output[track] = {
                 'id': None,
                 'embed': settings.P3_LIVE_EMBED(request, track=track),
             }
             continue
-        url = event_url(event)
-        if event.get('talk'):
+        change = event['start'] if event['start'] > now else event['end']
+        max_age = min(max_age, (change - now).total_seconds())
+        if event['speakers'] is not None:
             speakers = [
-                (
-                    reverse('conference-speaker', kwargs={'slug': s['slug']}),
-                    s['name'],
-                    dataaccess.profile_data(s['id'])['image']
-                )
-                for s in event['talk']['speakers']
+                (url, name, dataaccess.profile_data(sid)['image'])
+                for url, name, sid in event['speakers']
             ]
         else:
             speakers = None
-        if event.get('next'):
-            next = {
-                'name': event['next']['name'],
-                'url': event_url(event['next']),
-                'time': event['next']['time'],
-            }
-        else:
-            next = None
         output[track] = {
             'id': event['id'],
             'name': event['name'],
-            'url': url,
+            'url': event['url'],
             'speakers': speakers,
-            'start': event['time'],
-            'end': event['time'] + datetime.timedelta(seconds=event['duration'] * 60),
-            'tags': event['talk']['tags'] if event.get('talk') else [],
-            'embed': settings.P3_LIVE_EMBED(request, event=event),
-            'next': next,
+            'start': event['start'],
+            'end': event['end'],
+            'tags': event['tags'],
+            'embed': settings.P3_LIVE_EMBED(request, event=event['event']),
+            'next': {
+                'name': next['name'],
+                'url': next['url'],
+                'time': next['start'],
+            } if next else None,
         }
-    return output
+    return _live_response(output, max_age)
@@ -0,0 +1,41 @@
+import hashlib
+
+from django import http
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+from conference import ical
+from conference import models as cmodels
+from p3 import utils as p3utils
+
+
+def schedule_ics(request, conference, mode='conference'):
+    """
+    The schedule of the conference (or the events starred by the user) as
+    iCal; calendar clients poll it, so the response is conditional and
+    streamed. Only the ETag is sent: a Last-Modified taken from the events
+    would not move when an event is removed or unstarred.
+    """
+    if not cmodels.Conference.objects.filter(code=conference).exists():
+        raise http.Http404()
+    if mode == 'my-schedule':
+        if not request.user.is_authenticated:
+            raise http.Http404()
+        user = request.user
+    else:
+        user = None
+    cal, events = p3utils.conference2ical(
+        conference, user=user, abstract='abstract' in request.GET)
+
+    etag = hashlib.md5(ical.serialize(cal))
+    for e in events:
+        etag.update(e['vevent'])
+    etag = etag.hexdigest()
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = http.StreamingHttpResponse(
+            ical.stream(cal, (e['vevent'] for e in events)),
+            content_type='text/calendar; charset=utf-8')
+    response['ETag'] = quote_etag(etag)
+    return response
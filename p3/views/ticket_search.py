@@ -0,0 +1,52 @@
+from django import http
+from django.contrib.admin.views.decorators import staff_member_required
+from django.shortcuts import render
+
+from common.decorators import render_to_json
+from conference import models as cmodels
+from p3 import ticket_search as search
+
+# the most results returned by a search
+SEARCH_MAX_RESULTS = 100
+
+
+@staff_member_required
+def ticket_search_app(request, conference):
+    """
+    The page used at the registration desk to find the tickets.
+    """
+    if not cmodels.Conference.objects.filter(code=conference).exists():
+        raise http.Http404()
+    return render(request, 'p3/ticket_search.html', {'conference': conference})
+
+
+@staff_member_required
+@render_to_json
+def ticket_search(request, conference):
+    """
+    Fuzzy search of the tickets of the conference by attendee name, email or
+    ticket id; see p3.ticket_search.
+    """
+    if not cmodels.Conference.objects.filter(code=conference).exists():
+        return http.HttpResponseNotFound()
+    fare_type = request.GET.get('type') or None
+    if fare_type is not None and fare_type not in search.FARE_TYPES:
+        return http.HttpResponseBadRequest()
+    try:
+        limit = min(int(request.GET.get('limit', 20)), SEARCH_MAX_RESULTS)
+    except ValueError:
+        return http.HttpResponseBadRequest()
+    query = request.GET.get('q', '')
+
+    results = search.ticket_index(conference).search(query, fare_type=fare_type, limit=limit)
+    return {
+        'query': query,
+        'results': [{
+            'tid': e.tid,
+            'name': e.name,
+            'email': e.email,
+            'fare': e.fare,
+            'type': e.fare_type,
+            'score': round(score, 3),
+        } for score, e in results],
+    }
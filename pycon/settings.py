@@ -513,9 +513,6 @@ CONFERENCE_FORMS = {
 }
 
 CONFERENCE_TALKS_RANKING_FILE = SITE_DATA_ROOT + '/rankings.txt'
-CONFERENCE_ADMIN_TICKETS_STATS_EMAIL_LOG = (
-    SITE_DATA_ROOT + "/admin_ticket_emails.txt"
-)
 CONFERENCE_ADMIN_TICKETS_STATS_EMAIL_LOAD_LIBRARY = ['p3', 'conference']
 
 # Conference sub-communities
@@ -1,3 +1,5 @@
+import tempfile
+
 from .dev_settings import *  # NOQA
 
 DATABASES = {
@@ -6,3 +8,7 @@ DATABASES = {
         'NAME': ':memory:',
     }
 }
+
+# the invoices rendered by the tests must not end up in the checkout
+CONFERENCE_INVOICE_PDF_DIR = tempfile.mkdtemp(prefix='epcon-invoices-')
+CONFERENCE_INVOICE_PDF_WORKERS = 0
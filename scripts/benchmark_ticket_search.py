@@ -0,0 +1,59 @@
+""" Benchmark of the ticket search index (p3.ticket_search).
+
+    Usage: ./manage.py shell < scripts/benchmark_ticket_search.py
+
+    Indexes 10k synthetic tickets and searches 1000 of them with a typo,
+    printing the time taken to build the index and the median and max
+    time of a search; nothing is read from or written to the database.
+
+"""
+import random
+import time
+
+from p3.ticket_search import Entry, TicketIndex
+
+TICKETS = 10000
+QUERIES = 1000
+
+SYLLABLES = ['an', 'bo', 'ca', 'de', 'el', 'fi', 'go', 'ha', 'ir', 'jo',
+             'ka', 'lu', 'ma', 'ne', 'or', 'pi', 'ra', 'si', 'tu', 'vo']
+
+
+def synthetic_entries(rnd, count):
+    def word():
+        return ''.join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4))).title()
+
+    entries = []
+    for tid in range(1, count + 1):
+        name = '%s %s' % (word(), word())
+        email = '%s@example.com' % name.replace(' ', '.').lower()
+        entries.append(Entry(tid, name, email, 'TRSP', 'conference'))
+    return entries
+
+
+def benchmark(seed=0):
+    rnd = random.Random(seed)
+    entries = synthetic_entries(rnd, TICKETS)
+    start = time.perf_counter()
+    index = TicketIndex(entries)
+    build = time.perf_counter() - start
+
+    timings = []
+    missed = 0
+    for e in rnd.sample(entries, QUERIES):
+        # a typo: a missing letter in the surname
+        first, surname = e.name.split()
+        ix = rnd.randrange(len(surname))
+        query = '%s %s' % (first, surname[:ix] + surname[ix + 1:])
+        start = time.perf_counter()
+        results = index.search(query)
+        timings.append(time.perf_counter() - start)
+        if e not in [x for _, x in results]:
+            missed += 1
+    timings.sort()
+    print('%d tickets, build: %.0fms' % (TICKETS, build * 1000))
+    print('%d searches, median: %.2fms, max: %.2fms, missed: %d' % (
+        QUERIES, timings[len(timings) // 2] * 1000, timings[-1] * 1000, missed))
+
+
+benchmark()
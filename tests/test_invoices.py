@@ -7,6 +7,7 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 import random
 import json
+import os
 
 from django.http import QueryDict
 from pytest import mark
@@ -30,6 +31,9 @@ from conference.invoicing import (
     EPS_18,
     VAT_NOT_AVAILABLE_PLACEHOLDER,
     CSV_2018_REPORT_COLUMNS,
+    invoice_pdf_path,
+    render_invoice_pdf,
+    render_invoice_pdfs,
 )
 from conference.currencies import (
     DAILY_ECB_URL,
@@ -112,6 +116,47 @@ def test_invoice_pdf(client):
     assert response["Content-type"] == "application/pdf"
 
 
+@mark.django_db
+def test_invoice_pdf_streams_the_stored_file(client, mocker, tmpdir):
+    mocker.patch.object(conference_settings, "INVOICE_PDF_DIR", str(tmpdir))
+    html_to_pdf = mocker.patch("common.http.html_to_pdf")
+    invoice_code, order_code = "I123", "asdf"
+    invoice = _prepare_invoice_for_basic_test(order_code, invoice_code)
+    path = invoice_pdf_path(invoice.html)
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(b"stored pdf")
+
+    client.login(email="joedoe@example.com", password="password123")
+    invoice_url = reverse(
+        "assopy-invoice-pdf",
+        kwargs={"order_code": order_code, "code": invoice_code},
+    )
+
+    response = client.get(invoice_url)
+    assert response.status_code == 200
+    assert response["Content-type"] == "application/pdf"
+    assert b"".join(response.streaming_content) == b"stored pdf"
+    assert not html_to_pdf.called
+
+
+def test_invoice_pdfs_are_stored_by_content(mocker, tmpdir):
+    mocker.patch.object(conference_settings, "INVOICE_PDF_DIR", str(tmpdir))
+    html_to_pdf = mocker.patch("common.http.html_to_pdf", return_value=b"pdf")
+
+    path = render_invoice_pdf("<html>1</html>")
+    assert render_invoice_pdf("<html>1</html>") == path
+    assert render_invoice_pdf("<html>2</html>") != path
+    with open(path, "rb") as f:
+        assert f.read() == b"pdf"
+    assert html_to_pdf.call_count == 2
+
+    htmls = ["<html>1</html>", "<html>3</html>", "<html>3</html>"]
+    assert render_invoice_pdfs(htmls, workers=1) == 1
+    assert render_invoice_pdfs(htmls, workers=1) == 0
+    assert html_to_pdf.call_count == 3
+
+
 @mark.django_db
 def test_592_dont_display_invoices_for_years_before_2018(client):
     """